@@ -108,6 +108,14 @@ def _get_args():
     parser_proc.add_argument('-migrate',
                              type=str,
                              help='Migrate with the indicated routine.')
+    parser_proc.add_argument('-stream',
+                             action='store_true',
+                             help='Fuse the steps that act on each trace separately, \
+                                     and run them on blocks of traces as they are read')
+    parser_proc.add_argument('-chunksize',
+                             type=int,
+                             default=None,
+                             help='Number of traces per block when streaming')
     parser_proc.add_argument('fn',
                              type=str,
                              nargs='+',
@@ -18,7 +18,8 @@ import os.path
 import argparse
 
 from impdar.lib.load import load, FILETYPE_OPTIONS
-from impdar.lib.process import concat
+from impdar.lib.process import concat, STREAM_LOAD_KWARGS
+from impdar.lib.pipeline import Pipeline
 from impdar.lib.gpslib import interp as interpdeep
 
 
@@ -95,7 +96,12 @@ def _get_args():
     parser_rgain.add_argument('-slope',
                               type=float,
                               default=0.1,
-                              help='Slope of linear range gain. Default 0.1')
+                              help='Slope of linear range gain (rate for exp, exponent for power). Default 0.1')
+    parser_rgain.add_argument('-gain_type',
+                              type=str,
+                              default='linear',
+                              choices=['linear', 'exp', 'power'],
+                              help='Shape of the gain with travel time. Default linear')
     _add_def_args(parser_rgain)
 
     # Automatic range gain
@@ -108,6 +114,14 @@ def _get_args():
                             type=int,
                             default=50,
                             help='Number of samples to average')
+    parser_agc.add_argument('--per_trace',
+                            action='store_true',
+                            help='Find the gain for each trace rather than for the whole profile')
+    parser_agc.add_argument('--envelope',
+                            type=str,
+                            default='max',
+                            choices=['max', 'rms'],
+                            help='Scale by the max or rms amplitude in the window')
     _add_def_args(parser_agc)
 
     # Vertical bandpass
@@ -122,6 +136,10 @@ def _get_args():
     parser_vbp.add_argument('high_MHz',
                             type=float,
                             help='Highest frequency passed (in MHz)')
+    parser_vbp.add_argument('--n_threads',
+                            type=int,
+                            default=1,
+                            help='Number of threads to filter with')
     _add_def_args(parser_vbp)
 
     # Horizontal bandpass
@@ -296,7 +314,7 @@ def _get_args():
     parser_mig.add_argument('--mtype',
                             type=str,
                             default='phsh',
-                            choices=['stolt', 'kirch', 'phsh', 'tk',
+                            choices=['stolt', 'kirch', 'kirch_table', 'phsh', 'tk',
                                      'sumigtk', 'sustolt', 'sumigffd'],
                             help='Migration routines.')
     parser_mig.add_argument('--vel',
@@ -315,6 +333,26 @@ def _get_args():
                             action='store_true',
                             help='Boolean for nearfield operator in \
                                     Kirchhoff migration.')
+    parser_mig.add_argument('--n_threads',
+                            type=int,
+                            default=1,
+                            help='Number of threads for Kirchhoff or tk migration')
+    parser_mig.add_argument('--aperture',
+                            type=int,
+                            default=None,
+                            help='Maximum offset (traces) for kirch_table migration')
+    parser_mig.add_argument('--max_mem',
+                            type=float,
+                            default=None,
+                            help='Migrate in overlapping tiles, using about this much memory (MB) per tile')
+    parser_mig.add_argument('--overlap',
+                            type=int,
+                            default=None,
+                            help='Number of traces shared by neighboring tiles')
+    parser_mig.add_argument('--n_procs',
+                            type=int,
+                            default=1,
+                            help='Number of processes for migrating tiles')
     parser_mig.add_argument('--htaper',
                             type=int,
                             default=100,
@@ -368,6 +406,14 @@ def _add_def_args(parser):
                         default='mat',
                         help='Type of file to load (default ImpDAR mat)',
                         choices=FILETYPE_OPTIONS)
+    parser.add_argument('--stream',
+                        action='store_true',
+                        help='Run the step on blocks of traces as they are read, \
+                              if it acts on each trace separately')
+    parser.add_argument('--chunksize',
+                        type=int,
+                        default=None,
+                        help='Number of traces per block when streaming')
 
 
 def main():
@@ -377,7 +423,17 @@ def main():
     if not hasattr(args, 'func'):
         parser.parse_args(['-h'])
 
-    radar_data = load(args.ftype, args.fns)
+    pipeline = None
+    if getattr(args, 'stream', False) and args.name not in ['cat', 'interp']:
+        pipeline = Pipeline.from_function(args.func, **{key: val for key, val in vars(args).items()
+                                                         if key != 'func'})
+        if pipeline is None:
+            print('Cannot stream {:s}, processing all at once'.format(args.name))
+    if pipeline is not None:
+        pipeline.chunksize = args.chunksize
+        radar_data = load(args.ftype, args.fns, **STREAM_LOAD_KWARGS.get(args.ftype, {}))
+    else:
+        radar_data = load(args.ftype, args.fns)
 
     if args.name == 'cat':
         radar_data = concat(radar_data)
@@ -385,6 +441,9 @@ def main():
         args.fns = [bn + '.mat']
     elif args.name == 'interp':
         interp(radar_data, **vars(args))
+    elif pipeline is not None:
+        for dat, fn in zip(radar_data, args.fns):
+            pipeline.run(dat, stream=True, tmpdir=os.path.dirname(os.path.abspath(fn)))
     else:
         for dat in radar_data:
             args.func(dat, **vars(args))
@@ -430,9 +489,9 @@ def elev(dat, **kwargs):
     dat.elev_correct()
 
 
-def vbp(dat, low_MHz=1, high_MHz=10000, **kwargs):
+def vbp(dat, low_MHz=1, high_MHz=10000, n_threads=1, **kwargs):
     """Vertically bandpass the data."""
-    dat.vertical_band_pass(low_MHz, high_MHz)
+    dat.vertical_band_pass(low_MHz, high_MHz, n_threads=n_threads)
 
 
 def hbp(dat, low=1, high=10, **kwargs):
@@ -465,14 +524,14 @@ def restack(dat, traces=1, **kwargs):
     dat.restack(traces)
 
 
-def rgain(dat, slope=0.1, **kwargs):
+def rgain(dat, slope=0.1, gain_type='linear', **kwargs):
     """Set range gain."""
-    dat.rangegain(slope)
+    dat.rangegain(slope, gain_type=gain_type)
 
 
-def agc(dat, window=50, scale_factor=50, **kwargs):
+def agc(dat, window=50, scale_factor=50, per_trace=False, envelope='max', **kwargs):
     """Automatically control gain."""
-    dat.agc(window=window, scaling_factor=scale_factor)
+    dat.agc(window=window, scaling_factor=scale_factor, per_trace=per_trace, envelope=envelope)
 
 
 def interp(dats, spacing, gps_fn, offset=0.0, minmove=1.0e-2,
@@ -501,7 +560,8 @@ def denoise(dat, vert_win=1, hor_win=10, noise=None, filter_type='wiener', **kwa
 
 
 def mig(dat, mtype='stolt', vel=1.69e8, vtaper=100, htaper=100, tmig=0,
-        verbose=0, vel_fn=None, nxpad=1, nearfield=False, **kwargs):
+        verbose=0, vel_fn=None, nxpad=1, nearfield=False, n_threads=1, aperture=None,
+        max_mem=None, overlap=None, n_procs=1, **kwargs):
     """Migrate data."""
     dat.migrate(mtype,
                 vel=vel,
@@ -511,7 +571,12 @@ def mig(dat, mtype='stolt', vel=1.69e8, vtaper=100, htaper=100, tmig=0,
                 verbose=verbose,
                 vel_fn=vel_fn,
                 nxpad=nxpad,
-                nearfield=nearfield)
+                nearfield=nearfield,
+                n_threads=n_threads,
+                aperture=aperture,
+                max_mem=max_mem,
+                overlap=overlap,
+                n_procs=n_procs)
 
 
 if __name__ == '__main__':
@@ -341,6 +341,36 @@ class Picks():
             if val is not None:
                 setattr(self, attr, val[:, limits[0]:limits[1]])
 
+    def shift(self, shifts, snum):
+        """Move the picks down by some number of samples.
+
+        Called when the data are shifted vertically (e.g. cropping, elevation correction).
+        Picks shifted outside the data are removed.
+
+        Parameters
+        ----------
+        shifts: int or np.ndarray
+            The shift, in samples, for all traces or for each trace
+        snum: int
+            The number of samples in the shifted data
+        """
+        if self.samp1 is None:
+            return
+        shifts = np.broadcast_to(np.asarray(shifts, dtype=float), (self.samp1.shape[1], ))
+        lost = np.zeros(self.samp1.shape, dtype=bool)
+        for attr in ['samp1', 'samp2', 'samp3']:
+            val = getattr(self, attr)
+            if val is not None:
+                val = val + shifts[None, :]
+                lost = lost | (val < 0) | (val >= snum)
+                setattr(self, attr, val)
+        for attr in ['samp1', 'samp2', 'samp3', 'time', 'power']:
+            val = getattr(self, attr)
+            if val is not None:
+                val = val.astype(float)
+                val[lost] = np.nan
+                setattr(self, attr, val)
+
     def to_struct(self):
         """Convert to a format writable to a .mat file.
 
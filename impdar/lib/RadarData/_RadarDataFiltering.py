@@ -8,9 +8,11 @@
 """
 The class methods for filtering.
 """
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from scipy.signal import filtfilt, butter, tukey, cheby1, bessel, firwin, lfilter, wiener
+from scipy.signal import filtfilt, butter, tukey, cheby1, bessel, firwin, lfilter, wiener, sosfiltfilt
 from .. import migrationlib
+from ..horizontal_filters import kx_filter
 from ..ImpdarError import ImpdarError
 
 
@@ -56,31 +58,34 @@ def adaptivehfilt(self, window_size, *args, **kwargs):
     # taper average trace so it mostly affects only the upper layers in the data
     avg_trace_scale = (np.exp(-self.travel_time.flatten() * 0.05) / np.exp(-self.travel_time[0] * 0.05))
 
-    # preallocate array to fill with processed data
-    ahfilt_data = np.zeros_like(self.data, dtype=self.data.dtype)
-
-    # begin looping through data trace-by-trace
-    for i in range(int(self.tnum)):
-        # build a packet of window_size # of traces around the trace in question
-        if i <= window_size // 2:
-            scpacket = self.data[:, 0:window_size // 2 + i].copy()
-        elif i >= self.tnum - window_size // 2:
-            scpacket = self.data[:, int(self.tnum) - window_size:int(self.tnum)].copy()
-        else:
-            scpacket = self.data[:, i - window_size // 2 + 1:i + window_size // 2].copy()
-
-        # average the packet horizontally and double filter it (allows the
-        # program to maintain small horizontal artifacts that are likely real)
-        avg_trace_scan_low = filtfilt([.25, .25, .25, .25],
-                                      1,
-                                      np.mean(scpacket, axis=-1)
-                                      ).flatten() * avg_trace_scale.flatten()
-
-        # subtract the average trace off the data trace
-        # hfiltdata_scan_low[:, i] = hfiltdata_mass[:, i] - avg_trace_scan_low
-        ahfilt_data[:, i] = self.data[:, i].copy() - avg_trace_scan_low
-
-    self.data = ahfilt_data.astype(self.data.dtype)
+    # build a packet of window_size # of traces around each trace
+    tnum = int(self.tnum)
+    traces = np.arange(tnum)
+    range_start = traces - window_size // 2 + 1
+    range_end = traces + window_size // 2
+    # packets are shifted, not cut off, at the right edge
+    right = traces >= tnum - window_size // 2
+    range_start[right] = tnum - window_size
+    range_end[right] = tnum
+    left = traces <= window_size // 2
+    range_start[left] = 0
+    range_end[left] = window_size // 2 + traces[left]
+    # follow python's slicing rules if the window is wider than the data
+    range_start[range_start < 0] += tnum
+
+    # average the packets horizontally, all at once
+    avg_traces = _window_means(self.data, range_start, range_end)
+
+    # double filter the average traces (allows the
+    # program to maintain small horizontal artifacts that are likely real)
+    avg_traces = filtfilt([.25, .25, .25, .25], 1, avg_traces, axis=0)
+    avg_traces *= avg_trace_scale.flatten()[:, None]
+
+    # subtract the average trace off the data trace
+    if np.issubdtype(self.data.dtype, np.inexact):
+        self.data -= avg_traces.astype(self.data.dtype)
+    else:
+        self.data = (self.data - avg_traces).astype(self.data.dtype)
     print('Adaptive filtering complete')
 
     # set flags structure components
@@ -133,16 +138,21 @@ def horizontalfilt(self, ntr1, ntr2, *args, **kwargs):
     self.flags.hfilt = np.ones((2,))
 
 
-def highpass(self, wavelength):
+def highpass(self, wavelength, method='fft', chunksize=None):
     """High pass in the horizontal for a given wavelength.
 
     This only works if the data have constant trace spacing;
     we check the processing flags to enforce this.
+    This is a 5th-order Butterworth filter, applied with :func:`wavenumber_filter`.
 
     Parameters
     ----------
-    wavelength: int
+    wavelength: float
         The wavelength to pass, in meters.
+    method: str, optional
+        fft or sos. See :func:`wavenumber_filter`. Default fft.
+    chunksize: int, optional
+        Number of samples to filter at once. See :func:`wavenumber_filter`.
 
 
     Original StoDeep Documentation:
@@ -165,60 +175,30 @@ def highpass(self, wavelength):
         Created by L. Smith and modified by
         A. Hagen, 6/15/04. B. Welch, 5/3/06. J. Werner, 6/30/08. J. Olson, 7/10/08
     """
-    if self.flags.interp is None or not self.flags.interp[0]:
-        raise ImpdarError('This method can only be used on constantly spaced data')
-
-    if self.flags.elev:
-        raise ImpdarError('This will not work with elevation corrected data')
-
-    tracespace = self.flags.interp[1]
-
-    # Convert wavelength to meters.
-    wavelength = int(wavelength)
-    # Set an approximate sampling frequency (10ns ~ 10m --> 100MHz).
-    fsamp = 100.
-    # Calculate the number of samples per wavelength.
-    nsamp = int(wavelength / tracespace)
-    if nsamp < 1:
-        raise ValueError('wavelength is too small, causing no samples per wavelength')
-    if nsamp > self.tnum:
-        raise ValueError('wavelength is too large, bigger than the whole radargram')
+    tracespace = _check_horizontal_filtering(self)
+    nsamp = _samples_per_wavelength(self, wavelength, tracespace)
     print('Sample resolution = {:d}'.format(nsamp))
-    # The high corner frequency is the ratio of the sampling frequency (in MHz)
-    # and the number of samples per wavelength (unitless).
-    high_corner_freq = fsamp / float(nsamp)
-    print('High cutoff at {:4.2f} MHz...'.format(high_corner_freq))
-
-    sample_freq = 1. / self.dt
-
-    nyquist_freq = sample_freq / 2.0
-    # Convert High_Corner_Freq to Hz.
-    high_corner_freq = high_corner_freq * 1.0e6
-
-    # Corner_Freq is used in the olaf_butter routine.
-    corner_freq = high_corner_freq / nyquist_freq
-
-    b, a = butter(5, corner_freq, 'high')
-
-    self.data = filtfilt(b, a, self.data)
-
-    # set flags structure components
-    self.flags.hfilt = np.ones((2,))
-    self.flags.hfilt[1] = 3
+    print('High cutoff at a wavelength of {:4.2f} m...'.format(wavelength))
 
+    self.wavenumber_filter([('highpass', wavelength, 5)], method=method, chunksize=chunksize)
     print('Highpass filter complete.')
 
 
-def lowpass(self, wavelength):
+def lowpass(self, wavelength, method='fft', chunksize=None):
     """Low pass in the horizontal for a given wavelength.
 
     This only works if the data have constant trace spacing;
     we check the processing flags to enforce this.
+    This is a 3rd-order Butterworth filter, applied with :func:`wavenumber_filter`.
 
     Parameters
     ----------
-    wavelength: int
+    wavelength: float
         The wavelength to pass, in meters.
+    method: str, optional
+        fft or sos. See :func:`wavenumber_filter`. Default fft.
+    chunksize: int, optional
+        Number of samples to filter at once. See :func:`wavenumber_filter`.
 
 
     Original StoDeep Documentation:
@@ -241,55 +221,21 @@ def lowpass(self, wavelength):
         Created by L. Smith and modified by
         A. Hagen, 6/15/04. B. Welch, 5/3/06. J. Werner, 6/30/08. J. Olson, 7/10/08
     """
-    if self.flags.interp is None or not self.flags.interp[0]:
-        raise ImpdarError('This method can only be used on constantly spaced data')
-
-    if self.flags.elev:
-        raise ImpdarError('This will not work with elevation corrected data')
-
-    tracespace = self.flags.interp[1]
-
-    # Convert wavelength to meters.
-    wavelength = int(wavelength)
-    # Set an approximate sampling frequency (10ns ~ 10m --> 100MHz).
-    fsamp = 100.
-    # Calculate the number of samples per wavelength.
-    nsamp = int(wavelength / tracespace)
-    if nsamp < 1:
-        raise ValueError('wavelength is too small, causing no samples per wavelength')
-    if nsamp > self.tnum:
-        raise ValueError('wavelength is too large, bigger than the whole radargram')
+    tracespace = _check_horizontal_filtering(self)
+    nsamp = _samples_per_wavelength(self, wavelength, tracespace)
     print('Sample resolution = {:d}'.format(nsamp))
-    # The high corner frequency is the ratio of the sampling frequency (in MHz)
-    # and the number of samples per wavelength (unitless).
-    high_corner_freq = fsamp / float(nsamp)
-    print('Low cutoff at {:4.2f} MHz...'.format(high_corner_freq))
-
-    sample_freq = 1. / self.dt
-
-    nyquist_freq = sample_freq / 2.0
-    # Convert High_Corner_Freq to Hz.
-    high_corner_freq = high_corner_freq * 1.0e6
-
-    # Corner_Freq is used in the olaf_butter routine.
-    corner_freq = high_corner_freq / nyquist_freq
-
-    b, a = butter(3, corner_freq, 'low')
-
-    self.data = filtfilt(b, a, self.data)
-
-    # set flags structure components
-    self.flags.hfilt = np.ones((2,))
-    self.flags.hfilt[1] = 3
+    print('Low cutoff at a wavelength of {:4.2f} m...'.format(wavelength))
 
+    self.wavenumber_filter([('lowpass', wavelength, 3)], method=method, chunksize=chunksize)
     print('Lowpass filter complete.')
 
 
-def horizontal_band_pass(self, low, high):
+def horizontal_band_pass(self, low, high, method='fft', chunksize=None):
     """Bandpass in the horizontal for a given pair of wavelengths
 
     This only works if the data have constant trace spacing;
     we check the processing flags to enforce this.
+    This is a 5th-order Butterworth filter, applied with :func:`wavenumber_filter`.
 
     Parameters
     ----------
@@ -297,53 +243,85 @@ def horizontal_band_pass(self, low, high):
         The minimum wavelength to pass, in meters.
     high: float
         The maximum wavelength to pass, in meters.
+    method: str, optional
+        fft or sos. See :func:`wavenumber_filter`. Default fft.
+    chunksize: int, optional
+        Number of samples to filter at once. See :func:`wavenumber_filter`.
 
     """
-    if self.flags.interp is None or not self.flags.interp[0]:
-        raise ImpdarError('This method can only be used on constantly spaced data')
-    if self.flags.elev:
-        raise ImpdarError('This will not work with elevation corrected data')
+    tracespace = _check_horizontal_filtering(self)
     if low >= high:
         raise ValueError('Low must be less than high')
 
-    tracespace = self.flags.interp[1]
-
-    # Convert wavelength to meters.
-    wavelength_high = high
-    wavelength_low = low
-    # Set an approximate sampling frequency (10ns ~ 10m --> 100MHz).
-    fsamp = 100.
     # Calculate the number of samples per wavelength.
-    nsamp_high = int(wavelength_high / tracespace)
-    nsamp_low = int(wavelength_low / tracespace)
-    if nsamp_low < 1:
+    nsamp_high = int(high / tracespace)
+    nsamp_low = int(low / tracespace)
+    if nsamp_low <= 2:
         raise ValueError('Minimum wavelength is too small, causing no samples per wavelength')
     if nsamp_high > self.tnum:
         raise ValueError('Maximum wavelength is too long, causing more samples per wavelength than tnum, use lowpass instead?')
     print('Sample resolution high = {:d}'.format(nsamp_high))
     print('Sample resolution low = {:d}'.format(nsamp_low))
-    # The high corner frequency is the ratio of the sampling frequency (in MHz)
-    # and the number of samples per wavelength (unitless).
-    high_corner_freq = fsamp / float(nsamp_high)
-    low_corner_freq = fsamp / float(nsamp_low)
 
-    nyquist_freq = fsamp / 2.0
-    high_corner_freq = high_corner_freq
-    low_corner_freq = low_corner_freq
+    self.wavenumber_filter([('bandpass', (low, high), 5)], method=method, chunksize=chunksize)
+    print('Bandpass filter complete.')
 
-    corner_freq = np.zeros((2,))
-    corner_freq[0] = low_corner_freq / nyquist_freq
-    corner_freq[1] = high_corner_freq / nyquist_freq
 
-    b, a = butter(5, corner_freq, 'bandpass')
+def wavenumber_filter(self, filters, method='fft', chunksize=None):
+    """Apply any number of zero-phase horizontal filters at once.
+
+    This only works if the data have constant trace spacing;
+    we check the processing flags to enforce this.
+    Filtering is done by :func:`kx_filter <impdar.lib.horizontal_filters.kx_filter>`.
+    With the fft method, the whole stack of filters costs a single transform.
+
+    Parameters
+    ----------
+    filters: list of tuples
+        (btype, wavelength, order) for each Butterworth filter.
+        btype is lowpass, highpass, bandpass, or notch, and wavelength is in meters.
+        For bandpass and notch filters, wavelength is a (min, max) pair.
+    method: str, optional
+        fft to filter in the wavenumber domain, or sos to run each filter with sosfiltfilt. Default fft.
+    chunksize: int, optional
+        Number of samples to filter at once, to limit memory use. Default is about 4 million values.
+    """
+    tracespace = _check_horizontal_filtering(self)
+
+    # Wavelengths to fractions of the Nyquist wavenumber (1 cycle per 2 traces)
+    kx_filters = []
+    for btype, wavelength, order in filters:
+        corner = np.sort(2. * tracespace / np.atleast_1d(np.asarray(wavelength, dtype=float)))
+        if np.any(corner >= 1.) or np.any(corner <= 0.):
+            raise ValueError('Wavelengths must be longer than two traces')
+        kx_filters.append((btype, corner, order))
 
-    self.data = filtfilt(b, a, self.data, axis=1)
+    if not np.issubdtype(self.data.dtype, np.inexact):
+        self.data = self.data.astype(float)
+    kx_filter(self.data, kx_filters, method=method, chunksize=chunksize)
 
     # set flags structure components
     self.flags.hfilt = np.ones((2,))
     self.flags.hfilt[1] = 3
 
-    print('Highpass filter complete.')
+
+def _check_horizontal_filtering(self):
+    """Make sure the data are constantly spaced and not elevation corrected, and get the spacing."""
+    if self.flags.interp is None or not self.flags.interp[0]:
+        raise ImpdarError('This method can only be used on constantly spaced data')
+    if self.flags.elev:
+        raise ImpdarError('This will not work with elevation corrected data')
+    return self.flags.interp[1]
+
+
+def _samples_per_wavelength(self, wavelength, tracespace):
+    """Get the number of traces per wavelength, checking that the filter is possible."""
+    nsamp = int(wavelength / tracespace)
+    if nsamp <= 2:
+        raise ValueError('wavelength is too small, causing no samples per wavelength')
+    if nsamp > self.tnum:
+        raise ValueError('wavelength is too large, bigger than the whole radargram')
+    return nsamp
 
 
 def winavg_hfilt(self, avg_win, taper='full', filtdepth=100):
@@ -411,25 +389,23 @@ def winavg_hfilt(self, avg_win, taper='full', filtdepth=100):
     else:
         raise ValueError('Unrecognized taper. Options are full, pexp, or tukey')
 
-    hfiltdata = np.zeros_like(self.data, dtype=self.data.dtype)
     # set up ranges, create average, taper average, subtract average
-
-    for i in range(int(self.tnum)):
-        range_start = i - ((avg_win - 1) // 2)
-        range_end = i + ((avg_win - 1) // 2)
-
-        # As opposed to StoDeep, don't wrap just cutoff for simplicity
-        if range_start < 0:
-            range_start = 0
-        if range_end > self.tnum:
-            range_end = self.tnum
-        # Create an average trace
-        avg_trace = np.mean(self.data[:, range_start:range_end], axis=-1) * exptaper
-
-        # Subtract avg_trace from each trace
-        hfiltdata[:, i] = self.data[:, i] - avg_trace
-
-    self.data = hfiltdata.copy()
+    traces = np.arange(int(self.tnum))
+    range_start = traces - ((avg_win - 1) // 2)
+    range_end = traces + ((avg_win - 1) // 2)
+
+    # Only samples where the taper is nonzero are changed
+    nonzero = np.flatnonzero(exptaper)
+    depth = nonzero[-1] + 1 if len(nonzero) > 0 else 0
+
+    # As opposed to StoDeep, don't wrap just cutoff for simplicity
+    avg_traces = _window_means(self.data[:depth, :], range_start, range_end)
+    avg_traces *= exptaper[:depth, None]
+
+    # Subtract the average traces from the data
+    hfiltdata = self.data.copy()
+    hfiltdata[:depth, :] = (self.data[:depth, :] - avg_traces).astype(self.data.dtype)
+    self.data = hfiltdata
     self.flags.hfilt = np.zeros((2,))
     self.flags.hfilt[1] = 2
 
@@ -469,6 +445,9 @@ def vertical_band_pass(self,
                        filttype='butter',
                        cheb_rp=5,
                        fir_window='hamming',
+                       sos=None,
+                       chunksize=None,
+                       n_threads=1,
                        *args,
                        **kwargs):
     """Vertically bandpass the data
@@ -498,6 +477,13 @@ def vertical_band_pass(self,
     fir_window: str, optional
         The window type passed to scipy.signal.firwin.
         Only used if filttype=='fir'. Default is hamming'
+    sos: np.ndarray, optional
+        Second-order sections of a previous design to reuse, e.g. flags.bpass[3:] from
+        data filtered the same way. If given, low, high, order, and filttype are only for the record.
+    chunksize: int, optional
+        Number of traces to filter at once, to limit memory use. Default is about 4 million samples.
+    n_threads: int, optional
+        Number of threads to filter chunks of traces with. Default 1.
     """
 
     # first determine the cut-off corner frequencies - expressed as a
@@ -518,17 +504,17 @@ def vertical_band_pass(self,
     # provide feedback to the user
     print('Bandpassing from {:4.1f} to {:4.1f} MHz...'.format(low, high))
 
-    # FIR operates a little differently, and cheb has rp arg,
-    # so we need to do each case separately
-    if filttype.lower() in ['butter', 'butterworth']:
-        b, a = butter(order, corner_freq, 'bandpass')
-        self.data = filtfilt(b, a, self.data, axis=0).astype(self.data.dtype)
-    elif filttype.lower() in ['cheb', 'chebyshev']:
-        b, a = cheby1(order, cheb_rp, corner_freq, 'bandpass')
-        self.data = filtfilt(b, a, self.data, axis=0).astype(self.data.dtype)
-    elif filttype.lower() == 'bessel':
-        b, a = bessel(order, corner_freq, 'bandpass')
-        self.data = filtfilt(b, a, self.data, axis=0).astype(self.data.dtype)
+    # FIR operates a little differently, so we need to do it separately
+    if sos is not None or filttype.lower() in ['butter', 'butterworth', 'cheb', 'chebyshev', 'bessel']:
+        if sos is None:
+            sos = bandpass_sos(order, tuple(corner_freq), filttype.lower(), cheb_rp)
+        sos = np.asarray(sos, dtype=float).reshape((-1, 6))
+        # Single-precision data are filtered in single precision, without upcasting
+        if self.data.dtype in [np.float32, np.complex64]:
+            sos = sos.astype(np.float32)
+        elif not np.issubdtype(self.data.dtype, np.inexact):
+            self.data = self.data.astype(float)
+        _sosfiltfilt_chunks(sos, self.data, chunksize=chunksize, n_threads=n_threads)
     elif filttype.lower() == 'fir':
         taps = firwin(order + 1, corner_freq, pass_zero=False)
         # I'm leaving the data past the filter--this is not filtfilt so we have a delay
@@ -540,9 +526,13 @@ def vertical_band_pass(self,
     print('Bandpass filter complete.')
 
     # set flags structure components
+    self.flags.bpass = np.zeros((3,))
     self.flags.bpass[0] = 1
     self.flags.bpass[1] = low
     self.flags.bpass[2] = high
+    if sos is not None:
+        # Keep the design so it can be reused
+        self.flags.bpass = np.hstack((self.flags.bpass, np.asarray(sos, dtype=float).flatten()))
 
 
 def denoise(self, vert_win=1, hor_win=10, noise=None, ftype='wiener'):
@@ -590,7 +580,13 @@ def migrate(self,
             vel=1.68e8,
             nxpad=10,
             nearfield=False,
-            verbose=0):
+            verbose=0,
+            n_threads=1,
+            quiet=False,
+            aperture=None,
+            max_mem=None,
+            overlap=None,
+            n_procs=1):
     """Migrate the data.
 
     This is a wrapper around all the migration routines in migration_routines.py.
@@ -598,11 +594,44 @@ def migrate(self,
     Parameters
     ----------
     mtype: str, optional
-        The chosen migration routine. Options are: kirch, stolt, phsh.
-        Default: stolt
+        The chosen migration routine. Options are: kirch, kirch_table, stolt, phsh, tk,
+        or a SeisUnix routine (su*). Default: stolt
+    n_threads: int, optional
+        Number of threads for Kirchhoff or tk migration. None uses all cores. Default 1.
+    quiet: bool, optional
+        Suppress the per-trace progress output of Kirchhoff migration. Default False.
+    aperture: int, optional
+        Maximum trace offset summed over in kirch_table migration. Default is all traces.
+    max_mem: float, optional
+        If given, migrate in overlapping tiles of traces so that each migration
+        uses roughly this much memory (MB). Default None (the whole profile at once).
+    overlap: int, optional
+        Number of traces shared by neighboring tiles. Default is the width of a
+        diffraction from the bottom of the profile.
+    n_procs: int, optional
+        Number of processes to migrate tiles in parallel. Default 1.
     """
-    if mtype == 'kirch':
-        migrationlib.migrationKirchhoff(self, vel=vel, nearfield=nearfield)
+    if max_mem is not None:
+        migrationlib.migrationTiled(self,
+                                    max_mem,
+                                    overlap=overlap,
+                                    n_procs=n_procs,
+                                    mtype=mtype,
+                                    vtaper=vtaper,
+                                    htaper=htaper,
+                                    tmig=tmig,
+                                    vel_fn=vel_fn,
+                                    vel=vel,
+                                    nxpad=nxpad,
+                                    nearfield=nearfield,
+                                    verbose=verbose,
+                                    n_threads=n_threads,
+                                    quiet=quiet,
+                                    aperture=aperture)
+    elif mtype == 'kirch':
+        migrationlib.migrationKirchhoff(self, vel=vel, nearfield=nearfield, n_threads=n_threads, quiet=quiet)
+    elif mtype == 'kirch_table':
+        migrationlib.migrationKirchhoffTable(self, vel=vel, nearfield=nearfield, aperture=aperture)
     elif mtype == 'stolt':
         migrationlib.migrationStolt(self, vel=vel, htaper=htaper, vtaper=vtaper)
     elif mtype == 'phsh':
@@ -612,7 +641,8 @@ def migrate(self,
                                              vel=vel,
                                              vel_fn=vel_fn,
                                              htaper=htaper,
-                                             vtaper=vtaper)
+                                             vtaper=vtaper,
+                                             n_threads=n_threads)
     elif mtype[:2] == 'su':
         migrationlib.migrationSeisUnix(self,
                                        mtype=mtype,
@@ -629,3 +659,73 @@ def migrate(self,
     # change migration flag
     mflag = mtype
     self.flags.mig = mflag
+
+
+def _window_means(data, range_start, range_end):
+    """Average data[:, range_start[i]:range_end[i]] for every trace i from a running sum.
+
+    Ranges are clipped to the data, and empty ranges give nan like np.mean.
+    """
+    tnum = data.shape[1]
+    range_start = np.clip(range_start, 0, tnum)
+    range_end = np.clip(range_end, range_start, tnum)
+    cumulative = np.zeros((data.shape[0], tnum + 1), dtype=np.result_type(data.dtype, np.float64))
+    np.cumsum(data, axis=1, out=cumulative[:, 1:])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (cumulative[:, range_end] - cumulative[:, range_start]) / (range_end - range_start)
+
+
+# Filter designs, so a batch of files with the same sampling only designs once
+_SOS_CACHE = {}
+
+
+def bandpass_sos(order, corner_freq, filttype='butter', cheb_rp=5):
+    """Design a bandpass filter as second-order sections.
+
+    Designs are cached, so repeated calls with the same arguments are free.
+
+    Parameters
+    ----------
+    order: int
+        Filter order
+    corner_freq: 2-tuple
+        Low and high corners, as fractions of the Nyquist frequency
+    filttype: str, optional
+        butter(worth), cheb(yshev type I), or bessel. Default butter.
+    cheb_rp: float, optional
+        Maximum ripple, in decibels, of Chebyshev filter. Default 5.
+
+    Returns
+    -------
+    sos: np.ndarray
+        n x 6 array of second-order sections
+    """
+    key = (int(order), tuple(float(f) for f in corner_freq), filttype, float(cheb_rp))
+    if key not in _SOS_CACHE:
+        if filttype in ['butter', 'butterworth']:
+            sos = butter(order, corner_freq, 'bandpass', output='sos')
+        elif filttype in ['cheb', 'chebyshev']:
+            sos = cheby1(order, cheb_rp, corner_freq, 'bandpass', output='sos')
+        elif filttype == 'bessel':
+            sos = bessel(order, corner_freq, 'bandpass', output='sos')
+        else:
+            raise ValueError('Filter type {:s} is not recognized'.format(filttype))
+        _SOS_CACHE[key] = sos
+    return _SOS_CACHE[key].copy()
+
+
+def _sosfiltfilt_chunks(sos, data, chunksize=None, n_threads=1):
+    """Forward-backward filter each trace of data in place, a chunk of traces at a time."""
+    if chunksize is None:
+        chunksize = max(1, 2 ** 22 // max(data.shape[0], 1))
+    starts = range(0, data.shape[1], chunksize)
+
+    def filter_chunk(start):
+        data[:, start:start + chunksize] = sosfiltfilt(sos, data[:, start:start + chunksize], axis=0)
+
+    if n_threads is not None and n_threads > 1:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            list(executor.map(filter_chunk, starts))
+    else:
+        for start in starts:
+            filter_chunk(start)
@@ -10,11 +10,14 @@
 Define processing steps for Radar Data. These are all instance methods.
 """
 
+from bisect import bisect_left
 import numpy as np
 from scipy.interpolate import interp1d
-from scipy.optimize import minimize
+from scipy.ndimage import maximum_filter1d
 from ..permittivity_models import firn_permittivity
 from ..ImpdarError import ImpdarError
+from ..streaming import Restacker, RESTACK_VARS
+from ..shifts import ragged_shift
 
 def reverse(self):
     """Reverse radar data
@@ -129,23 +132,17 @@ def nmo(self, ant_sep, uice=1.69e8, uair=3.0e8, const_firn_offset=None, rho_prof
 
     # --- Do the move-out correction --- #
 
-    # empty array to fill with new times
-    nmotime = np.zeros((len(self.travel_time)))
-
-    for i,t in enumerate(self.travel_time):
-        if rho_profile is None:
-            u_rms = uice
-        else:
-            # get RMS velocity used for correction
-            d = minimize(optimize_moveout_depth,.5*t*uice,args=(t,ant_sep,d_interp,u_interp),
-                         tol=1e-8,bounds=((0,0.5*t*uair),))['x'][0]
-            u_rms = np.sqrt(np.mean(u_interp[d_interp<d]**2.))
-        # get the upper leg of the trave_path triangle (direct arrival) from the antenna separation and the rms velocity
-        tsep_ice = 1e6*(ant_sep / u_rms)
-        # hypotenuese, adjust to 'transmit time' by adding the separation time
-        thyp = t+tsep_ice
-        # calculate the vertical two-way travel time
-        nmotime[i] = np.sqrt((thyp)**2. - tsep_ice**2.)
+    if rho_profile is None:
+        u_rms = uice
+    else:
+        # get RMS velocity used for correction, for all samples at once
+        u_rms = moveout_rms_velocity(self.travel_time, ant_sep, d_interp, u_interp)
+    # get the upper leg of the trave_path triangle (direct arrival) from the antenna separation and the rms velocity
+    tsep_ice = 1e6 * (ant_sep / u_rms)
+    # hypotenuese, adjust to 'transmit time' by adding the separation time
+    thyp = self.travel_time + tsep_ice
+    # calculate the vertical two-way travel time
+    nmotime = np.sqrt((thyp)**2. - tsep_ice**2.)
 
     # --- Cleanup --- #
 
@@ -171,6 +168,60 @@ def nmo(self, ant_sep, uice=1.69e8, uair=3.0e8, const_firn_offset=None, rho_prof
         self.flags.nmo[1] = ant_sep
 
 
+# Cache of rms velocities so that a batch of files with the same setup only solves once
+_MOVEOUT_CACHE = {}
+_MOVEOUT_CACHE_SIZE = 32
+
+
+def moveout_rms_velocity(travel_time, ant_sep, profile_depth, profile_u):
+    """Solve the moveout equation for the rms velocity at every sample at once.
+
+    The rms velocity down to each depth in the profile, and the two-way travel time
+    to that depth along the moveout path, are tabulated once. The depth reached at
+    each travel time is then looked up in that table, rather than optimizing each
+    sample separately. Results are cached on the inputs, so processing many files
+    with the same antenna separation, profile, and sampling reuses the solution.
+
+    Parameters
+    ----------
+    travel_time: array
+        two-way travel times (microseconds)
+    ant_sep: float
+        antennae separation
+    profile_depth: array
+        depths corresponding to input velocity profile, increasing
+    profile_u: array
+        velocity
+
+    Returns
+    -------
+    u_rms: array
+        rms velocity for each travel time
+    """
+    travel_time = np.asarray(travel_time, dtype=float)
+    profile_depth = np.asarray(profile_depth, dtype=float)
+    profile_u = np.asarray(profile_u, dtype=float)
+    key = (float(ant_sep), travel_time.tobytes(), profile_depth.tobytes(), profile_u.tobytes())
+    if key in _MOVEOUT_CACHE:
+        return _MOVEOUT_CACHE[key].copy()
+
+    # rms velocity down to each depth in the profile
+    u_rms_table = np.sqrt(np.cumsum(profile_u ** 2.) / np.arange(1, len(profile_u) + 1))
+    # time (s) to reach each depth, i.e. the solution of
+    # d = sqrt((t / 2 * u_rms(d)) ** 2 - ant_sep ** 2) for t
+    t_table = 2. * np.sqrt(profile_depth ** 2. + ant_sep ** 2.) / u_rms_table
+    # Time is monotonic in depth unless velocity drops very sharply; keep the first arrival
+    t_table = np.maximum.accumulate(t_table)
+
+    # Beyond the profile, use the ends
+    u_rms = np.interp(travel_time * 1.0e-6, t_table, u_rms_table)
+
+    if len(_MOVEOUT_CACHE) >= _MOVEOUT_CACHE_SIZE:
+        _MOVEOUT_CACHE.clear()
+    _MOVEOUT_CACHE[key] = u_rms.copy()
+    return u_rms
+
+
 def optimize_moveout_depth(d_in, t, ant_sep, profile_depth, profile_u):
     """Optimize depth in the nmo filter.
 
@@ -220,26 +271,110 @@ def traveltime_to_depth(self, profile_depth, profile_rho, c=3.0e8, permittivity_
     -------
     depth: np.ndarray (self.snum x 1)
     """
+    travel_time = np.asarray(self.travel_time, dtype=float)
+    profile_depth = np.asarray(profile_depth, dtype=float)
+    profile_rho = np.asarray(profile_rho, dtype=float)
+    key = (travel_time.tobytes(), float(self.dt), profile_depth.tobytes(), profile_rho.tobytes(), c,
+           permittivity_model)
+    if key in _DEPTH_CACHE:
+        return _DEPTH_CACHE[key].copy()
+
     # get the input velocity-depth profile
     eps = np.real(permittivity_model(profile_rho))
     profile_u = c / np.sqrt(eps)
-    # iterate over time, moving down according to the velocity at each step
+    nearest = _NearestDepth(profile_depth)
+
+    # move down according to the velocity at each step
     z = 0.
-    depth = self.travel_time / 2. * c / np.sqrt(np.real(permittivity_model(917.))) * 1.0e-6
-    for i, t in enumerate(self.travel_time):
-        if t < 0.:
+    depth = travel_time / 2. * c / np.sqrt(np.real(permittivity_model(917.))) * 1.0e-6
+    # negative times keep the default, times within the first sample use the top velocity,
+    # and all others step by dt at the velocity at the current depth
+    category = np.where(travel_time < 0., 0, np.where(travel_time < self.dt * 1.0e6, 1, 2))
+    run_starts = np.hstack(([0], np.flatnonzero(np.diff(category)) + 1))
+    run_ends = np.hstack((run_starts[1:], [len(travel_time)]))
+    for start, end in zip(run_starts, run_ends):
+        if category[start] == 0:
             continue
-        elif t < self.dt * 1.0e6:
-            step_u = profile_u[0]
-            z += t / 2. * step_u * 1.0e-6
-            depth[i] = z
+        elif category[start] == 1:
+            for i in range(start, end):
+                z += travel_time[i] / 2. * profile_u[0] * 1.0e-6
+                depth[i] = z
         else:
-            step_u = profile_u[np.nanargmin(abs(profile_depth - z))]
-            z += self.dt / 2. * step_u
-            depth[i] = z
+            i = start
+            while i < end:
+                # step at this velocity until the nearest profile depth changes
+                ind = nearest.index(z)
+                step = self.dt / 2. * profile_u[ind]
+                n_steps = min(nearest.steps_in_region(z, step), end - i)
+                if n_steps <= 8:
+                    # fine profile, just take one step
+                    z += step
+                    depth[i] = z
+                    i += 1
+                    continue
+                z_steps = np.cumsum(np.hstack(([z], np.full((n_steps, ), step))))
+                same = nearest.index(z_steps[:-1]) == ind
+                n_steps = np.argmin(same) if not np.all(same) else n_steps
+                depth[i:i + n_steps] = z_steps[1:n_steps + 1]
+                z = z_steps[n_steps]
+                i += n_steps
+
+    if len(_DEPTH_CACHE) >= _DEPTH_CACHE_SIZE:
+        _DEPTH_CACHE.clear()
+    _DEPTH_CACHE[key] = depth.copy()
     return depth
 
 
+# Cache of depth conversions, so a batch of files with the same sampling and density profile only integrates once
+_DEPTH_CACHE = {}
+_DEPTH_CACHE_SIZE = 32
+
+
+class _NearestDepth():
+    """Find the index of the nearest profile depth, like np.nanargmin(abs(profile_depth - z))."""
+
+    def __init__(self, profile_depth):
+        valid = np.flatnonzero(~np.isnan(profile_depth))
+        order = valid[np.argsort(profile_depth[valid], kind='stable')]
+        depths = profile_depth[order]
+        # for repeated depths, nanargmin finds the first
+        keep = np.hstack(([True], np.diff(depths) > 0))
+        self.depths = depths[keep]
+        self.order = order[keep]
+        self.depth_list = self.depths.tolist()
+
+    def _sorted_index(self, z):
+        if np.ndim(z) == 0:
+            right = min(max(bisect_left(self.depth_list, z), 1), len(self.depth_list) - 1)
+            dist_left = abs(self.depth_list[right - 1] - z)
+            dist_right = abs(self.depth_list[right] - z)
+            if dist_left < dist_right or (dist_left == dist_right and self.order[right - 1] < self.order[right]):
+                return right - 1
+            return right
+        right = np.clip(np.searchsorted(self.depths, z), 1, len(self.depths) - 1)
+        left = right - 1
+        dist_left = np.abs(self.depths[left] - z)
+        dist_right = np.abs(self.depths[right] - z)
+        use_left = (dist_left < dist_right) | ((dist_left == dist_right) & (self.order[left] < self.order[right]))
+        return np.where(use_left, left, right)
+
+    def index(self, z):
+        """Index into the original profile of the nearest depth to z."""
+        if len(self.depths) == 1:
+            return self.order[np.zeros(np.shape(z), dtype=int)]
+        return self.order[self._sorted_index(z)]
+
+    def steps_in_region(self, z, step):
+        """A guess at how many steps from z we can take before the nearest depth changes."""
+        if len(self.depths) == 1 or step <= 0:
+            return np.iinfo(np.int32).max
+        i = self._sorted_index(z)
+        if i == len(self.depths) - 1:
+            return np.iinfo(np.int32).max
+        boundary = (self.depths[i] + self.depths[i + 1]) / 2.
+        return max(int(np.ceil((boundary - z) / step)) + 1, 1)
+
+
 def crop(self, lim, top_or_bottom='top', dimension='snum', uice=1.69e8, rezero=True, zero_trig=True):
     """Crop the radar data in the vertical. We can take off the top or bottom.
 
@@ -307,17 +442,18 @@ def crop(self, lim, top_or_bottom='top', dimension='snum', uice=1.69e8, rezero=T
         mintrig = np.nanmin(ind)
         lims = [mintrig, self.data.shape[0]]
         self.trig = self.trig - ind
-        data_old = self.data.copy()
-        self.data = np.zeros((data_old.shape[0] - mintrig, data_old.shape[1]))
-        self.data[:, :] = np.nan
-        trig_ends = self.data.shape[0] - (ind - mintrig)
-        for i in range(self.data.shape[1]):
-            self.data[:trig_ends[i], i] = data_old[ind[i]:, i]
+        self.data = ragged_shift(self.data, -ind, out_rows=self.data.shape[0] - mintrig)
         self.travel_time = self.travel_time[lims[0]:lims[1]]
         if rezero:
             self.travel_time = self.travel_time - self.travel_time[0]
         self.snum = self.data.shape[0]
 
+    if self.picks is not None:
+        if top_or_bottom == 'top':
+            self.picks.shift(-ind, self.snum)
+        else:
+            self.picks.shift(0, self.snum)
+
     try:
         self.flags.crop[0] = 1
         self.flags.crop[2] = self.flags.crop[1] + lims[1]
@@ -395,72 +531,90 @@ def hcrop(self, lim, left_or_right='left', dimension='tnum'):
     self.tnum = self.data.shape[1]
 
 
-def restack(self, traces):
+def restack(self, traces, preserve_dtype=False):
     """Restack all relevant data to the given number of traces.
 
     This function just takes the average of the given number of traces.
     This reduces file size and can get rid of noise.
     There are fancier ways to do this---
     if you have GPS, you probably want to restack to constant trace spacing instead.
+    Traces left over at the end of the profile are dropped.
 
     Parameters
     ----------
     traces: int
         The (odd) number of traces to stack
+    preserve_dtype: bool, optional
+        Keep the dtype of the data (e.g. float32). Default is False, returning float64.
     """
     traces = int(traces)
     if traces % 2 == 0:
         print('Only will stack odd numbers of traces. Using {:d}'.format(int(traces + 1)))
         traces = traces + 1
-    tnum = int(np.floor(self.tnum / traces))
-    stack = np.zeros((self.snum, tnum))
-    trace_int = np.zeros((tnum, ))
-    oned_restack_vars = ['dist',
-                         'pressure',
-                         'lat',
-                         'long',
-                         'x_coord',
-                         'y_coord',
-                         'elev',
-                         'decday',
-                         'trig']
-    oned_newdata = {key: np.zeros((tnum, )) if getattr(self, key) is not None else None for key in oned_restack_vars}
-    for j in range(tnum):
-        stack[:, j] = np.mean(self.data[:, j * traces:min((j + 1) * traces, self.data.shape[1])],
-                              axis=1)
-        # trace_int[j] = np.sum(self.trace_int[j * traces:min((j + 1) * traces, self.data.shape[1])])
-        for var, val in oned_newdata.items():
-            if val is not None:
-                val[j] = np.mean(getattr(self, var)[j * traces:
-                                                    min((j + 1) * traces, self.data.shape[1])])
-    self.tnum = tnum
+    restacker = Restacker(traces, preserve_dtype=preserve_dtype)
+    # Things that are not per-trace (e.g. a single trigger for all traces) are left alone
+    stack, oned_newdata = restacker.add(self.data, **{key: getattr(self, key) for key in RESTACK_VARS
+                                                      if np.size(getattr(self, key)) == self.data.shape[1]})
+    restacker.finish()
+
+    self.tnum = stack.shape[1]
     self.data = stack
     self.trace_num = np.arange(self.tnum).astype(int) + 1
-    self.trace_int = trace_int
+    self.trace_int = np.zeros((self.tnum, ))
     for var, val in oned_newdata.items():
         setattr(self, var, val)
     self.flags.restack = True
 
 
-def rangegain(self, slope):
+def rangegain(self, slope, gain_type='linear'):
     """Apply a range gain.
 
+    Samples after the trigger are multiplied by a gain that depends on travel time.
+
     Parameters
     ----------
     slope: float
         The slope of the linear range gain to be applied. Maybe try 1.0e-2?
+        For the other gain types, this is the rate (exp) or exponent (power).
+    gain_type: str, optional
+        The shape of the gain curve with travel time t (microseconds).
+        'linear' (default) is slope * t, 'exp' is exp(slope * t), and 'power' is t ** slope.
     """
-    if isinstance(self.trig, (float, int, np.float, np.int64)):
-        gain = self.travel_time[int(self.trig) + 1:] * slope
-        self.data[int(self.trig + 1):, :] *= np.atleast_2d(gain).transpose()
+    if gain_type == 'linear':
+        gain = self.travel_time * slope
+    elif gain_type == 'exp':
+        gain = np.exp(self.travel_time * slope)
+    elif gain_type == 'power':
+        gain = np.abs(self.travel_time) ** slope
+    else:
+        raise ValueError('gain_type must be linear, exp, or power')
+    gain = gain.astype(np.result_type(self.data.dtype, np.float32), copy=False)
+
+    if np.ndim(self.trig) == 0:
+        self.data[int(self.trig + 1):, :] *= np.atleast_2d(gain[int(self.trig) + 1:]).transpose()
     else:
-        for i, trig in enumerate(self.trig):
-            gain = self.travel_time[int(trig) + 1:] * slope
-            self.data[int(trig) + 1:, i] *= gain
+        # Below all the triggers we can gain everything, and we only need to
+        # check against the trigger of each trace in between
+        trig = np.asarray(self.trig).astype(int).flatten()
+        top = min(max(np.min(trig) + 1, 0), self.data.shape[0])
+        bottom = min(max(np.max(trig) + 1, 0), self.data.shape[0])
+        self.data[bottom:, :] *= np.atleast_2d(gain[bottom:]).transpose()
+        if bottom > top:
+            after_trig = np.arange(top, bottom)[:, None] > trig[None, :]
+            band = self.data[top:bottom, :]
+            np.multiply(band, gain[top:bottom, None], out=band, where=after_trig)
     self.flags.rgain = True
 
 
-def agc(self, window=50, scaling_factor=50):
+def _abs_float(data, real_dtype):
+    """Get the absolute value of the data as floating point, without overflowing ints."""
+    if np.issubdtype(data.dtype, np.integer):
+        amp = data.astype(real_dtype)
+        return np.abs(amp, out=amp)
+    return np.abs(data).astype(real_dtype, copy=False)
+
+
+def agc(self, window=50, scaling_factor=50, per_trace=False, envelope='max'):
     """Try to do some automatic gain control
 
     This is from StoDeep--I'm not sure it is useful but it was easy to roll over so
@@ -474,14 +628,50 @@ def agc(self, window=50, scaling_factor=50):
     scaling_factor: int, optional
         The scaling factor. This gets divided by the max amplitude when we rescale the input.
         Default 50.
+    per_trace: bool, optional
+        Find a gain for each trace, rather than one gain per sample for the whole profile (StoDeep).
+        Default False.
+    envelope: str, optional
+        Scale by the maximum amplitude ('max', default) or the rms amplitude ('rms') in the window.
     """
-    maxamp = np.zeros((self.snum,))
+    if envelope not in ['max', 'rms']:
+        raise ValueError('envelope must be max or rms')
     # In the for loop, old code indexed used range(window // 2). This did not make sense to me.
-    for i in range(self.snum):
-        maxamp[i] = np.max(np.abs(self.data[max(0, i - window // 2):
-                                            min(i + window // 2, self.snum), :]))
-    maxamp[maxamp == 0] = 1.0e-6
-    self.data *= (scaling_factor / np.atleast_2d(maxamp).transpose()).astype(self.data.dtype)
+    # The window for sample i is [i - window // 2, i + window // 2), cut off at the top and bottom
+    half = window // 2
+    real_dtype = np.result_type(self.data.real.dtype, np.float32)
+    if envelope == 'max':
+        if per_trace:
+            amp = _abs_float(self.data, real_dtype)
+        elif np.iscomplexobj(self.data):
+            amp = np.max(np.abs(self.data), axis=1)
+        else:
+            # As floats, since the envelope becomes the gain in place (and -min can overflow an int)
+            amp = np.maximum(np.max(self.data, axis=1).astype(real_dtype),
+                             -np.min(self.data, axis=1).astype(real_dtype))
+        # Replicating the edges gives the same maxima as cutting off the window
+        maximum_filter1d(amp, max(2 * half, 1), axis=0, mode='nearest', output=amp)
+    else:
+        power = _abs_float(self.data, real_dtype) ** 2.0
+        if not per_trace:
+            power = np.mean(power, axis=1)
+        # Running mean of the power from a cumulative sum
+        cumulative = np.zeros((power.shape[0] + 1, ) + power.shape[1:])
+        np.cumsum(power, axis=0, out=cumulative[1:])
+        samps = np.arange(power.shape[0])
+        range_start = np.maximum(samps - half, 0)
+        range_end = np.maximum(np.minimum(samps + half, power.shape[0]), range_start + 1)
+        weights = (range_end - range_start).reshape((-1, ) + (1, ) * (power.ndim - 1))
+        amp = power
+        amp[:] = np.sqrt((cumulative[range_end] - cumulative[range_start]) / weights)
+        del cumulative
+
+    amp[amp == 0] = 1.0e-6
+    # Turn the envelope into a gain without another copy
+    np.divide(scaling_factor, amp, out=amp)
+    if not per_trace:
+        amp = np.atleast_2d(amp).transpose()
+    self.data *= amp.astype(self.data.dtype, copy=False)
     self.flags.agc = True
 
 
@@ -518,10 +708,10 @@ def constant_space(self, spacing, min_movement=1.0e-2, show_nomove=False):
     # eliminate an interpolation error by masking out little movement
     good_vals = np.hstack((np.array([True]), np.diff(self.dist * 1000.) >= min_movement))
 
-    # Correct the distances to reduce noise
-    for i in range(len(self.dist)):
-        if not good_vals[i]:
-            self.dist[i:] = self.dist[i:] - (self.dist[i] - self.dist[i - 1])
+    # Correct the distances to reduce noise: drop the increments where we did not move
+    increments = np.diff(self.dist)
+    increments[~good_vals[1:]] = 0.
+    self.dist = self.dist[0] + np.hstack(([0.], np.cumsum(increments)))
     temp_dist = self.dist[good_vals]
 
     if show_nomove:  # pragma: no cover
@@ -534,29 +724,23 @@ def constant_space(self, spacing, min_movement=1.0e-2, show_nomove=False):
                           np.max(temp_dist),
                           step=spacing / 1000.0)
 
-    # interp1d can only handle real values
-    if self.data.dtype in [np.complex128]:
-        self.data = interp1d(temp_dist, np.real(self.data[:, good_vals]))(new_dists) + 1.j * interp1d(temp_dist, np.imag(self.data[:, good_vals]))(new_dists)
-    else:
-        self.data = interp1d(temp_dist, self.data[:, good_vals])(new_dists)
+    # Find where the new traces fall once, then use that for everything
+    weights = _linear_interp_weights(temp_dist, new_dists)
+    self.data = _linear_interp(self.data[:, good_vals], weights)
 
-    for attr in ['lat', 'long', 'x_coord', 'y_coord', 'decday', 'pressure', 'trig']:
-        setattr(self,
-                attr,
-                interp1d(temp_dist, getattr(self, attr)[good_vals])(new_dists))
-    for attr in ['elev']:
+    for attr in ['lat', 'long', 'x_coord', 'y_coord', 'decday', 'pressure', 'trig', 'elev']:
         if getattr(self, attr) is not None:
             setattr(self,
                     attr,
-                    interp1d(temp_dist, getattr(self, attr)[good_vals])(new_dists))
+                    _linear_interp(np.asarray(getattr(self, attr))[good_vals], weights))
 
     if self.picks is not None:
         for attr in ['samp1', 'samp2', 'samp3']:
             if getattr(self.picks, attr) is not None:
-                setattr(self.picks, attr, np.round(interp1d(temp_dist, getattr(self.picks, attr)[:, good_vals])(new_dists)))
+                setattr(self.picks, attr, np.round(_linear_interp(getattr(self.picks, attr)[:, good_vals], weights)))
         for attr in ['power', 'time']:
             if getattr(self.picks, attr) is not None:
-                setattr(self.picks, attr, interp1d(temp_dist, getattr(self.picks, attr)[:, good_vals])(new_dists))
+                setattr(self.picks, attr, _linear_interp(getattr(self.picks, attr)[:, good_vals], weights))
 
     self.tnum = self.data.shape[1]
     self.trace_num = np.arange(self.tnum).astype(int) + 1
@@ -571,6 +755,24 @@ def constant_space(self, spacing, min_movement=1.0e-2, show_nomove=False):
         self.flags.interp[1] = spacing
 
 
+def _linear_interp_weights(x, x_new):
+    """Find the neighbors and weights for linear interpolation, as in scipy's interp1d."""
+    order = np.argsort(x, kind='mergesort')
+    x = x[order]
+    hi = np.clip(np.searchsorted(x, x_new), 1, len(x) - 1)
+    lo = hi - 1
+    if np.any(x_new < x[0]) or np.any(x_new > x[-1]):
+        raise ValueError('A value in x_new is outside the interpolation range.')
+    return order[lo], order[hi], x[hi] - x[lo], x_new - x[lo]
+
+
+def _linear_interp(y, weights):
+    """Interpolate along the last axis of y (real or complex) using _linear_interp_weights."""
+    lo, hi, dx, frac = weights
+    y_lo = y[..., lo]
+    return (y[..., hi] - y_lo) / dx * frac + y_lo
+
+
 def elev_correct(self, v_avg=1.69e8):
     """Move the surface down in the data array to account for surface elevation.
 
@@ -604,13 +806,11 @@ def elev_correct(self, v_avg=1.69e8):
     dz_avg = self.dt * (v_avg / 2.)
     max_samp = int(np.floor(max_diff / dz_avg))
 
-    data_old = self.data.copy()
-    self.data = np.zeros((data_old.shape[0] + max_samp, data_old.shape[1]))
-    self.data[:, :] = np.nan
-
-    for i in range(self.data.shape[1]):
-        left_ind = int(elev_diffs[i] // dz_avg)
-        self.data[left_ind: left_ind + data_old.shape[0], i] = data_old[:, i]
+    left_inds = (elev_diffs // dz_avg).astype(int)
+    self.data = ragged_shift(self.data, left_inds, out_rows=self.data.shape[0] + max_samp,
+                             dtype=np.result_type(self.data.dtype, np.float64))
+    if self.picks is not None:
+        self.picks.shift(left_inds, self.data.shape[0])
 
     self.elevation = np.hstack((np.arange(np.max(self.elev), np.min(self.elev), -dz_avg),
                                 np.min(self.elev) - self.nmo_depth))
@@ -13,6 +13,7 @@ Methods for saving, processing, and filtering are defined externally.
 
 
 import datetime
+import functools
 import numpy as np
 from scipy.io import loadmat
 from ..RadarFlags import RadarFlags
@@ -117,7 +118,7 @@ class RadarData(object):
         _get_pick_targ_info
     from ._RadarDataFiltering import adaptivehfilt, horizontalfilt, highpass, \
         winavg_hfilt, hfilt, vertical_band_pass, denoise, migrate, \
-        horizontal_band_pass, lowpass
+        horizontal_band_pass, lowpass, wavenumber_filter
 
     # Now make some load/save methods that will work with the matlab format
     def __init__(self, fn_mat):
@@ -329,6 +330,14 @@ class RadarData(object):
             self.data_dtype = self.data.dtype
         return
 
+    def load_data(self):
+        """Read data that were left in the file (e.g. BSI loaded with lazy=True) into memory.
+
+        Processing and saving call this first, since they work on the data in place.
+        """
+        if self.data is not None and not isinstance(self.data, np.ndarray):
+            self.data = np.asarray(self.data)
+
     def get_projected_coords(self, t_srs=None):
         """Convert to projected coordinates
 
@@ -371,3 +380,20 @@ class RadarData(object):
                          datetime.timedelta(days=int(dd)) + 
                          datetime.timedelta(days=dd % 1)
                          for dd in self.decday], dtype=np.datetime64)
+
+
+def _loads_data(method):
+    """Wrap a method so that data left in the file are read in before it runs."""
+    @functools.wraps(method)
+    def wrapped(self, *args, **kwargs):
+        self.load_data()
+        return method(self, *args, **kwargs)
+    return wrapped
+
+
+for _method in ['reverse', 'nmo', 'crop', 'hcrop', 'restack', 'rangegain', 'agc',
+                'constant_space', 'elev_correct', 'constant_sample_depth_spacing',
+                'traveltime_to_depth', 'save', 'save_as_segy', 'adaptivehfilt',
+                'horizontalfilt', 'highpass', 'winavg_hfilt', 'hfilt', 'vertical_band_pass',
+                'denoise', 'migrate', 'horizontal_band_pass', 'lowpass', 'wavenumber_filter']:
+    setattr(RadarData, _method, _loads_data(getattr(RadarData, _method)))
@@ -31,7 +31,8 @@ class RadarFlags():
     rgain: bool
         Data have a linear range gain applied.
     bpass: 3x1 :class:`numpy.ndarray`
-        Elements: (1) 1 if bandpassed; (2) Low; and (3) High (MHz) bounds
+        Elements: (1) 1 if bandpassed; (2) Low; and (3) High (MHz) bounds.
+        For IIR filters, the second-order sections of the design follow, flattened.
     hfilt: 2x1 :class:`numpy.ndarray`
         Elements: (1) 1 if horizontally filtered; (2) Filter type
     interp: 2x1 :class:`numpy.ndarray`
@@ -0,0 +1,203 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+"""Filter radar data along the traces, i.e. in horizontal wavenumber.
+
+Filters are zero-phase Butterworth filters, described by tuples of
+(btype, corner, order), with btype one of lowpass, highpass, bandpass, or notch
+(bandstop), and the corner(s) expressed as a fraction of the Nyquist wavenumber
+(one cycle per two traces). Any number of filters can be applied together.
+
+With method='fft', the filters are applied as a single mask on the real FFT of
+each (padded) row of the data, so a whole stack of filters costs one transform.
+The mask is the squared magnitude response of the digital filter, which is what
+a forward-backward (filtfilt) pass applies. With method='sos', the filters are
+run one after another with :func:`scipy.signal.sosfiltfilt`.
+Either way the data are processed a chunk of samples (rows) at a time.
+"""
+
+import numpy as np
+from scipy.fft import rfft, irfft, fft, ifft, next_fast_len
+from scipy.signal import butter, sosfiltfilt, sosfreqz
+
+FILTER_TYPES = {'low': 'lowpass', 'lowpass': 'lowpass',
+                'high': 'highpass', 'highpass': 'highpass',
+                'band': 'bandpass', 'bandpass': 'bandpass',
+                'notch': 'bandstop', 'stop': 'bandstop', 'bandstop': 'bandstop'}
+
+# Designs, padding/transform lengths, and masks, which depend only on the filters and tnum
+_SOS_CACHE = {}
+_PLAN_CACHE = {}
+_MASK_CACHE = {}
+
+
+def _filter_key(filt):
+    """Get a hashable, normalized version of a (btype, corner, order) filter."""
+    btype, corner, order = filt
+    if btype not in FILTER_TYPES:
+        raise ValueError('Filter type {:s} is not recognized'.format(str(btype)))
+    corner = tuple(float(c) for c in np.atleast_1d(corner))
+    return (FILTER_TYPES[btype], corner, int(order))
+
+
+def horizontal_sos(btype, corner, order=5):
+    """Design a Butterworth filter as second-order sections.
+
+    Designs are cached, so repeated calls with the same arguments are free.
+
+    Parameters
+    ----------
+    btype: str
+        lowpass, highpass, bandpass, or notch (or their scipy abbreviations)
+    corner: float or 2-tuple
+        Corner(s) as a fraction of the Nyquist wavenumber
+    order: int, optional
+        Filter order. Default 5.
+
+    Returns
+    -------
+    sos: np.ndarray
+        n x 6 array of second-order sections
+    """
+    key = _filter_key((btype, corner, order))
+    if key not in _SOS_CACHE:
+        corner = key[1][0] if len(key[1]) == 1 else list(key[1])
+        _SOS_CACHE[key] = butter(key[2], corner, key[0], output='sos')
+    return _SOS_CACHE[key].copy()
+
+
+def _padlen(filters, tnum):
+    """Get enough padding for the impulse responses of the filters to die out, capped by the data."""
+    decay = 0
+    for filt in filters:
+        sos = horizontal_sos(*filt)
+        radius = max([np.max(np.abs(np.roots(section[3:]))) for section in sos] + [0.])
+        if radius > 0:
+            # Samples to decay by a factor of 1e6, both directions
+            decay += int(np.ceil(np.log(1.0e-6) / np.log(min(radius, 1. - 1.0e-12))))
+    return int(max(0, min(decay, tnum - 1)))
+
+
+def kx_plan(filters, tnum):
+    """Get the padding and transform length for filtering tnum traces.
+
+    Parameters
+    ----------
+    filters: list of tuples
+        (btype, corner, order) for each filter
+    tnum: int
+        Number of traces
+
+    Returns
+    -------
+    padlen: int
+        Number of traces of odd extension added at each end
+    nfft: int
+        Length of the transform
+    """
+    key = (tuple(_filter_key(filt) for filt in filters), int(tnum))
+    if key not in _PLAN_CACHE:
+        if len(_PLAN_CACHE) > 32:
+            _PLAN_CACHE.clear()
+        padlen = _padlen(filters, tnum)
+        _PLAN_CACHE[key] = (padlen, next_fast_len(tnum + 2 * padlen, real=True))
+    return _PLAN_CACHE[key]
+
+
+def kx_mask(filters, nfft, onesided=True):
+    """Get the combined zero-phase response of the filters.
+
+    Parameters
+    ----------
+    filters: list of tuples
+        (btype, corner, order) for each filter
+    nfft: int
+        Length of the transform
+    onesided: bool, optional
+        Return the response at the rfft wavenumbers. Otherwise, at the fft wavenumbers (for complex data).
+
+    Returns
+    -------
+    mask: np.ndarray
+        The response to multiply the transformed data by
+    """
+    key = (tuple(_filter_key(filt) for filt in filters), int(nfft), onesided)
+    if key not in _MASK_CACHE:
+        if len(_MASK_CACHE) > 32:
+            _MASK_CACHE.clear()
+        if onesided:
+            worN = 2. * np.pi * np.fft.rfftfreq(nfft)
+        else:
+            worN = 2. * np.pi * np.fft.fftfreq(nfft)
+        mask = np.ones(worN.shape)
+        for filt in filters:
+            _, response = sosfreqz(horizontal_sos(*filt), worN=worN)
+            mask *= np.abs(response) ** 2.
+        _MASK_CACHE[key] = mask
+    return _MASK_CACHE[key]
+
+
+def _odd_extend(data, padlen, nfft):
+    """Pad the rows of data by odd extension, as filtfilt does, then by the end value out to nfft."""
+    if padlen > 0:
+        left = 2. * data[:, :1] - data[:, padlen:0:-1]
+        right = 2. * data[:, -1:] - data[:, -2:-padlen - 2:-1]
+        data = np.hstack((left, data, right))
+    if nfft > data.shape[1]:
+        # Padding with zeros would put a step in the data
+        data = np.pad(data, ((0, 0), (0, nfft - data.shape[1])), mode='edge')
+    return data
+
+
+def kx_filter(data, filters, method='fft', chunksize=None):
+    """Apply a stack of zero-phase horizontal filters to the data, in place.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        snum x tnum array, filtered along the traces (axis 1). Must be floating point.
+    filters: list of tuples
+        (btype, corner, order) for each filter.
+        Corners are a fraction of the Nyquist wavenumber (e.g. 2 / wavelength in traces).
+    method: str, optional
+        fft to apply the filters as one mask in the wavenumber domain,
+        or sos to run each filter with sosfiltfilt. Default fft.
+    chunksize: int, optional
+        Number of samples (rows) to filter at once. Default is about 4 million values.
+
+    Returns
+    -------
+    data: np.ndarray
+        The filtered data (the same array as the input)
+    """
+    if not np.issubdtype(data.dtype, np.inexact):
+        raise TypeError('Data must be floating point to filter in place')
+    if len(filters) == 0:
+        return data
+    snum, tnum = data.shape
+    if chunksize is None:
+        chunksize = max(1, 2 ** 22 // max(tnum, 1))
+
+    if method == 'fft':
+        padlen, nfft = kx_plan(filters, tnum)
+        is_complex = np.iscomplexobj(data)
+        mask = kx_mask(filters, nfft, onesided=not is_complex)
+        for start in range(0, snum, chunksize):
+            chunk = _odd_extend(data[start:start + chunksize, :], padlen, nfft)
+            if is_complex:
+                chunk = ifft(fft(chunk, axis=1) * mask, axis=1)
+            else:
+                chunk = irfft(rfft(chunk, axis=1) * mask, n=nfft, axis=1)
+            data[start:start + chunksize, :] = chunk[:, padlen:padlen + tnum]
+    elif method == 'sos':
+        sos = [horizontal_sos(*filt) for filt in filters]
+        for start in range(0, snum, chunksize):
+            chunk = data[start:start + chunksize, :]
+            for section in sos:
+                chunk = sosfiltfilt(section, chunk, axis=1)
+            data[start:start + chunksize, :] = chunk
+    else:
+        raise ValueError('Method must be fft or sos')
+    return data
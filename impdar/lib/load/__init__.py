@@ -11,7 +11,7 @@ A wrapper around the other loading utilities
 """
 
 import os.path
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from . import load_mcords  # needs to be imported first and alone due to opaque h5py/netcdf4 error
 from . import load_gssi, load_pulse_ekko, load_gprMax, load_olaf, load_segy, load_UoA_mat
 from . import load_delores, load_osu, load_stomat, load_ramac, load_bsi
@@ -45,7 +45,7 @@ def load(filetype, fns_in, channel=1, t_srs=None, s_srs=None, *args, **kwargs):
         fns_in = [fns_in]
 
     if filetype == 'gssi':
-        dat = [load_gssi.load_gssi(fn) for fn in fns_in]
+        dat = [load_gssi.load_gssi(fn, **kwargs) for fn in fns_in]
     elif filetype == 'pe':
         dat = []
         for fn in fns_in:
@@ -57,15 +57,10 @@ def load(filetype, fns_in, channel=1, t_srs=None, s_srs=None, *args, **kwargs):
                     bn_pe)
                 if not os.path.isdir(bn_pe):
                     os.mkdir(bn_pe)
-                os.rename(fn, os.path.join(bn_pe, fn))
-                os.chdir(bn_pe)
-                load_pulse_ekko.partition_project_file(fn)
-                os.rename(fn, os.path.join('..', fn))
-                os.chdir('..')
-                # load each file from within the project
-                fns_partition = glob.glob(bn_pe+'/*.DT1')
-                for fn_i in fns_partition:
-                    dat.append(load_pulse_ekko.load_pe(fn_i))
+                fns_partition = load_pulse_ekko.partition_project_file(fn, out_dir=bn_pe)
+                # load each file from within the project. The reads are mostly I/O and numpy.
+                with ThreadPoolExecutor(max_workers=min(len(fns_partition), os.cpu_count() or 1) or 1) as pool:
+                    dat.extend(pool.map(load_pulse_ekko.load_pe, fns_partition))
             # If a standard pulse ekko file is input, try to load it
             else:
                 try:
@@ -88,7 +83,8 @@ def load(filetype, fns_in, channel=1, t_srs=None, s_srs=None, *args, **kwargs):
                 nans = kwargs['nans']
             else:
                 nans = 'interp'
-            data_nestedlist = [load_bsi.load_bsi(fn, nans=nans) for fn in fns_in]
+            bsi_kwargs = {key: kwargs[key] for key in ['lazy', 'batchsize', 'n_threads'] if key in kwargs}
+            data_nestedlist = [load_bsi.load_bsi(fn, nans=nans, **bsi_kwargs) for fn in fns_in]
             dat = []
             for data in data_nestedlist:
                 dat.extend(data)
@@ -96,7 +92,9 @@ def load(filetype, fns_in, channel=1, t_srs=None, s_srs=None, *args, **kwargs):
             raise ImportError('You need h5py for bsi')
     elif filetype == 'gecko':
         # Slightly different because we assume that we want to concat
-        dat = [load_olaf.load_olaf(fns_in, channel=channel)]
+        dat = load_olaf.load_olaf(fns_in, channel=channel)
+        if not isinstance(dat, list):
+            dat = [dat]
     elif filetype == 'segy':
         if load_segy.SEGY:
             dat = [load_segy.load_segy(fn) for fn in fns_in]
@@ -106,11 +104,13 @@ def load(filetype, fns_in, channel=1, t_srs=None, s_srs=None, *args, **kwargs):
         dat = [load_gprMax.load_gprMax(fn) for fn in fns_in]
     elif filetype == 'mcords_nc':
         if load_mcords.NC:
-            dat = [load_mcords.load_mcords_nc(fn) for fn in fns_in]
+            mcords_kwargs = {key: kwargs[key] for key in ['traces', 'bbox', 'db'] if key in kwargs}
+            dat = [load_mcords.load_mcords_nc(fn, **mcords_kwargs) for fn in fns_in]
         else:
             raise ImportError('You need netCDF4 in order to read the MCoRDS files')
     elif filetype == 'mcords_mat':
-        dat = [load_mcords.load_mcords_mat(fn) for fn in fns_in]
+        mcords_kwargs = {key: kwargs[key] for key in ['traces', 'bbox', 'db'] if key in kwargs}
+        dat = [load_mcords.load_mcords_mat(fn, **mcords_kwargs) for fn in fns_in]
     elif filetype == 'UoA_mat':
         if load_UoA_mat.H5:
             if 'gps_offset' in kwargs:
@@ -4,6 +4,7 @@
 """Load BSI IceRadar h5 files and convert to the .mat ImpDAR file."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from scipy.interpolate import interp1d
 
@@ -32,6 +33,163 @@ def _xmlGetVal(xml, name):
         return None
 
 
+# Pull all the GPS values we need out of the xml for a trace in one pass
+_GPS_XML = re.compile(r'<Name>(GPS_timestamp_UTC|Lat_N|Long_\sW|Alt_asl_m|GPS\sFix\svalid|GPS\sMessage\sok)'
+                      r'</Name>[\r]?\n<Val>(.*?)</Val', flags=re.IGNORECASE | re.DOTALL)
+
+ECHOGRAM = 'location_{:d}/datacapture_0/echogram_0'
+
+
+def _gps_from_xml(gps_data):
+    """Get lat, lon, time, and elevation from the GPS xml of a trace.
+
+    Returns NaNs if the fix or message is not valid, or if the values are bad.
+    """
+    vals = {}
+    for name, val in _GPS_XML.findall(gps_data):
+        vals.setdefault(re.sub(r'\s', ' ', name.lower()), val)
+    # sometimes, there are bad entries that are unmarked
+    try:
+        if (float(vals['gps fix valid']) > 0) and (float(vals['gps message ok']) > 0):
+            return (float(vals['lat_n']), float(vals['long_ w']),
+                    float(vals['gps_timestamp_utc']), float(vals['alt_asl_m']))
+    except (KeyError, ValueError):
+        pass
+    return (np.nan, np.nan, np.nan, np.nan)
+
+
+def _attr_str(attr):
+    """Get an xml attribute as a str, whether h5py gives us str or bytes."""
+    if isinstance(attr, str):
+        return attr
+    return attr.decode('utf-8')
+
+
+def scan_line(dset):
+    """Find the echograms of a line, and the most samples any of them has.
+
+    Only the metadata are read.
+
+    Parameters
+    ----------
+    dset: h5py.Group
+        The line_n group
+
+    Returns
+    -------
+    echograms: list of h5py.Dataset
+        The echogram of each location, in order
+    snum: int
+        The maximum number of samples per trace (settings can change mid-line)
+    """
+    echograms = [dset[ECHOGRAM.format(location_num)] for location_num in range(len(dset.keys()))]
+    snum = max([echogram.shape[0] for echogram in echograms] + [0])
+    return echograms, snum
+
+
+def read_echograms(echograms, out):
+    """Read echograms into the columns of out, padding short ones with zeros.
+
+    Parameters
+    ----------
+    echograms: list of h5py.Dataset
+        The traces to read
+    out: np.ndarray
+        snum x len(echograms) array to fill
+    """
+    # Read straight into the memory of a column when we can
+    direct = out.flags.f_contiguous
+    for i, echogram in enumerate(echograms):
+        nsamps = echogram.shape[0]
+        if direct:
+            echogram.read_direct(out.T, dest_sel=np.s_[i, :nsamps])
+        else:
+            out[:nsamps, i] = echogram[()]
+        out[nsamps:, i] = 0.
+    return out
+
+
+class LazyEchograms:
+    """The data of a BSI line, left in the file until a range of traces is accessed.
+
+    This stands in for the snum x tnum data array. Indexing it (e.g. ``data[:, 100:200]``)
+    reads only the traces needed, and np.asarray reads them all. Blocks of traces can be
+    streamed through processing with :func:`impdar.lib.streaming.read_blocks`.
+    It cannot be written to; processing a RadarData in place reads all the traces in
+    first (see :meth:`impdar.lib.RadarData.RadarData.load_data`).
+
+    Parameters
+    ----------
+    fn_h5: str
+        The h5 file
+    dset_name: str
+        The line in the file
+    snum: int
+        The maximum number of samples per trace
+    locations: np.ndarray
+        The location number of each trace
+    """
+
+    ndim = 2
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, fn_h5, dset_name, snum, locations):
+        self.fn_h5 = fn_h5
+        self.dset_name = dset_name
+        self.snum = snum
+        self.locations = np.asarray(locations, dtype=int)
+
+    @property
+    def shape(self):
+        """snum x tnum."""
+        return (self.snum, len(self.locations))
+
+    def __len__(self):
+        return self.snum
+
+    def subset(self, traces):
+        """Get a LazyEchograms with only some of the traces (by index or boolean mask)."""
+        return LazyEchograms(self.fn_h5, self.dset_name, self.snum, self.locations[traces])
+
+    def read(self, traces=slice(None)):
+        """Read some traces from the file.
+
+        Parameters
+        ----------
+        traces: slice, int, or array, optional
+            Which traces to read. Default is all of them.
+
+        Returns
+        -------
+        np.ndarray
+            snum x n array
+        """
+        locations = np.atleast_1d(self.locations[traces])
+        out = np.zeros((self.snum, len(locations)), order='F')
+        with h5py.File(self.fn_h5, 'r') as f_in:
+            dset = f_in[self.dset_name]
+            read_echograms([dset[ECHOGRAM.format(location)] for location in locations], out)
+        return out
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key, )
+        if len(key) > 2:
+            raise IndexError('too many indices for the data')
+        rows = key[0]
+        traces = key[1] if len(key) > 1 else slice(None)
+        out = self.read(traces)
+        if np.ndim(self.locations[traces]) == 0:
+            out = out[:, 0]
+        return out[rows]
+
+    def __array__(self, dtype=None, copy=None):
+        out = self.read()
+        if dtype is not None:
+            out = out.astype(dtype)
+        return out
+
+
 def _dm2dec(dms):
     """Convert the degree - decimal minute GGA to a decimal."""
     return ((dms - dms % 100) / 100 + (dms % 100) / 60)
@@ -49,8 +207,30 @@ def _dt_from_comment(dset):
     return datetime.datetime(dmy[2], dmy[0], dmy[1], 0, 0, 0)
 
 
-def load_bsi(fn_h5, nans=None, *args, **kwargs):
-    """Load a BSI IceRadar file, which is just an h5 file, into ImpDAR."""
+def load_bsi(fn_h5, nans=None, *args, lazy=False, batchsize=1024, n_threads=1, **kwargs):
+    """Load a BSI IceRadar file, which is just an h5 file, into ImpDAR.
+
+    Parameters
+    ----------
+    fn_h5: str
+        The file to load
+    nans: str, optional
+        What to do with traces with bad GPS: interp(olate) or delete them. Default leaves NaNs.
+    lazy: bool, optional
+        Leave the echograms in the file until they are accessed.
+        The data of each line are then a :class:`LazyEchograms`, which are read into
+        memory by the first processing step (or by RadarData.load_data).
+    batchsize: int, optional
+        Number of traces to read at once. Default 1024.
+    n_threads: int, optional
+        Number of threads to parse the GPS metadata of a batch with while the next is read.
+        Default 1 (no pool).
+
+    Returns
+    -------
+    list of RadarData
+        One per line in the file
+    """
     if not H5:
         raise ImportError('You need H5 to load bsi')
 
@@ -58,6 +238,11 @@ def load_bsi(fn_h5, nans=None, *args, **kwargs):
     # lines stored in one file. We want to preserve these since concatenation
     # may be illogical
     h5_data_list = []
+    batchsize = max(1, int(batchsize))
+    if n_threads > 1:
+        pool = ThreadPoolExecutor(max_workers=n_threads)
+    else:
+        pool = None
 
     # open the h5 file
     with h5py.File(fn_h5, 'r') as f_in:
@@ -72,61 +257,32 @@ def load_bsi(fn_h5, nans=None, *args, **kwargs):
             h5_data = RadarData(None)
             # We need this for logical file naming later on
             h5_data.fn = os.path.splitext(fn_h5)[0] + dset_name + '.h5'
-            h5_data.tnum = len(list(dset.keys()))
-            h5_data.snum = len(
-                dset['location_0']['datacapture_0']['echogram_0'])
-            lat = np.zeros((h5_data.tnum,))
-            lon = np.zeros((h5_data.tnum,))
-            h5_data.elev = np.zeros((h5_data.tnum,))
-            time = np.zeros((h5_data.tnum,))
-            h5_data.data = np.zeros((h5_data.snum, h5_data.tnum))
-
-            if type(dset['location_0']['datacapture_0']['echogram_0'].attrs['Digitizer-MetaData_xml']) == str:
-                digitizer_data = dset['location_0']['datacapture_0'][
-                    'echogram_0'].attrs['Digitizer-MetaData_xml']
+
+            # Find the size first, so we only allocate once
+            echograms, h5_data.snum = scan_line(dset)
+            h5_data.tnum = len(echograms)
+            if lazy:
+                h5_data.data = LazyEchograms(fn_h5, dset_name, h5_data.snum, np.arange(h5_data.tnum))
             else:
-                digitizer_data = dset['location_0']['datacapture_0'][
-                    'echogram_0'].attrs['Digitizer-MetaData_xml'].decode('utf-8')
-            for location_num in range(h5_data.tnum):
-                # apparently settings can change mid-line
-                nsamps = dset['location_{:d}'.format(location_num)]['datacapture_0']['echogram_0'].shape[0]
-                if nsamps > h5_data.snum:
-                    h5_data.data = np.vstack((h5_data.data, np.zeros((nsamps - h5_data.snum, h5_data.tnum))))
-                    h5_data.snum = nsamps
-                h5_data.data[:, location_num] = dset[
-                    'location_{:d}'.format(location_num)][
-                        'datacapture_0']['echogram_0']
-                if type(dset['location_{:d}'.format(location_num)][
-                    'datacapture_0']['echogram_0'].attrs[
-                        'GPS Cluster- MetaData_xml']) == str:
-                    gps_data = dset['location_{:d}'.format(location_num)][
-                        'datacapture_0']['echogram_0'].attrs[
-                            'GPS Cluster- MetaData_xml']
-                else:
-                    gps_data = dset['location_{:d}'.format(location_num)][
-                        'datacapture_0']['echogram_0'].attrs[
-                            'GPS Cluster- MetaData_xml'].decode('utf-8')
-                if (float(_xmlGetVal(gps_data, 'GPS Fix valid')) > 0) and (
-                        float(_xmlGetVal(gps_data, 'GPS Message ok')) > 0):
-                    # sometimes, there are bad entries that are unmarked
-                    try:
-                        lat[location_num] = float(_xmlGetVal(gps_data, 'Lat_N'))
-                        lon[location_num] = float(
-                            _xmlGetVal(gps_data, 'Long_ W'))
-                        time[location_num] = float(
-                            _xmlGetVal(gps_data, 'GPS_timestamp_UTC'))
-                        h5_data.elev[location_num] = float(
-                            _xmlGetVal(gps_data, 'Alt_asl_m'))
-                    except:
-                        lat[location_num] = np.nan
-                        lon[location_num] = np.nan
-                        time[location_num] = np.nan
-                        h5_data.elev[location_num] = np.nan
+                h5_data.data = np.zeros((h5_data.snum, h5_data.tnum), order='F')
+
+            digitizer_data = _attr_str(echograms[0].attrs['Digitizer-MetaData_xml'])
+            gps = np.zeros((h5_data.tnum, 4))
+            parsed = []
+            for start in range(0, h5_data.tnum, batchsize):
+                batch = echograms[start:start + batchsize]
+                if not lazy:
+                    read_echograms(batch, h5_data.data[:, start:start + len(batch)])
+                gps_xml = [_attr_str(echogram.attrs['GPS Cluster- MetaData_xml']) for echogram in batch]
+                if pool is not None:
+                    parsed.append((start, pool.map(_gps_from_xml, gps_xml)))
                 else:
-                    lat[location_num] = np.nan
-                    lon[location_num] = np.nan
-                    time[location_num] = np.nan
-                    h5_data.elev[location_num] = np.nan
+                    parsed.append((start, map(_gps_from_xml, gps_xml)))
+            for start, batch_gps in parsed:
+                batch_gps = list(batch_gps)
+                if len(batch_gps) > 0:
+                    gps[start:start + len(batch_gps), :] = batch_gps
+            lat, lon, time, h5_data.elev = [gps[:, i].copy() for i in range(4)]
 
             h5_data.dt = 1.0 / float(
                 _xmlGetVal(digitizer_data, ' Sample Rate'))
@@ -164,7 +320,10 @@ def load_bsi(fn_h5, nans=None, *args, **kwargs):
                 h5_data.lat = _dm2dec(lat[mask])
                 h5_data.long = -_dm2dec(lon[mask])
                 h5_data.elev = h5_data.elev[mask]
-                h5_data.data = h5_data.data[:, mask]
+                if lazy:
+                    h5_data.data = h5_data.data.subset(mask)
+                else:
+                    h5_data.data = h5_data.data[:, mask]
                 time = time[mask]
 
                 # Deal with this here in case tnum changed due to bad traces
@@ -202,4 +361,6 @@ def load_bsi(fn_h5, nans=None, *args, **kwargs):
             h5_data.chan = 0
             h5_data.check_attrs()
             h5_data_list.append(h5_data)
+    if pool is not None:
+        pool.shutdown()
     return h5_data_list
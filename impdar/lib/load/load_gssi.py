@@ -128,94 +128,176 @@ def _get_dzg_data(fn_dzg, trace_nums):
     return data
 
 
-def load_gssi(fn_dzt, *args, **kwargs):
-    """Return a RadarData object with the information from a gssi file
+# The header is in blocks of this many bytes
+MINHEADSIZE = 1024
+
+
+def read_dzt_header(fn_dzt):
+    """Read the parts of the header of a DZT file that ImpDAR uses.
+
+    Only the first block of the header is read.
+
+    Parameters
+    ----------
+    fn_dzt: str
+        The DZT file
 
-    This reader is has many commented-out liens to read everything from the GSSI header.
-    I left this in there the in the hopes that it will be useful to somebody,
-    but ImpDAR does not use all this information
+    Returns
+    -------
+    header: dict
+        snum, bits, trig, range, create (a datetime), chan, data_offset (bytes),
+        dtype (unsigned, little endian), and tnum (number of complete traces)
     """
-    dzt_data = RadarData(None)
-    dzt_data.fn = fn_dzt
     with open(fn_dzt, 'rb') as fid:
-        lines = fid.read()
+        lines = fid.read(MINHEADSIZE)
+        fid.seek(0, os.SEEK_END)
+        file_size = fid.tell()
     # tag = struct.unpack('<H', lines[0:2])[0]
-    # data = struct.unpack('<H', lines[2:4])[0]
-    dzt_data.snum = struct.unpack('<H', lines[4:6])[0]
-    bits = struct.unpack('<H', lines[6:8])[0]
-    n_bytes = bits // 8
-    if bits == 32:
-        us_dattype = 'I'
-        np_dtype = np.int32
-    elif bits == 16:
-        us_dattype = 'H'
-        np_dtype = np.int16
-    # if bits == 32:
-    #     s_dattype = 'i'
-    # elif bits == 16:
-    #     s_dattype = 'h'
-    # dzt_data.trig = struct.unpack('<h', lines[8:10])[0] * np.ones(dzt_data.tnum)
-    # sps = struct.unpack('<f', lines[10:14])[0]
-    # spm = struct.unpack('<f', lines[14:18])[0]
-    # mpm = struct.unpack('<f', lines[18:22])[0]
-    # position = struct.unpack('<f', lines[22:26])[0]
-    dzt_data.range = struct.unpack('<f', lines[26:30])[0]
-
-    # npass = struct.unpack('<h', lines[30:32])[0]
-    create_full = GSSITime(struct.unpack('<4s', lines[32:36])[0])
-    # modify_full = struct.unpack('<4s', lines[36:40])[0]
-    dzt_data.create = create_full.to_datetime()
-    # Modify = _to_date(modify_full)
-
-    # rgain = struct.unpack('<H', lines[40:42])[0]
-    # nrgain = struct.unpack('<H', lines[42:44])[0] + 2
-    # text = struct.unpack('<H', lines[44:46])[0]
-    # ntext = struct.unpack('<H', lines[46:48])[0]
-    # proc = struct.unpack('<H', lines[48:50])[0]
-    # nproc = struct.unpack('<H', lines[50:52])[0]
-    dzt_data.chan = struct.unpack('<H', lines[52:54])[0]
-    # epsr = struct.unpack('<f', lines[54:58])[0]
-    # top = struct.unpack('<f', lines[58:62])[0]
-    # depth = struct.unpack('<f', lines[62:66])[0]
-    # reserved = struct.unpack('<31c', lines[66:97])
-    # dtype = struct.unpack('<c', lines[97:98])[0]
-    # antname = struct.unpack('<14c', lines[98:112])
-    # chanmask = struct.unpack('<H', lines[112:114])[0]
-    # name = struct.unpack('<12c', lines[114:126])
-    # chksum = struct.unpack('<H', lines[126:128])[0]
-    # breaks = struct.unpack('<H', lines[rgain:rgain + 2])[0]
-    # Gainpoints = np.array(struct.unpack('<{:d}i'.format(nrgain),
-    #                    lines[rgain + 2:rgain + 2 + 4 * (nrgain)]))
-    # gain = 0
-    # if ntext != 0:
-    #     comments = struct.unpack('<{:d}s'.format(ntext),
-    #                              lines[130 + 2 * Gain: 130 + bytes * Gain + ntext])[0]
-    # else:
-    #     comments = ''
-    # if nproc != 0:
-    #     proccessing = struct.unpack('<{:d}s'.format(nproc),
-    #               lines[130 + bytes * Gain + ntext:130 + bytes * Gain + ntext + nproc])[0]
-    # else:
-    #     processing = ''
-    try:
-        header_len = 32768*n_bytes # TODO: David originally had this as 36*4096, we still need to figure out when it changes
-        try:
-            data = np.array(struct.unpack('<{:d}'.format((len(lines) - header_len) // n_bytes) + us_dattype, lines[header_len:]), dtype=np_dtype).reshape((dzt_data.snum, -1), order='F')
-        except OverflowError:
-            # This is needed on Windows for some reason--I think if OS is 32 bit?
-            data = np.array(struct.unpack('<{:d}'.format((len(lines) - header_len) // n_bytes) + us_dattype, lines[header_len:]), dtype=np.int64).reshape((dzt_data.snum, -1), order='F')
-    except IndexError:
-        header_len = 512*n_bytes
-        data = np.array(struct.unpack('<{:d}'.format((len(lines) - header_len) // n_bytes) + us_dattype, lines[header_len:]), dtype=np_dtype).reshape((dzt_data.snum, -1), order='F')
+    rh_data = struct.unpack('<H', lines[2:4])[0]
+    header = {'snum': struct.unpack('<H', lines[4:6])[0],
+              'bits': struct.unpack('<H', lines[6:8])[0],
+              'trig': struct.unpack('<h', lines[8:10])[0],
+              # sps = struct.unpack('<f', lines[10:14])[0]
+              # spm = struct.unpack('<f', lines[14:18])[0]
+              # mpm = struct.unpack('<f', lines[18:22])[0]
+              # position = struct.unpack('<f', lines[22:26])[0]
+              'range': struct.unpack('<f', lines[26:30])[0],
+              # npass = struct.unpack('<h', lines[30:32])[0]
+              'create': GSSITime(struct.unpack('<4s', lines[32:36])[0]).to_datetime(),
+              # modify_full = struct.unpack('<4s', lines[36:40])[0]
+              # rgain = struct.unpack('<H', lines[40:42])[0]
+              # nrgain = struct.unpack('<H', lines[42:44])[0] + 2
+              # text = struct.unpack('<H', lines[44:46])[0]
+              # ntext = struct.unpack('<H', lines[46:48])[0]
+              # proc = struct.unpack('<H', lines[48:50])[0]
+              # nproc = struct.unpack('<H', lines[50:52])[0]
+              'chan': struct.unpack('<H', lines[52:54])[0],
+              # epsr = struct.unpack('<f', lines[54:58])[0]
+              # top = struct.unpack('<f', lines[58:62])[0]
+              # depth = struct.unpack('<f', lines[62:66])[0]
+              # antname = struct.unpack('<14c', lines[98:112])
+              }
+    if header['bits'] == 32:
+        header['dtype'] = np.dtype('<u4')
+    elif header['bits'] == 16:
+        header['dtype'] = np.dtype('<u2')
+    elif header['bits'] == 8:
+        header['dtype'] = np.dtype('u1')
+    else:
+        raise ValueError('Cannot read {:d}-bit GSSI data'.format(header['bits']))
+
+    # rh_data is the number of header blocks if it is small, otherwise each channel has a block
+    if rh_data < MINHEADSIZE:
+        header['data_offset'] = MINHEADSIZE * rh_data
+    else:
+        header['data_offset'] = MINHEADSIZE * header['chan']
+    trace_bytes = header['snum'] * header['dtype'].itemsize
+    header['tnum'] = max(file_size - header['data_offset'], 0) // trace_bytes
+    return header
+
+
+def dzt_samples(fn_dzt, header=None, mode='c'):
+    """Memory-map the samples of a DZT file, without reading or decoding them.
+
+    Parameters
+    ----------
+    fn_dzt: str
+        The DZT file
+    header: dict, optional
+        The output of :func:`read_dzt_header`, if already read
+    mode: str, optional
+        Mode for np.memmap. Default is 'c' (copy on write), so changes are not saved.
+
+    Returns
+    -------
+    np.memmap
+        snum x tnum array of the unsigned samples as they are stored
+    """
+    if header is None:
+        header = read_dzt_header(fn_dzt)
+    return np.memmap(fn_dzt, dtype=header['dtype'], mode=mode, offset=header['data_offset'],
+                     shape=(header['snum'], header['tnum']), order='F')
+
+
+def read_traces(fn_dzt, start=0, end=None, dtype=np.float64, header=None):
+    """Read and convert a range of traces from a DZT file.
+
+    Only the requested traces are read from disk.
+
+    Parameters
+    ----------
+    fn_dzt: str
+        The DZT file
+    start: int, optional
+        First trace to read. Default 0.
+    end: int, optional
+        End (exclusive) of the traces to read. Default is the last trace.
+    dtype: np.dtype, optional
+        Output dtype. Default float64.
+    header: dict, optional
+        The output of :func:`read_dzt_header`, if already read
+
+    Returns
+    -------
+    np.ndarray
+        snum x (end - start) array
+    """
+    data = np.array(_signed_samples(dzt_samples(fn_dzt, header=header)[:, start:end]), dtype=dtype)
+    # The first two samples are not data, so copy the third like load_gssi does
     data[0, :] = data[2, :]
     data[1, :] = data[2, :]
+    return data
+
+
+def _signed_samples(samples):
+    """View the stored samples as signed ints, as ImpDAR has always read them, without a copy."""
+    return samples.view(np.dtype('<i{:d}'.format(samples.dtype.itemsize)))
+
+
+def load_gssi(fn_dzt, *args, memmap=False, **kwargs):
+    """Return a RadarData object with the information from a gssi file
+
+    The header is parsed once, and the samples are read straight into an array
+    of the stored type. ImpDAR does not use all the information in the header;
+    the unused fields are left as comments in :func:`read_dzt_header` in the
+    hopes that they will be useful to somebody.
+
+    Parameters
+    ----------
+    fn_dzt: str
+        The DZT file
+    memmap: bool, optional
+        Leave the samples on disk, as a copy-on-write np.memmap.
+        This is much faster and lighter for large files, and blocks of traces are
+        only read (and can be converted to float) when they are used,
+        e.g. by :func:`read_blocks <impdar.lib.streaming.read_blocks>` or :func:`read_traces`.
+        The first two samples of each trace are left as they are stored, since
+        replacing them would touch the whole file. Default False.
+    """
+    dzt_data = RadarData(None)
+    dzt_data.fn = fn_dzt
+    header = read_dzt_header(fn_dzt)
+    dzt_data.snum = header['snum']
+    dzt_data.range = header['range']
+    dzt_data.create = header['create']
+    dzt_data.chan = header['chan']
+
+    if memmap:
+        data = _signed_samples(dzt_samples(fn_dzt, header=header))
+    else:
+        with open(fn_dzt, 'rb') as fid:
+            data = np.fromfile(fid, dtype=header['dtype'], count=header['snum'] * header['tnum'],
+                               offset=header['data_offset'])
+        data = _signed_samples(data.reshape((header['snum'], header['tnum']), order='F'))
+        data[0, :] = data[2, :]
+        data[1, :] = data[2, :]
     # data = data + dzt_data.trig
     dzt_data.data = data
 
     dzt_data.tnum = dzt_data.data.shape[1]
     dzt_data.trace_num = np.arange(dzt_data.data.shape[1]) + 1
     dzt_data.trig_level = 0.
-    dzt_data.trig = struct.unpack('<h', lines[8:10])[0] * np.ones(dzt_data.tnum)
+    dzt_data.trig = header['trig'] * np.ones(dzt_data.tnum)
 
     dzt_data.pressure = np.zeros((dzt_data.tnum, ))
     dzt_data.flags = RadarFlags()
@@ -29,14 +29,116 @@ except ImportError:
 
 
 
-def load_mcords_nc(fn):
+class DecibelView:
+    """10 log10 of radar data, computed only for the part that is indexed.
+
+    Indexing (e.g. ``db[:, 100:200]``) returns a new array in dB, and np.asarray
+    converts everything. The underlying data are left alone.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        The linear data
+    """
+
+    ndim = 2
+
+    def __init__(self, data):
+        self.data = data
+
+    @property
+    def shape(self):
+        """Same as the data."""
+        return self.data.shape
+
+    @property
+    def dtype(self):
+        """Floating point type of the result."""
+        return np.result_type(self.data.dtype, np.float32) if np.issubdtype(
+            self.data.dtype, np.inexact) else np.dtype(np.float64)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        return 10. * np.log10(np.asarray(self.data[key], dtype=self.dtype))
+
+    def __array__(self, dtype=None, copy=None):
+        out = self[:, :]
+        if dtype is not None:
+            out = out.astype(dtype)
+        return out
+
+
+def select_traces(lat, lon, traces=None, bbox=None):
+    """Get the range of traces to read from a profile.
+
+    Parameters
+    ----------
+    lat: np.ndarray
+        Latitude of every trace
+    lon: np.ndarray
+        Longitude of every trace
+    traces: slice or 2-tuple, optional
+        Range of traces (start, end), with python indexing. Default is all of them.
+    bbox: 4-tuple, optional
+        (lon_min, lat_min, lon_max, lat_max). We keep from the first to the last trace
+        in the box (within traces, if given).
+
+    Returns
+    -------
+    slice
+        The contiguous range of traces to read
+    """
+    tnum = len(lat)
+    if traces is None:
+        traces = slice(None)
+    elif not isinstance(traces, slice):
+        traces = slice(*traces)
+    start, stop, _ = traces.indices(tnum)
+    if bbox is not None:
+        lon_min, lat_min, lon_max, lat_max = bbox
+        lat = np.asarray(lat)
+        lon = np.asarray(lon)
+        inside = (lon >= lon_min) & (lon <= lon_max) & (lat >= lat_min) & (lat <= lat_max)
+        inside[:start] = False
+        inside[stop:] = False
+        inside = np.flatnonzero(inside)
+        if len(inside) == 0:
+            raise ValueError('No traces are inside the bounding box')
+        start, stop = inside[0], inside[-1] + 1
+    if stop <= start:
+        raise ValueError('No traces selected')
+    return slice(int(start), int(stop))
+
+
+def _to_db(data):
+    """Convert to 10 log10 in place if we can, without promoting float32."""
+    if not np.issubdtype(data.dtype, np.inexact):
+        data = data.astype(np.float64)
+    np.log10(data, out=data)
+    data *= 10.
+    return data
+
+
+def load_mcords_nc(fn, traces=None, bbox=None, db=False):
     """
     Load MCoRDS data as netcdf downloaded from the NSIDC
 
+    Only the selected traces of the amplitude are read, and they are left in the
+    type of the file (masked values become NaN).
+
     Parameters
     ----------
     fn_nc: str
         The filename to load
+    traces: slice or 2-tuple, optional
+        Range of traces (start, end) to load. Default is all of them.
+    bbox: 4-tuple, optional
+        (lon_min, lat_min, lon_max, lat_max). Load from the first to the last trace in the box.
+    db: bool, optional
+        Convert the amplitude to dB. Otherwise (the default), the data are left as is
+        and a lazily evaluated dB view is attached as db.
     """
 
     mcords_data = RadarData(None)
@@ -45,13 +147,24 @@ def load_mcords_nc(fn):
     if not NC:
         raise ImportError('Cannot load MCoRDS without netcdf4')
     dst = Dataset(fn, 'r')
-    mcords_data.data = dst.variables['amplitude'][:].T
-    mcords_data.long = dst.variables['lon'][:]
-    mcords_data.lat = dst.variables['lat'][:]
+    sel = select_traces(dst.variables['lat'][:], dst.variables['lon'][:], traces=traces, bbox=bbox)
+
+    # Avoid the copies from masking: just read the hyperslab, and NaN any fill in place
+    amplitude = dst.variables['amplitude']
+    amplitude.set_auto_mask(False)
+    mcords_data.data = amplitude[sel, :].T
+    if hasattr(amplitude, '_FillValue') and np.issubdtype(mcords_data.data.dtype, np.inexact):
+        mcords_data.data[mcords_data.data == amplitude._FillValue] = np.nan
+    if db:
+        mcords_data.data = _to_db(mcords_data.data)
+    else:
+        mcords_data.db = DecibelView(mcords_data.data)
+    mcords_data.long = dst.variables['lon'][sel]
+    mcords_data.lat = dst.variables['lat'][sel]
 
     # time has units of seconds according to documentation, but this seems wrong
     # numbers are way too big. Leaving it since that is how it is documented though?
-    partial_days = dst.variables['time'][:] / (24. * 60. * 60.)
+    partial_days = dst.variables['time'][sel] / (24. * 60. * 60.)
     start_day = datetime.datetime(int(dst.variables['time'].units[14:18]),
                                   int(dst.variables['time'].units[19:21]),
                                   int(dst.variables['time'].units[22:24])).toordinal() + 366.
@@ -59,13 +172,12 @@ def load_mcords_nc(fn):
     mcords_data.trace_int = mcords_data.decday[1] - mcords_data.decday[0]
     mcords_data.travel_time = dst.variables['fasttime'][:]
     mcords_data.dt = np.mean(np.diff(mcords_data.travel_time)) * 1.0e-6
-    size = dst.variables['amplitude'].matlab_size
-    mcords_data.tnum, mcords_data.snum = int(size[1]), int(size[0])
+    mcords_data.snum, mcords_data.tnum = mcords_data.data.shape
     mcords_data.trace_num = np.arange(mcords_data.tnum) + 1
 
     mcords_data.chan = 0
-    mcords_data.pressure = np.zeros_like(dst.variables['lat'][:])
-    mcords_data.trig = np.zeros_like(dst.variables['lat'][:]).astype(int)
+    mcords_data.pressure = np.zeros_like(mcords_data.lat)
+    mcords_data.trig = np.zeros_like(mcords_data.lat).astype(int)
     mcords_data.trig_level = 0.
 
     mcords_data.check_attrs()
@@ -73,14 +185,23 @@ def load_mcords_nc(fn):
     return mcords_data
 
 
-def load_mcords_mat(fn_mat):
+def load_mcords_mat(fn_mat, traces=None, bbox=None, db=True):
     """
     Load MCoRDS data as .mat format downloaded from the CReSIS ftp client
 
+    For v7.3 (hdf5) files, only the selected traces are read.
+
     Parameters
     ----------
     fn_mat: str
         The filename to load
+    traces: slice or 2-tuple, optional
+        Range of traces (start, end) to load. Default is all of them.
+    bbox: 4-tuple, optional
+        (lon_min, lat_min, lon_max, lat_max). Load from the first to the last trace in the box.
+    db: bool, optional
+        Convert the data to dB (in place), as is usual for ImpDAR. Default True.
+        Otherwise the data are left as is and a lazily evaluated dB view is attached as db.
     """
 
     mcords_data = RadarData(None)
@@ -88,23 +209,40 @@ def load_mcords_mat(fn_mat):
 
     try:
         mat = loadmat(fn_mat)
-    except:
-        mat = h5py.File('AR_20140424_03_018.mat', 'r')
+    except NotImplementedError:
+        if not H5:
+            raise ImportError('You need h5py to load v7.3 mat files')
+        mat = h5py.File(fn_mat, 'r')
 
     if ('Data' not in mat) or ('Longitude' not in mat):
         if ('data' in mat) and ('long' in mat):
             raise KeyError('It appears that this mat file is ImpDAR/StoDeep, not MCoRDS')
         else:
             raise KeyError('ImpDAR cannot read this type of mat file--it does not appear to be MCoRDS')
-    mcords_data.data = 10.*np.log10(np.squeeze(mat['Data']))
-    mcords_data.long = np.squeeze(mat['Longitude'])
-    mcords_data.lat = np.squeeze(mat['Latitude'])
+    lon = np.squeeze(mat['Longitude'])
+    lat = np.squeeze(mat['Latitude'])
+    sel = select_traces(lat, lon, traces=traces, bbox=bbox)
+    mcords_data.long = lon[sel]
+    mcords_data.lat = lat[sel]
+
     # sometimes the mcords data array is transposed, so check and fix
-    if np.shape(mcords_data.data)[1] != np.shape(mcords_data.lat) and np.shape(mcords_data.data)[0] == np.shape(mcords_data.lat)[0]:
-        mcords_data.data = np.transpose(mcords_data.data)
+    # (h5py gives us the transpose of what matlab sees). Slicing an h5py dataset only reads the selection.
+    data = mat['Data']
+    if data.shape[0] == len(lat):
+        mcords_data.data = data[sel, :].T
+    else:
+        mcords_data.data = data[:, sel]
+    if isinstance(mat, dict) and (sel.stop - sel.start < len(lat)):
+        # Let go of the rest of the profile
+        mcords_data.data = mcords_data.data.copy()
+    if db:
+        mcords_data.data = _to_db(mcords_data.data)
+    else:
+        mcords_data.db = DecibelView(mcords_data.data)
+
     # time has units of seconds according to documentation, but this seems wrong
     # numbers are way too big. Leaving it since that is how it is documented though?
-    partial_days = np.squeeze(mat['GPS_time']) / (24. * 60. * 60.)
+    partial_days = np.squeeze(mat['GPS_time'])[sel] / (24. * 60. * 60.)
     start_day = datetime.datetime(1970,1,1,0,0,0).toordinal() + 366.
     mcords_data.decday = partial_days + start_day
     mcords_data.trace_int = mcords_data.decday[1] - mcords_data.decday[0]
@@ -119,6 +257,7 @@ def load_mcords_mat(fn_mat):
     mcords_data.trig = np.zeros_like(mcords_data.decday).astype(int)
     mcords_data.trig_level = 0.
     mcords_data.check_attrs()
+    if not isinstance(mat, dict):
+        mat.close()
 
     return mcords_data
-
@@ -199,16 +199,132 @@ class Channel:
         self.offset = offset
 
 
+# Length of the marker information that follows the header of a marker record
+MARKER_LEN = 38
+
+
+def trace_header_dtype(version):
+    """Get the layout of the header of each trace record for a file version.
+
+    Parameters
+    ----------
+    version: float
+        SInfo.version
+
+    Returns
+    -------
+    np.dtype
+        Packed, little-endian structured dtype
+    """
+    fields = [('header_type', 'u1'),
+              ('reserved', 'u1'),
+              # Trace number in file set
+              ('n_trace', '<i4'),
+              # Decimal day from 1 Jan 1970.
+              ('time', '<f8'),
+              # Stacks/trace unless record mode is stacks, when it is time/trace
+              ('trace_interval', '<f4'),
+              # Trigger level in percentage of input range in mV
+              ('trigger_level', '<u2')]
+    if version < 3.21:
+        # Odometer and pressure gauge (0 if not used)
+        fields += [('odometer', '<f4'), ('pressure', '<f4')]
+    fields += [('lat', '<f8'), ('long', '<f8'), ('altitude', '<f4'), ('gps_resolution', '<f4')]
+    # Blank bytes (Only needed for pre 3.6 version)
+    if version < 3.2:
+        fields.append(('blank', 'V12'))
+    elif version < 3.6:
+        fields.append(('blank', 'V14'))
+    return np.dtype(fields)
+
+
+def trace_dtype(sinfo):
+    """Get the layout of a radar trace record: the header then snum int16 samples."""
+    return np.dtype(trace_header_dtype(sinfo.version).descr + [('data', '<i2', (sinfo.snum, ))])
+
+
+def scan_records(lines, sinfo):
+    """Find the start of every record after the header, and its type.
+
+    Data records (type 0) have a fixed length, so we check the type of whole runs
+    of them at once, and only step through comments/markers one at a time.
+
+    Parameters
+    ----------
+    lines: bytes
+        The binary data
+    sinfo: SInfo
+        The overall collection info
+
+    Returns
+    -------
+    offsets: np.ndarray
+        Byte offset of each record, in order
+    types: np.ndarray
+        Header type of each record (0 for radar data, 1 for markers)
+    """
+    buf = np.frombuffer(lines, dtype=np.uint8)
+    header_len = trace_header_dtype(sinfo.version).itemsize
+    data_len = trace_dtype(sinfo).itemsize
+    offsets = []
+    types = []
+    pos = sinfo.offset
+    while pos + header_len <= len(buf):
+        n_fit = (len(buf) - pos) // data_len
+        run = pos + data_len * np.arange(n_fit)
+        not_data = np.flatnonzero(buf[run] != 0)
+        n_data = not_data[0] if len(not_data) > 0 else n_fit
+        offsets.append(run[:n_data])
+        types.append(np.zeros((n_data, ), dtype=np.uint8))
+        pos += n_data * data_len
+        if pos + header_len > len(buf) or buf[pos] == 0:
+            # Done, or a data record that was cut off
+            break
+        offsets.append(np.array([pos]))
+        types.append(np.array([buf[pos]], dtype=np.uint8))
+        pos += header_len + (MARKER_LEN if buf[pos] == 1 else 0)
+    if len(offsets) == 0:
+        return np.zeros((0, ), dtype=int), np.zeros((0, ), dtype=np.uint8)
+    return np.hstack(offsets), np.hstack(types)
+
+
+def read_records(lines, sinfo, offsets):
+    """Get the data records at some offsets as a structured array.
+
+    Parameters
+    ----------
+    lines: bytes
+        The binary data
+    sinfo: SInfo
+        The overall collection info
+    offsets: np.ndarray
+        Byte offsets of the records
+
+    Returns
+    -------
+    np.ndarray
+        Records with dtype :func:`trace_dtype`
+    """
+    dtype = trace_dtype(sinfo)
+    if len(offsets) == 0:
+        return np.zeros((0, ), dtype=dtype)
+    if np.all(np.diff(offsets) == dtype.itemsize):
+        # All evenly spaced, so we just need a view of the file
+        return np.frombuffer(lines, dtype=dtype, count=len(offsets), offset=int(offsets[0]))
+    buf = np.frombuffer(lines, dtype=np.uint8)
+    return buf[offsets[:, None] + np.arange(dtype.itemsize)[None, :]].copy().view(dtype).flatten()
+
+
 class ChannelData:
     """Full data for radar channel."""
 
-    def __init__(self, lines, sinfo):
-        """Read in binary data.
+    def __init__(self, records, sinfo):
+        """Get the data out of the trace records.
 
         Parameters
         ----------
-        lines: bytes
-            the binary data
+        records: np.ndarray
+            the records for this channel, with dtype :func:`trace_dtype`
         sinfo: SInfo
             information needed to make sense of the binary data
         """
@@ -217,183 +333,130 @@ class ChannelData:
                                      (sinfo.post_trigger_depth)
                                      ) * 1. / sinfo.samp_freq
 
-        # I am going to preallocate because I think it should be possible
-        # This is not actually true since we could have comments
-        self.n_trace = np.zeros((sinfo.tnum, ))
-        self.time = np.zeros((sinfo.tnum, ))
-        self.trace_interval = np.zeros((sinfo.tnum, ))
-        self.trigger_level = np.zeros((sinfo.tnum, ))
-        self.lat = np.zeros((sinfo.tnum, ))
-        self.long = np.zeros((sinfo.tnum, ))
-        self.altitude = np.zeros((sinfo.tnum, ))
-        self.gps_resolution = np.zeros((sinfo.tnum, ))
-        self.data = np.zeros((sinfo.snum, sinfo.tnum))
+        self.n_trace = records['n_trace'].astype(float)
+        # We add an offset to 1 Jan 1970 to get MATLAB date numbers
+        self.time = records['time'] + datetime.date.toordinal(datetime.date(1970, 1, 1)) + 366.
+        self.trace_interval = records['trace_interval'].astype(float)
+        self.trigger_level = records['trigger_level'].astype(float)
+        self.lat = records['lat'].astype(float)
+        self.long = records['long'].astype(float)
+        self.altitude = records['altitude'].astype(float)
+        self.gps_resolution = records['gps_resolution'].astype(float)
+        self.data = records['data'].transpose().astype(float)
 
         # These will often be empty, but leave here so we don't have missing attributes
-        self.odometer = np.zeros((sinfo.tnum, ))
-        self.pressure = np.zeros((sinfo.tnum, ))
+        if sinfo.version < 3.21:
+            self.odometer = records['odometer'].astype(float)
+            self.pressure = records['pressure'].astype(float)
+        else:
+            self.odometer = np.zeros((len(records), ))
+            self.pressure = np.zeros((len(records), ))
 
-    def read_trace(self, lines, sinfo, n_trc):
-        """Ingest binary trace information
 
-        Parameters
-        ----------
-        lines: bytes
-            The binary data
-        sinfo: SInfo
-            The overall collection info
-        n_trc: int
-            The trace under consideration
-        """
-        n_header_type = struct.unpack('<B', lines[sinfo.offset: sinfo.offset + 1])[0]
+def read_gecko(fn):
+    """Read every channel of a gecko file.
 
-        # I'm rolling with a separate offset counter so i can work on guessing at tnum
-        offset = 2
+    Parameters
+    ----------
+    fn: str
+        The file to read
 
-        # Trace number in file set
-        self.n_trace[n_trc] = struct.unpack('<i', lines[sinfo.offset + offset:
-                                                        sinfo.offset + offset + 4])[0]
-        offset += 4
+    Returns
+    -------
+    sinfo: SInfo
+        The overall collection info
+    channels: list of ChannelData
+        The radar data of each channel. Comments and markers are left out.
+    """
+    with io.open(fn, 'rb') as fid:
+        lines = fid.read()
 
-        # Decimal day from 1 Jan 1970.
-        n_time = struct.unpack('<d', lines[sinfo.offset + offset:sinfo.offset + offset + 8])[0]
-        offset += 8
-        # We add an offset to 1 Jan 1970 to get MATLAB date numbers
-        self.time[n_trc] = n_time + datetime.date.toordinal(datetime.date(1970, 1, 1)) + 366.
+    # Header information
+    sinfo = SInfo(lines)
 
-        # Stacks/trace unless record mode is stacks, when it is
-        # time/trace
-        self.trace_interval[n_trc] = struct.unpack('<f', lines[sinfo.offset + offset:
-                                                               sinfo.offset + offset + 4])[0]
-        offset += 4
-
-        # Trigger level in percentage of input range in mV
-        self.trigger_level[n_trc] = struct.unpack('<H', lines[sinfo.offset + offset:
-                                                              sinfo.offset + offset + 2])[0]
-        offset += 2
-
-        if sinfo.version < 3.21:
-            # Odometer readings (0 if no Odometer is used)
-            self.odometer[n_trc] = struct.unpack('<f', lines[sinfo.offset + offset:
-                                                             sinfo.offset + offset + 4])[0]
-            offset += 4
-
-            # Pressure gauge (0 if no pressure gauge is used)
-            self.pressure[n_trc] = struct.unpack('<f', lines[sinfo.offset + offset:
-                                                             sinfo.offset + offset + 4])[0]
-            offset += 4
-
-        # GPS Latitude
-        self.lat[n_trc] = struct.unpack('<d', lines[sinfo.offset + offset:
-                                                    sinfo.offset + offset + 8])[0]
-        offset += 8
-
-        # GPS longitude
-        self.long[n_trc] = struct.unpack('<d', lines[sinfo.offset + offset:
-                                                     sinfo.offset + offset + 8])[0]
-        offset += 8
-
-        # GPS altitude
-        self.altitude[n_trc] = struct.unpack('<f', lines[sinfo.offset + offset:
-                                                         sinfo.offset + offset + 4])[0]
-        offset += 4
-
-        # GPS accuracy
-        self.gps_resolution[n_trc] = struct.unpack('<f', lines[sinfo.offset + offset:
-                                                               sinfo.offset + offset + 4])[0]
-        offset += 4
-
-        # Read and toss last blank bytes
-        # (Only needed for pre 3.6 version)
-        if sinfo.version < 3.6:
-            if sinfo.version < 3.2:
-                offset += 12
-            else:
-                offset += 14
-
-        # If it is actual radar data, not a comment or marker
-        if n_header_type == 0:
-            # Read the trace data
-            newdata = struct.unpack('<{:d}h'.format(sinfo.snum),
-                                    lines[sinfo.offset + offset:
-                                          sinfo.offset + offset + 2 * sinfo.snum])
-            offset += 2 * sinfo.snum
-            # Store data
-            # Total number of data points
-            self.data[:, n_trc] = newdata
-        elif n_header_type == 1:
-            # Toss marker information
-            offset += 38
-
-        sinfo.offset += offset
+    # Records cycle through the channels
+    offsets, types = scan_records(lines, sinfo)
+    channels = []
+    for i in range(sinfo.n_channels):
+        chan_offsets = offsets[i::sinfo.n_channels][types[i::sinfo.n_channels] == 0]
+        channels.append(ChannelData(read_records(lines, sinfo, chan_offsets), sinfo))
+    return sinfo, channels
 
 
 def load_olaf(fns_olaf, channel=1):
-    """Read data from a gecko recording"""
-    olaf_data = RadarData(None)
+    """Read data from a gecko recording
+
+    Parameters
+    ----------
+    fns_olaf: str or list of str
+        The file(s) to read. Multiple files are concatenated in order of their start time.
+    channel: int or list of int, optional
+        The receiver channel to load. Default 1.
+        If a list, all those channels are read at once and a list of RadarData is returned.
+    """
+    if hasattr(channel, '__len__'):
+        channels = list(channel)
+    else:
+        channels = [channel]
+
     # We want to be able to use this step concatenate a series of files numbered by the controller
     if isinstance(fns_olaf, str):
         fns_olaf = [fns_olaf]
-        olaf_data.fn = fns_olaf[0]
+        fn = fns_olaf[0]
     else:
-        olaf_data.fn = common_start(fns_olaf).rstrip('[')
+        fn = common_start(fns_olaf).rstrip('[')
 
     sinfo = []
-    stacks = []
-    for i, fn_i in enumerate(fns_olaf):
+    all_stacks = []
+    for fn_i in fns_olaf:
         # We are going to follow the general format that was used by storead_script_v36
-        with io.open(fn_i, 'rb') as fid:
-            lines = fid.read()
-
-        # Header information
-        sinfo.append(SInfo(lines))
-
-        # Data is stored per trace. Make a container
-        s_i = [ChannelData(lines, sinfo[i]) for j in range(sinfo[i].n_channels)]
-
-        # Read trace-by-trace, channel-by-channel
-        for n_trc in range(sinfo[i].tnum):
-            try:
-                for s_j in s_i:
-                    s_j.read_trace(lines, sinfo[i], n_trc)
-            except:
-                continue
-
-        stacks.append(s_i[channel - 1])
+        sinfo_i, channel_data = read_gecko(fn_i)
+        sinfo.append(sinfo_i)
+        all_stacks.append(channel_data)
 
     # I don't know if we actually want to do this, but the filenaming scheme is wacky and this
     # will make any logical collection look good
     sort_idx = np.argsort(np.array([(lambda x: x.serialtime)(s) for s in sinfo]))
     sinfo = [sinfo[i] for i in sort_idx]
-    stacks = [stacks[i] for i in sort_idx]
-
-    # Data and things we derive from it
-    olaf_data.chan = channel
-    olaf_data.data = np.hstack([s_i.data for s_i in stacks])
-    olaf_data.snum = olaf_data.data.shape[0]
-    olaf_data.tnum = olaf_data.data.shape[1]
-    olaf_data.trace_num = np.arange(olaf_data.tnum) + 1
-
-    # Now merge the data into the normal format
-    olaf_data.dt = 1. / sinfo[0].samp_freq
-    olaf_data.fns_in = sinfo[0].fn_in
-    olaf_data.ant_sep = sinfo[0].antenna_separation
-    olaf_data.freq = sinfo[0].nominal_frequency
-    olaf_data.travel_time = stacks[0].travel_time * 1.0e6
-    olaf_data.trig_level = stacks[0].trigger_level
-    olaf_data.trig = sinfo[0].pre_trigger_depth * np.ones(olaf_data.tnum)
-    olaf_data.fnames = [si.fn_in for si in sinfo]
-
-    # Other variables that need concatenating
-    olaf_data.decday = np.hstack([s_i.time for s_i in stacks])
-    olaf_data.elev = np.hstack([s_i.altitude for s_i in stacks])
-    olaf_data.lat = np.hstack([s_i.lat for s_i in stacks])
-    olaf_data.long = np.hstack([s_i.long for s_i in stacks])
-    olaf_data.trace_int = np.hstack([s_i.trace_interval for s_i in stacks])
-    olaf_data.pressure = np.hstack([s_i.pressure for s_i in stacks])
-    try:
-        olaf_data.get_projected_coords()
-    except ImportError:
-        pass
-    olaf_data.check_attrs()
-    return olaf_data
+    all_stacks = [all_stacks[i] for i in sort_idx]
+
+    out = []
+    for chan in channels:
+        olaf_data = RadarData(None)
+        olaf_data.fn = fn
+        stacks = [s_i[chan - 1] for s_i in all_stacks]
+
+        # Data and things we derive from it
+        olaf_data.chan = chan
+        olaf_data.data = np.hstack([s_i.data for s_i in stacks])
+        olaf_data.snum = olaf_data.data.shape[0]
+        olaf_data.tnum = olaf_data.data.shape[1]
+        olaf_data.trace_num = np.arange(olaf_data.tnum) + 1
+
+        # Now merge the data into the normal format
+        olaf_data.dt = 1. / sinfo[0].samp_freq
+        olaf_data.fns_in = sinfo[0].fn_in
+        olaf_data.ant_sep = sinfo[0].antenna_separation
+        olaf_data.freq = sinfo[0].nominal_frequency
+        olaf_data.travel_time = stacks[0].travel_time * 1.0e6
+        olaf_data.trig_level = np.hstack([s_i.trigger_level for s_i in stacks])
+        olaf_data.trig = sinfo[0].pre_trigger_depth * np.ones(olaf_data.tnum)
+        olaf_data.fnames = [si.fn_in for si in sinfo]
+
+        # Other variables that need concatenating
+        olaf_data.decday = np.hstack([s_i.time for s_i in stacks])
+        olaf_data.elev = np.hstack([s_i.altitude for s_i in stacks])
+        olaf_data.lat = np.hstack([s_i.lat for s_i in stacks])
+        olaf_data.long = np.hstack([s_i.long for s_i in stacks])
+        olaf_data.trace_int = np.hstack([s_i.trace_interval for s_i in stacks])
+        olaf_data.pressure = np.hstack([s_i.pressure for s_i in stacks])
+        try:
+            olaf_data.get_projected_coords()
+        except ImportError:
+            pass
+        olaf_data.check_attrs()
+        out.append(olaf_data)
+
+    if hasattr(channel, '__len__'):
+        return out
+    return out[0]
@@ -25,6 +25,80 @@ from ..RadarData import RadarData
 from ..RadarFlags import RadarFlags
 
 
+# Each trace record starts with 25 floats and a 28 character comment
+HEADER_LEN = 25 * 4 + 28
+SAMPLE_TYPES = {'1.0': '<i2', '1.5.340': '<f4'}
+
+# Number of traces to remove the DC offset from at once
+DC_CHUNKSIZE = 4096
+
+
+def trace_dtype(version, snum):
+    """Get the layout of a trace record in a .DT1 file.
+
+    Parameters
+    ----------
+    version: str
+        1.0 (int16 samples) or 1.5.340 (float32 samples)
+    snum: int
+        Number of samples per trace
+
+    Returns
+    -------
+    np.dtype
+        Structured dtype with header, comment, and data fields
+    """
+    if version not in SAMPLE_TYPES:
+        raise ValueError('Unknown pulse ekko version {:s}'.format(str(version)))
+    return np.dtype([('header', '<f4', (25, )),
+                     ('comment', 'u1', (28, )),
+                     ('data', SAMPLE_TYPES[version], (snum, ))])
+
+
+def read_dt1(fn_dt1, version, snum, tnum):
+    """Map the trace records of a .DT1 file.
+
+    Parameters
+    ----------
+    fn_dt1: str
+        The data file
+    version: str
+        1.0 or 1.5.340
+    snum: int
+        Number of samples per trace
+    tnum: int
+        Number of traces in the header. Fewer are returned if the file is short.
+
+    Returns
+    -------
+    records: np.memmap
+        tnum records with dtype :func:`trace_dtype`, read only
+    """
+    dtype = trace_dtype(version, snum)
+    n_rec = min(tnum, os.path.getsize(fn_dt1) // dtype.itemsize)
+    if n_rec == 0:
+        return np.zeros((0, ), dtype=dtype)
+    return np.memmap(fn_dt1, dtype=dtype, mode='r', shape=(n_rec, ))
+
+
+def remove_dc(samples, out, chunksize=DC_CHUNKSIZE):
+    """Copy traces into out, less the mean of their first 100 samples.
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        tnum x snum samples, as stored in the file
+    out: np.ndarray
+        snum x tnum array to fill
+    chunksize: int, optional
+        Number of traces to do at once, to bound the memory used
+    """
+    for start in range(0, samples.shape[0], chunksize):
+        block = samples[start:start + chunksize, :].astype(np.float64).transpose()
+        out[:, start:start + block.shape[1]] = block - np.nanmean(block[:100, :], axis=0)
+    return out
+
+
 class TraceHeaders:
     """Class used internally to handle pulse-ekko headers."""
 
@@ -75,6 +149,34 @@ class TraceHeaders:
         self.comment[self.header_index] = str(comment[0])
         self.header_index += 1
 
+    def set_headers(self, headers, comments):
+        """Set the header information for all traces at once.
+
+        Parameters
+        ----------
+        headers: np.ndarray
+            tnum x 25 array of the header floats
+        comments: np.ndarray
+            tnum x 28 array of the comment bytes
+        """
+        n_trace = headers.shape[0]
+        self.trace_numbers[0, :n_trace] = headers[:, 0]
+        self.positions[0, :n_trace] = headers[:, 1]
+        self.points_per_trace[0, :n_trace] = headers[:, 2]
+        self.topography[0, :n_trace] = headers[:, 3]
+        self.bytes_per_point[0, :n_trace] = headers[:, 5]
+        self.n_stackes[0, :n_trace] = headers[:, 7]
+        self.time_window[0, :n_trace] = headers[:, 8]
+        self.pos[:, :n_trace] = headers[:, [9, 11, 13]].transpose()
+        self.receive[:, :n_trace] = headers[:, 14:17].transpose()
+        self.transmit[:, :n_trace] = headers[:, 17:20].transpose()
+        self.tz_adjustment[0, :n_trace] = headers[:, 20]
+        self.zero_flag[0, :n_trace] = headers[:, 21]
+        self.time_of_day[0, :n_trace] = headers[:, 23]
+        self.comment_flag[0, :n_trace] = headers[:, 24]
+        self.comment[:n_trace] = [str(bytes(comment[:1])) for comment in comments]
+        self.header_index = n_trace
+
 
 def _get_gps_data(fn_gps, trace_nums):
     """Read GPS data associated with a Pulse Ekko .GPS file.
@@ -107,7 +209,7 @@ def _get_gps_data(fn_gps, trace_nums):
     return data
 
 
-def partition_project_file(fn_project):
+def partition_project_file(fn_project, out_dir=None):
     """Separate profiles.
 
     The new pulse ekko dvl writes 'project' files with all the profiles stored
@@ -118,23 +220,35 @@ def partition_project_file(fn_project):
     ----------
     fn_project: str
         Filename for the .gpz project file
+    out_dir: str, optional
+        Directory to write the profiles to. Default is the current directory.
+
+    Returns
+    -------
+    fns_dt1: list of str
+        The data files written, in order of profile number
     """
+    if out_dir is None:
+        out_dir = '.'
     with open(fn_project, 'rb') as fin:
         f = fin.read()
 
+    fns_dt1 = []
     profile_num = 1
-    while f.find(b'line%d' % profile_num) != -1:
+    # Profiles are stored in order, so pick up searching where the last one stopped
+    search_start = 0
+    while f.find(b'line%d' % profile_num, search_start) != -1:
         # Get the header file
-        hd_start = f.find(b'line%d.hd' % (profile_num))
-        hd_end = f[hd_start:].find(b'PK') + hd_start
+        hd_start = f.find(b'line%d.hd' % (profile_num), search_start)
+        hd_end = f.find(b'PK', hd_start)
         hd_str = str(f[hd_start:hd_end])
         hd_lines = hd_str.split('\\r\\n')
         hd_lines[0] = hd_lines[0][2:]
         hd_lines[-1] = ''
 
         # Get the 'ini' file
-        ini_start = f.find(b'line%d.ini' % (profile_num))
-        ini_end = f[ini_start:].find(b'PK') + ini_start
+        ini_start = f.find(b'line%d.ini' % (profile_num), search_start)
+        ini_end = f.find(b'PK', ini_start)
         ini_str = str(f[ini_start:ini_end])
         for i, line in enumerate(ini_str.split('\\r\\n')):
             if i == 0:
@@ -146,20 +260,24 @@ def partition_project_file(fn_project):
                 hd_lines.append(line)
 
         # Write to the header file
-        with open('LINE' + str(profile_num) + '.HD', 'w') as fout:
+        with open(os.path.join(out_dir, 'LINE' + str(profile_num) + '.HD'), 'w') as fout:
             for line in hd_lines:
                 fout.write(line + '\n')
 
         # Get the data file
-        dt_start = f.find(b'line%d.dt1' % (profile_num))
+        dt_start = f.find(b'line%d.dt1' % (profile_num), search_start)
         dt_start += len(b'line%d.dt1' % (profile_num))
-        dt_end = f[dt_start:].find(b'Lineset') + dt_start
+        dt_end = f.find(b'Lineset', dt_start)
         dt_str = f[dt_start:dt_end]
         # Write to the data file
-        with open('LINE' + str(profile_num) + '.DT1', 'wb') as fout:
+        fn_dt1 = os.path.join(out_dir, 'LINE' + str(profile_num) + '.DT1')
+        with open(fn_dt1, 'wb') as fout:
             fout.write(dt_str)
+        fns_dt1.append(fn_dt1)
 
+        search_start = min(hd_start, ini_start, dt_start)
         profile_num += 1
+    return fns_dt1
 
 
 def load_pe(fn_dt1, *args, **kwargs):
@@ -202,30 +320,14 @@ def load_pe(fn_dt1, *args, **kwargs):
             if i == 2 and pe_data.version == '1.5.340':
                 doy = (int(line[6:10]), int(line[:2]), int(line[3:5]))
 
-    if pe_data.version == '1.0':
-        pe_data.data = np.zeros((pe_data.snum, pe_data.tnum), dtype=np.int16)
-    elif pe_data.version == '1.5.340':
-        pe_data.data = np.zeros((pe_data.snum, pe_data.tnum), dtype=np.float32)
+    pe_data.data = np.zeros((pe_data.snum, pe_data.tnum), dtype=SAMPLE_TYPES[pe_data.version])
 
+    # All the traces are fixed-length records, so read them all at once
+    records = read_dt1(true_fn, pe_data.version, pe_data.snum, pe_data.tnum)
     pe_data.traceheaders = TraceHeaders(pe_data.tnum)
-    with open(true_fn, 'rb') as fin:
-        lines = fin.read()
-
-    offset = 0
-    for i in range(pe_data.tnum):
-        pe_data.traceheaders.get_header(offset, lines)
-        offset += 25 * 4 + 28
-        if pe_data.version == '1.0':
-            trace = struct.unpack('<{:d}h'.format(pe_data.snum),
-                                  lines[offset: offset + pe_data.snum * 2])
-            offset += pe_data.snum * 2
-        elif pe_data.version == '1.5.340':
-            fmt = '<%df' % (len(lines[offset: offset + pe_data.snum * 4]) // 4)
-            trace = struct.unpack(fmt, lines[offset:offset + pe_data.snum * 4])
-            offset += pe_data.snum * 4
-
-        trace -= np.nanmean(trace[:100])
-        pe_data.data[:, i] = trace.copy()
+    pe_data.traceheaders.set_headers(records['header'], records['comment'])
+    remove_dc(records['data'], pe_data.data)
+    del records
 
     # known vars that are not really set
     pe_data.chan = 1
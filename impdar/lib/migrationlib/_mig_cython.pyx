@@ -17,7 +17,7 @@ import time
 # cdefine the signature of our c function
 # Need this so that the function is recognized
 cdef extern from "mig_cython.h":
-    void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield)
+    void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield, int n_threads, int quiet) nogil
 
 
 def migrationKirchoffLoop(np.ndarray[double, ndim=2, mode="c"] migdata not None,
@@ -30,24 +30,38 @@ def migrationKirchoffLoop(np.ndarray[double, ndim=2, mode="c"] migdata not None,
                           float vel,
                           np.ndarray[double, ndim=2, mode="c"] gradD not None,
                           float max_travel_time,
-                          bint nearfield
+                          bint nearfield,
+                          int n_threads=1,
+                          bint quiet=False
                           ):
-    """I am not sure if this wrapper is needed, but I think it gives us type checking so I'm leaving it"""
-    mig_kirch_loop(<double*> np.PyArray_DATA(migdata),
-                   tnum,
-                   snum,
-                   <double*> np.PyArray_DATA(dist),
-                   <double*> np.PyArray_DATA(zs),
-                   <double*> np.PyArray_DATA(zs2),
-                   <double*> np.PyArray_DATA(tt_sec),
-                   vel,
-                   <double*> np.PyArray_DATA(gradD),
-                   max_travel_time,
-                   int(nearfield)
-                   )
-
-
-def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
+    """I am not sure if this wrapper is needed, but I think it gives us type checking so I'm leaving it
+
+    The GIL is released while the c loop runs, which is split over n_threads threads
+    if we were compiled with OpenMP (n_threads <= 0 uses the OpenMP default)"""
+    cdef double * migdata_ptr = <double*> np.PyArray_DATA(migdata)
+    cdef double * dist_ptr = <double*> np.PyArray_DATA(dist)
+    cdef double * zs_ptr = <double*> np.PyArray_DATA(zs)
+    cdef double * zs2_ptr = <double*> np.PyArray_DATA(zs2)
+    cdef double * tt_sec_ptr = <double*> np.PyArray_DATA(tt_sec)
+    cdef double * gradD_ptr = <double*> np.PyArray_DATA(gradD)
+    with nogil:
+        mig_kirch_loop(migdata_ptr,
+                       tnum,
+                       snum,
+                       dist_ptr,
+                       zs_ptr,
+                       zs2_ptr,
+                       tt_sec_ptr,
+                       vel,
+                       gradD_ptr,
+                       max_travel_time,
+                       nearfield,
+                       n_threads,
+                       quiet
+                       )
+
+
+def migrationKirchhoff(dat, vel=1.69e8, nearfield=False, n_threads=1, quiet=False):
     """Kirchhoff Migration (Berkhout 1980; Schneider 1978; Berryhill 1979)
 
     This migration method uses an integral solution to the scalar wave equation Yilmaz (2001) eqn 4.5.
@@ -64,6 +78,9 @@ def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
     dat: data as a class in the ImpDAR format
     vel: wave velocity, default is for ice
     nearfield: boolean to indicate whether or not to use the nearfield term in summation
+    n_threads: number of threads used to migrate traces in parallel, default 1.
+               None uses all available cores. Needs OpenMP at compile time, otherwise serial.
+    quiet: boolean to suppress the progress output from the migration loop
 
     Output
     ---------
@@ -98,7 +115,9 @@ def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
                           vel,
                           np.ascontiguousarray(gradD, dtype=np.float64),
                           max_travel_time,
-                          nearfield
+                          nearfield,
+                          n_threads=0 if n_threads is None else n_threads,
+                          quiet=quiet
                           )
     dat.data = migdata.copy()
     # print the total time
@@ -11,31 +11,52 @@
 #include <time.h> 
 #include <signal.h>
 #include <stdlib.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+
+/* Elapsed wall-clock seconds. clock() sums the cpu time of all threads, so it is no good here */
+static double wall_time (void){
+#ifdef _OPENMP
+    return omp_get_wtime();
+#else
+    return (double) clock() / CLOCKS_PER_SEC;
+#endif
+}
+
 
 /*  Migrate data into migdata */
-void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield){
-    int i, j, k, l;
-    double min, m;
-    double costheta;
-    double integral;
-    double rs;
-    int Didx;
-    int lmin_prev, rmin_prev;
-    clock_t iter_start, this_time;
-    float time_remaining, el_t;
-    setbuf(stdout, NULL);
-    printf("Iter: ");
+void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield, int n_threads, int quiet){
+    int j;
+    int ndone = 0;
+    double iter_start;
+
+#ifdef _OPENMP
+    /* Set the threads for this loop only, so the process-wide default is left alone */
+    int loop_threads = (n_threads > 0) ? n_threads : omp_get_max_threads();
+#endif
 
-    
-    iter_start = clock();
-    /* You can flip the loop order, but I think this is marginally faster
-     * based on c row-major ordering. Could be wrong though... */
+    if (!quiet){
+        setbuf(stdout, NULL);
+        printf("Iter: ");
+    }
+
+    iter_start = wall_time();
+    /* Every output trace is independent, so the traces are split between threads.
+     * Dynamic scheduling since traces near the edges of the profile are cheaper. */
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic, 1) num_threads(loop_threads)
+#endif
     for(j=0;j<tnum;j++){
-        if (j % 100 == 0){
-            printf("%d", j);
-        }else{
-            printf(".");
-        }
+        int i, k, l, n;
+        double min, m;
+        double costheta;
+        double integral;
+        double rs;
+        int Didx = 0;
+        int lmin_prev, rmin_prev;
+
         for(i=0;i<snum;i++){
             integral = 0.0;
             rmin_prev = i;
@@ -90,14 +111,24 @@ void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double
 
             migdata[i * tnum + j] = integral;
         }
-        if (j % 100 == 0){
-            if (j > 0){
-                this_time = clock();
-                el_t = (this_time - iter_start) / CLOCKS_PER_SEC;
-                time_remaining = (tnum - j) * el_t / j;
-                printf("\nEst. time remaining: %f sec", time_remaining);
+
+        if (!quiet){
+            /* Count finished traces rather than using j, since threads finish out of order */
+#ifdef _OPENMP
+#pragma omp atomic capture
+#endif
+            n = ++ndone;
+            if (n % 100 == 0){
+#ifdef _OPENMP
+#pragma omp critical
+#endif
+                printf("\n%d traces done, est. time remaining: %f sec", n, (tnum - n) * (wall_time() - iter_start) / n);
+            }else{
+                printf(".");
             }
         }
     }
-    printf("\n");
+    if (!quiet){
+        printf("\n");
+    }
 }
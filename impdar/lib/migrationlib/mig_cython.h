@@ -8,6 +8,6 @@
 #ifndef MIG_CYTHON_H
 #define MIG_CYTHON_H
 
-void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield);
+void mig_kirch_loop (double * migdata, int tnum, int snum, double * dist, double * zs, double * zs2, double * tt_sec, double vel, double * gradD, double max_travel_time, int nearfield, int n_threads, int quiet);
 
 #endif /* !MIG_CYTHON_H */
@@ -11,6 +11,7 @@ Options are:
     Kirchhoff (diffraction summation)
     Stolt (frequency wavenumber, constant velocity)
     Gazdag (phase shift, either constant or depth-varying velocity)
+    Time-wavenumber (wavenumber by wavenumber, constant or depth-varying velocity)
     SeisUnix (reference su routines directly)
 
 Author:
@@ -24,20 +25,28 @@ Mar 12 2019
 """
 
 from __future__ import print_function
+import os
 import sys
 
 import numpy as np
 import time
+from concurrent.futures import ThreadPoolExecutor
 from scipy import sparse
-from scipy.interpolate import griddata, interp2d, interp1d
-
-
-def migrationKirchhoffLoop(data, migdata, tnum, snum, dist, zs, zs2, tt_sec, vel, gradD, max_travel_time, nearfield):
-    # Loop through all traces
-    print('Migrating trace number:')
-    for xi in range(tnum):
-        print('{:d}, '.format(xi), end='')
-        sys.stdout.flush()
+from scipy.interpolate import griddata, interp1d
+from ..ImpdarError import ImpdarError
+
+
+def migrationKirchhoffLoop(data, migdata, tnum, snum, dist, zs, zs2, tt_sec, vel, gradD, max_travel_time, nearfield,
+                           traces=None, quiet=False):
+    # Loop through all traces, or just the ones we were given
+    if traces is None:
+        traces = range(tnum)
+    if not quiet:
+        print('Migrating trace number:')
+    for xi in traces:
+        if not quiet:
+            print('{:d}, '.format(xi), end='')
+            sys.stdout.flush()
         # get the trace distance
         x = dist[xi]
         dists2 = (dist - x)**2.
@@ -63,7 +72,7 @@ def migrationKirchhoffLoop(data, migdata, tnum, snum, dist, zs, zs2, tt_sec, vel
             migdata[ti, xi] = 1. / (2. * np.pi) * integral
 
 
-def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
+def migrationKirchhoff(dat, vel=1.69e8, nearfield=False, n_threads=1, quiet=False):
     """Kirchhoff Migration (Berkhout 1980; Schneider 1978; Berryhill 1979)
 
     This migration method uses an integral solution to the scalar wave equation Yilmaz (2001) eqn 4.5.
@@ -80,6 +89,11 @@ def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
     dat: data as a class in the ImpDAR format
     vel: wave velocity, default is for ice
     nearfield: boolean to indicate whether or not to use the nearfield term in summation
+    n_threads: number of threads used to migrate traces in parallel, default 1.
+               None uses all available cores. This python version is many small numpy
+               operations that hold the GIL, so it gains little from threads; the compiled
+               version splits traces over OpenMP threads instead.
+    quiet: boolean to suppress the progress output from the migration loop
 
     Output
     ---------
@@ -104,7 +118,19 @@ def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
     zs = vel * tt_sec / 2.0
     zs2 = zs**2.
 
-    migrationKirchhoffLoop(dat.data.astype(np.float64), migdata, dat.tnum, dat.snum, dat.dist.astype(np.float64), zs.astype(np.float64), zs2.astype(np.float64), tt_sec.astype(np.float64), vel, gradD.astype(np.float64), max_travel_time, nearfield)
+    loop_args = (dat.data.astype(np.float64), migdata, dat.tnum, dat.snum, dat.dist.astype(np.float64), zs.astype(np.float64), zs2.astype(np.float64), tt_sec.astype(np.float64), vel, gradD.astype(np.float64), max_travel_time, nearfield)
+    if n_threads is None:
+        n_threads = os.cpu_count() or 1
+    if n_threads <= 1:
+        migrationKirchhoffLoop(*loop_args, quiet=quiet)
+    else:
+        # Output traces are independent, so each thread gets its own set of traces.
+        # The small numpy operations per sample mostly hold the GIL, so expect little speedup.
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            futures = [executor.submit(migrationKirchhoffLoop, *loop_args, traces=range(i, dat.tnum, n_threads), quiet=quiet)
+                       for i in range(n_threads)]
+            for future in futures:
+                future.result()
 
     dat.data = migdata.copy()
     # print the total time
@@ -114,6 +140,63 @@ def migrationKirchhoff(dat, vel=1.69e8, nearfield=False):
     return dat
 
 
+def migrationKirchhoffTable(dat, vel=1.69e8, nearfield=False, aperture=None):
+    """Kirchhoff Migration using precomputed travel-time tables
+
+    This is the same diffraction summation as migrationKirchhoff, but for data with constant
+    trace spacing (i.e. after constant_space) and constant sample interval. In that case the
+    diffraction hyperbola only depends on the trace offset and the sample number, so we build
+    one table of sample indices and obliquity weights for every (offset, sample) pair,
+        idx = round((t(x) - t0) / dt)
+    and reuse it for every output trace. The summation is then one vectorized pass over the
+    data for each trace offset, and the offsets are limited to the aperture.
+
+    Parameters
+    ---------
+    dat: data as a class in the ImpDAR format
+    vel: wave velocity, default is for ice
+    nearfield: boolean to indicate whether or not to use the nearfield term in summation
+    aperture: maximum offset, in traces, to sum over on either side of the output trace.
+              Default is to use all traces within the maximum travel time.
+
+    Output
+    ---------
+    dat: data as a class in the ImpDAR format (with dat.data now being migrated data)
+
+    """
+
+    print('Kirchhoff Migration (travel-time tables) of %.0fx%.0f matrix' % (dat.tnum, dat.snum))
+    # check that the arrays are compatible
+    _check_data_shape(dat)
+    if dat.flags.interp is None or not dat.flags.interp[0]:
+        raise ImpdarError('Table Kirchhoff migration can only be used on constantly spaced data')
+    # start the timer
+    start = time.time()
+
+    tt_sec = dat.travel_time / 1.0e6
+    dx = dat.flags.interp[1]
+    # Calculate the time derivative of the input data
+    gradD = np.gradient(dat.data.astype(np.float64), tt_sec, axis=0)
+    idx_table, weight_table, near_table = kirchhoffTables(dx, tt_sec, vel, aperture=aperture, tnum=dat.tnum)
+
+    # Create an empty array to fill with migrated data
+    migdata = np.zeros_like(dat.data, dtype=np.float64)
+    # Sum along the hyperbola one trace offset at a time
+    for off in range(-(idx_table.shape[0] - 1), idx_table.shape[0]):
+        aoff = abs(off)
+        # output traces that have a neighbor at this offset, and those neighbors
+        out_traces = slice(max(-off, 0), dat.tnum - max(off, 0))
+        in_traces = slice(max(off, 0), dat.tnum + min(off, 0))
+        migdata[:, out_traces] += gradD[idx_table[aoff], in_traces] * weight_table[aoff][:, None]
+        if nearfield:
+            migdata[:, out_traces] += dat.data[idx_table[aoff], in_traces] * near_table[aoff][:, None]
+    dat.data = migdata / (2. * np.pi)
+
+    print('Kirchhoff Migration of %.0fx%.0f matrix complete in %.2f seconds'
+          % (dat.tnum, dat.snum, time.time() - start))
+    return dat
+
+
 def migrationStolt(dat,vel=1.68e8,htaper=100,vtaper=1000):
     """Stolt Migration (Stolt, 1978, Geophysics)
 
@@ -124,7 +207,7 @@ def migrationStolt(dat,vel=1.68e8,htaper=100,vtaper=1000):
     ---------
     dat: data as a class in the ImpDAR format
     vel: wave velocity, default is for ice
-    htaper: number of traces for the linear horizontal taper from the edges of the domain
+    htaper: number of traces for the linear horizontal taper from the edges of the domain (0 for none)
     vtaper: number of samples for the vertical taper from the top and bottom.
 
     Output
@@ -140,7 +223,7 @@ def migrationStolt(dat,vel=1.68e8,htaper=100,vtaper=1000):
     # save the start time
     start = time.time()
     # taper
-    h = np.minimum(np.arange(dat.tnum),np.arange(dat.tnum)[::-1])/htaper
+    h = _taper(dat.tnum, htaper)
     v = np.minimum(np.arange(dat.snum),np.arange(dat.snum)[::-1])/vtaper
     h[h>1.] = 1.
     v[v>1.] = 1.
@@ -158,25 +241,10 @@ def migrationStolt(dat,vel=1.68e8,htaper=100,vtaper=1000):
         trace_int = dat.trace_int
     kx = 2.*np.pi*np.fft.fftfreq(dat.tnum, d=np.mean(trace_int))
     # interpolate from frequency (ws) into wavenumber (kz)
-    interp_real = interp2d(kx,ws,FK.real)
-    interp_imag = interp2d(kx,ws,FK.imag)
     # interpolation will move from frequency-wavenumber to wavenumber-wavenumber, KK = D(kx,kz,t=0)
-    KK = np.zeros_like(FK)
-    print('Interpolating from temporal frequency (ws) to vertical wavenumber (kz):')
-    print('Interpolating:')
-    # for all temporal frequencies
-    for zj in range(dat.snum//2):
-        kzj = ws[zj]*2./vel
-        if zj%100 == 0:
-            print(int(ws[zj]/1e6/2/np.pi), 'MHz, ', end='')
-            sys.stdout.flush()
-        # for all horizontal wavenumbers
-        for xi in range(len(kx)):
-            kxi = kx[xi]
-            # migration conversion to wavenumber (Yilmaz equation C.53)
-            wsj = vel/2.*np.sqrt(kzj**2.+kxi**2.)
-            # get the interpolated FFT values, real and imaginary, S(kx,kz,t=0)
-            KK[zj,xi] = interp_real(kxi,wsj) + 1j*interp_imag(kxi,wsj)
+    print('Interpolating from temporal frequency (ws) to vertical wavenumber (kz)')
+    # do this in blocks of wavenumbers so the temporary arrays stay small
+    KK = stoltInterp(FK, ws, kx, vel, chunksize=max(1, 2 ** 22 // len(ws)))
     # all vertical wavenumbers
     kz = ws*2./vel
     # grid wavenumbers for scaling calculation
@@ -247,7 +315,7 @@ def migrationPhaseShift(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000, **gen
     # save the start time
     start = time.time()
     # taper
-    h = np.minimum(np.arange(dat.tnum),np.arange(dat.tnum)[::-1])/htaper
+    h = _taper(dat.tnum, htaper)
     v = np.minimum(np.arange(dat.snum),np.arange(dat.snum)[::-1])/vtaper
     h[h>1.] = 1.
     v[v>1.] = 1.
@@ -284,33 +352,38 @@ def migrationPhaseShift(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000, **gen
     return dat
 
 
-def migrationTimeWavenumber(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000):
+def migrationTimeWavenumber(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000,n_threads=1,**genfromtxt_kwargs):
     """
 
     Time-Wavenumber Migration
 
-    The migration is a reverse time migration in the (t,k) domain. In the
+    The migration is done wavenumber by wavenumber in the (t,k) domain. In the
     first step, the data g(t,x) are Fourier transformed x->k into
     the time-wavenumber domain g(t,k).
-    Then looping over wavenumbers, the data are then reverse-time
-    finite-difference migrated, wavenumber by wavenumber.  The resulting
-    migrated data m(tau,k), now in the tau (migrated time) and k domain,
-    are inverse fourier transformed back into m(tau,xout) and written out.
+    Then looping over wavenumbers, the data are downward continued in
+    migrated time tau with the velocity v(tau) and imaged at t=0.
+    Each wavenumber is independent, so blocks of wavenumbers can be migrated in parallel.
+    The resulting migrated data m(tau,k), now in the tau (migrated time) and k domain,
+    are inverse fourier transformed back into m(tau,xout).
 
     **
     The foundation of this script was taken from:
     Seis Unix script sumigtk.c, Credits: CWP Dave Hale, November 5th, 1990
+    Rather than the finite-difference extrapolation of sumigtk, each tau step
+    is an exact phase shift for the velocity at that step.
     **
 
     Parameters
     ---------
     dat: data as a class in the ImpDAR format
-    vel: v(x,z)
-        Up to 2-D array with three columns for velocities (m/s), and z/x (m).
-        Array structure is velocities in first column, z location in second, x location in third.
+    vel: v(z)
+        Up to 2-D array with two columns for velocities (m/s) and z (m).
         If uniform velocity (i.e. vel=constant) input constant
-        If layered velocity (i.e. vel=v(z)) input array with shape (#vel-points, 2) (i.e. no x-values)
-    vel_fn: filename for layered velocity input, .txt file with columns for v, x, z
+        If layered velocity (i.e. vel=v(z)) input array with shape (#vel-points, 2)
+        Lateral velocity variations are not possible in the t-k domain.
+    vel_fn: filename for layered velocity input, .txt file with columns for v, z
+    n_threads: number of threads to split the wavenumbers between, default 1.
+               None uses all available cores.
 
     Output
     ---------
@@ -324,7 +397,7 @@ def migrationTimeWavenumber(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000):
     # save the start time
     start = time.time()
     # taper
-    h = np.minimum(np.arange(dat.tnum),np.arange(dat.tnum)[::-1])/htaper
+    h = _taper(dat.tnum, htaper)
     v = np.minimum(np.arange(dat.snum),np.arange(dat.snum)[::-1])/vtaper
     h[h>1.] = 1.
     v[v>1.] = 1.
@@ -338,12 +411,39 @@ def migrationTimeWavenumber(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000):
         trace_int = dat.trace_int
     kx = 2.*np.pi*np.fft.fftfreq(dat.tnum,d=np.mean(trace_int))
     # 1D Forward Fourier Transform to get data in time-wavenumber space, TK = D(kx,z=0,ts)
+    TK = np.fft.fft(dat.data, axis=1)
+
+    # Velocity structure from input
+    if vel_fn is not None:
+        try:
+            vel = np.genfromtxt(vel_fn, **genfromtxt_kwargs)
+            print('Velocities loaded from %s.'%vel_fn)
+        except:
+            raise TypeError('File %s was given for input velocity array, but cannot be loaded. Please reformat to txt file.'%vel_fn)
+    if len(np.shape(vel)) == 2 and np.shape(vel)[1] == 3:
+        raise ValueError('Time-wavenumber migration needs a constant or layered (v, z) velocity')
+    vmig = getVelocityProfile(dat,vel)
+
+    # Loop over wavenumbers, in blocks, to migrate in time
+    if n_threads is None:
+        n_threads = os.cpu_count() or 1
+    blocks = [block for block in np.array_split(np.arange(dat.tnum), max(n_threads, dat.tnum * dat.snum // 2 ** 20, 1))
+              if len(block) > 0]
+    MK = np.zeros_like(TK)
 
-    # Loop over wavenumbers for reverse time migration
-    for k in kx:
-        continue
+    def mig_block(block):
+        MK[:, block] = timeWavenumber(TK[:, block], kx[block], vmig, dat.dt)
+
+    if n_threads <= 1:
+        for block in blocks:
+            mig_block(block)
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            for result in executor.map(mig_block, blocks):
+                pass
 
     # 1D Inverse Fourier Transform to get data back into migrated time-distance space
+    dat.data = np.fft.ifft(MK, axis=1).real
 
     # print the total time
     print('')
@@ -355,12 +455,114 @@ def migrationTimeWavenumber(dat,vel=1.69e8,vel_fn=None,htaper=100,vtaper=1000):
 # Supporting functions
 # -----------------------------------------------------------------------------
 
-def phaseShift(dat, vmig, vels_in, kx, ws, FK):
+def kirchhoffTables(dx, tt_sec, vel, aperture=None, tnum=None):
+    """
+
+    Travel-time lookup tables for Kirchhoff migration with constant trace spacing.
+
+    For a diffraction at two-way time t0 (depth z = v t0 / 2), the time at an offset of
+    n traces is t = 2 sqrt((n dx)^2 + z^2) / v. We index the nearest sample directly,
+    round((t - tt_sec[0]) / dt), rather than searching for it, so the samples must be
+    evenly spaced in time.
+
+    Parameters
+    ---------
+    dx: trace spacing (m)
+    tt_sec: evenly spaced two-way travel times (s)
+    vel: wave velocity (m/s)
+    aperture: maximum offset in traces. Default (None) is limited only by the maximum travel time.
+    tnum: number of traces, used to limit the aperture
+
+    Output
+    ---------
+    idx_table: 2-D integer array (offset, sample) of the sample indices along the hyperbola
+    weight_table: 2-D array (offset, sample) of the far-field obliquity weights, cos(theta) / v.
+        Points outside the domain have zero weight.
+    near_table: 2-D array (offset, sample) of the near-field weights, cos(theta) / r^2
+
+    """
+    max_travel_time = np.max(tt_sec)
+    dt = (tt_sec[-1] - tt_sec[0]) / (len(tt_sec) - 1)
+    # No point going further than the edge of the domain
+    max_off = int(np.floor(vel * max_travel_time / 2. / dx))
+    if aperture is not None:
+        max_off = min(max_off, int(aperture))
+    if tnum is not None:
+        max_off = min(max_off, tnum - 1)
+
+    zs = vel * tt_sec / 2.0
+    rs = np.sqrt((np.arange(max_off + 1)[:, None] * dx) ** 2. + zs[None, :] ** 2.)
+    t_hyp = 2. * rs / vel
+    idx_table = np.clip(np.rint((t_hyp - tt_sec[0]) / dt), 0, len(tt_sec) - 1).astype(int)
+
+    # obliquity factor, which is undefined at the apex of the surface sample
+    with np.errstate(invalid='ignore', divide='ignore'):
+        costheta = zs[None, :] / rs
+        near_table = costheta / rs ** 2.
+    outside = np.logical_or(t_hyp > max_travel_time, ~np.isfinite(costheta))
+    weight_table = costheta / vel
+    weight_table[outside] = 0.
+    near_table[np.logical_or(outside, ~np.isfinite(near_table))] = 0.
+    return idx_table, weight_table, near_table
+
+
+def stoltInterp(FK, ws, kx, vel, chunksize=None):
+    """
+
+    Map the frequency-wavenumber spectrum onto vertical wavenumbers for Stolt migration.
+
+    For every output vertical wavenumber kz (at the same indices as ws) and every
+    horizontal wavenumber kx, the spectrum is sampled at the frequency
+    w = v/2 * sqrt(kz**2 + kx**2) (Yilmaz equation C.53). Because kx always falls on
+    the grid, this is a linear interpolation along frequency within each column,
+    which we do for all columns at once. Frequencies above max(ws) take the value at
+    max(ws), matching the nearest-neighbor extrapolation of the former interp2d
+    implementation; the two agree to within floating-point rounding (relative
+    differences ~1e-16).
+
+    Parameters
+    ---------
+    FK: 2-D array of the data image in frequency-wavenumber space (FKx), shape (len(ws), len(kx))
+    ws: monotonically increasing temporal frequencies
+    kx: horizontal wavenumbers
+    vel: wave velocity (m/s)
+    chunksize: number of wavenumber columns to interpolate at a time, default is all of them
+
+    Output
+    ---------
+    KK: 2-D array of the data image in wavenumber-wavenumber space (KzKx), same shape as FK
+
+    """
+    ws = np.asarray(ws)
+    kx = np.asarray(kx)
+    kz = ws * 2. / vel
+    if chunksize is None:
+        chunksize = len(kx)
+    KK = np.zeros_like(FK)
+    for cstart in range(0, len(kx), chunksize):
+        cols = slice(cstart, min(cstart + chunksize, len(kx)))
+        # migration conversion to wavenumber (Yilmaz equation C.53)
+        wsj = vel / 2. * np.sqrt(kz[:, None]**2. + kx[None, cols]**2.)
+        # clip to the domain (nearest-neighbor extrapolation)
+        wsj = np.clip(wsj, ws[0], ws[-1])
+        # upper index of the bracketing frequencies, then the linear weights
+        iup = np.clip(np.searchsorted(ws, wsj, side='right'), 1, len(ws) - 1)
+        ilow = iup - 1
+        frac = (wsj - ws[ilow]) / (ws[iup] - ws[ilow])
+        colidx = np.arange(cols.start, cols.stop)[None, :]
+        KK[:, cols] = FK[ilow, colidx] * (1. - frac) + FK[iup, colidx] * frac
+    return KK
+
+
+def phaseShift(dat, vmig, vels_in, kx, ws, FK, chunksize=None):
     """
 
     Phase-Shift migration to get from frequency-wavenumber (FKx) space to time-wavenumber (TKx) space.
     This is for either constant or layered velocity v(z).
 
+    For constant and layered velocities, every frequency is independent, so we step
+    down through the output times once and shift all frequencies (in chunks) at each step.
+
     **
     The foundation of this script was taken from Matlab code written by Andreas Tzanis,
     Dept. of Geophysics, University of Athens (2005)
@@ -379,6 +581,8 @@ def phaseShift(dat, vmig, vels_in, kx, ws, FK):
     kx: horizontal wavenumbers
     ws: temporal frequencies
     FK: 2-D array of the data image in frequency-wavenumber space (FKx)
+    chunksize: number of frequencies to shift at once, default is to
+        limit each chunk to about 2**22 elements
 
     Output
     ---------
@@ -388,33 +592,18 @@ def phaseShift(dat, vmig, vels_in, kx, ws, FK):
 
     # initialize the time-wavenumber array to be filled with complex values
     TK = np.zeros((dat.snum,len(kx)))+0j
+    if chunksize is None:
+        chunksize = max(1, 2 ** 22 // len(kx))
+
+    # zero frequency would give us a divide by zero
+    ws = np.array(ws, dtype=np.float64)
+    ws[ws == 0.0] = 1e-10 / dat.dt
 
     # Uniform velocity case, vmig=constant
     if not hasattr(vmig,"__len__"):
         print('Constant velocity %s m/usec'%(vmig/1e6))
-        # iterate through all frequencies
-        print('Frequency: ',end='')
-        sys.stdout.flush()
-
-        print('Frequency: ')
-        for iw in range(len(ws)):
-            w = ws[iw]
-            if w == 0.0:
-                w = 1e-10/dat.dt
-            if iw%100 == 0:
-                print(int(w/1e6/(2.*np.pi)),'MHz',', ',end='')
-                sys.stdout.flush()
-            # remove frequencies outside of the domain
-            vkx2 = (vmig*kx/2.)**2.
-            ik = np.argwhere(vkx2 < w**2.)
-            FFK = FK[iw,ik]
-            # get the phase for shift
-            phase = (-w*dat.dt*np.sqrt(1.0 - vkx2[ik]/w**2.)).real
-            cp = np.conj(np.cos(phase)+1j*np.sin(phase))
-            # Accumulate output image (time-wavenumber space) summed over all frequencies
-            for itau in range(dat.snum):
-                 FFK *= cp
-                 TK[itau,ik] += FFK
+        for cstart in range(0, len(ws), chunksize):
+            _phaseShiftConstant(dat, vmig, kx, ws[cstart:cstart + chunksize], FK[cstart:cstart + chunksize], TK)
 
     else:
         if not hasattr(vmig, 'shape'):
@@ -424,64 +613,14 @@ def phaseShift(dat, vmig, vels_in, kx, ws, FK):
             raise ValueError('Interpolated velocity profile is not the length of the number of samples in a trace.')
         if hasattr(vmig[0], "__len__"):
             print('2-D velocity structure, Fourier Finite-Difference Migration')
-            # Finite Difference Stencil
-            stencil = Sp_Matr(dat.tnum,-2,1,1)
-            FFX_last = 0.
+            _phaseShiftLateral(dat, vmig, kx, ws, FK, TK)
         else:
             print('1-D velocity structure, Gazdag Migration')
             print('Velocities (m/s): %.2e',vels_in[:,0])
             print('Depths (m):',vels_in[:,1])
-            print('Travel Times ($\mu$ sec):',dat.travel_time)
-        # iterate through all output travel times
-        for itau in range(dat.snum):
-            tau = dat.travel_time[itau] / 1.0e6
-            if itau%100 == 0:
-                print('Time %.2e, ' %(tau), end='')
-                sys.stdout.flush()
-            # iterate through all frequencies
-            for iw in range(len(ws)):
-                w = ws[iw]
-                if w == 0.0:
-                    w = 1.0e-10 / dat.dt
-
-                # Get foreground and background velocities
-                if hasattr(vmig[itau], "__len__"):
-                    vbg = np.min(vmig[itau])  # Stoffa et al. 1990's 1 / U_0 for the depth interval
-                    vfg = vmig[itau]-vbg  # Stoffa et al. 1990's 1 / DeltaU
-                    ufg  = 1. / vmig[itau] - 1. / vbg  # Stoffa's DeltaU
-                else:
-                    vbg = vmig[itau] # Stoffa et al. 1990's U_0 for the depth interval
-
-                ### Retardation term
-                # cosine squared
-                coss = 1.0+0j - (0.5*vbg*kx/w)**2.
-                # calculate phase for shift
-                phase = (-w*dat.dt*np.sqrt(coss)).real
-                cshift = np.conj(np.cos(phase)+1j*np.sin(phase))
-                FK[iw] *= cshift
-
-                if hasattr(vmig[itau],"__len__"):
-                    # inverse fourier tranform to frequency-space domain
-                    FFX = np.fft.ifft(FK[iw])
-
-                    ### Thin-lens term (Stoffa et al. 1990)
-                    phase2 = 2. * ufg * w * dat.dt + 1. * vbg * w * dat.dt
-                    cshift2 = np.cos(phase2) + 1j*np.sin(phase2)
-                    FFX *= cshift2
-
-                    ### Diffraction term, Finite Difference operator
-                    if itau > 0:
-                        FFX = fourierFiniteDiff(dat,vfg,w,FFX,FFX_last,stencil)
-                    FFX_last = FFX
-
-                    # Fourier transform back to frequency-wavenumber domain
-                    FK[iw] = np.fft.fft(FFX)
-
-                # zero if outside domain
-                idx = coss <= (tau/dat.travel_time[-1]/1e6)**2.
-                FK[iw,idx] = 0.0 + 0j
-                # sum over all frequencies
-                TK[itau] += FK[iw]
+            print('Travel Times ($\\mu$ sec):',dat.travel_time)
+            for cstart in range(0, len(ws), chunksize):
+                _phaseShiftLayered(dat, vmig, kx, ws[cstart:cstart + chunksize], FK[cstart:cstart + chunksize], TK)
 
     # Cut to original array size
     TK = TK[:,:dat.tnum]
@@ -490,6 +629,144 @@ def phaseShift(dat, vmig, vels_in, kx, ws, FK):
     return TK
 
 
+def _phaseShiftConstant(dat, vmig, kx, ws, FK, TK):
+    """Accumulate the constant-velocity phase shift of the frequencies ws into TK (in place)."""
+    # remove frequencies outside of the domain
+    vkx2 = (vmig*kx/2.)**2.
+    inside = vkx2[None, :] < ws[:, None]**2.
+    # get the phase for shift, the same at every time step
+    with np.errstate(invalid='ignore'):
+        phase = (-ws[:, None]*dat.dt*np.sqrt(1.0 - vkx2[None, :]/ws[:, None]**2.)).real
+    cp = np.conj(np.cos(phase)+1j*np.sin(phase))
+    cp[~inside] = 0.
+    FFK = np.where(inside, FK, 0.)
+    # Accumulate output image (time-wavenumber space) summed over all frequencies
+    for itau in range(dat.snum):
+        FFK *= cp
+        TK[itau] += FFK.sum(axis=0)
+
+
+def _phaseShiftLayered(dat, vmig, kx, ws, FK, TK):
+    """Accumulate the layered-velocity (Gazdag) phase shift of the frequencies ws into TK (in place)."""
+    FK = FK.copy()
+    kxw2 = (0.5*kx[None, :]/ws[:, None])**2.
+    wdt = ws[:, None]*dat.dt
+    # iterate through all output travel times
+    for itau in range(dat.snum):
+        tau = dat.travel_time[itau] / 1.0e6
+        if itau%100 == 0:
+            print('Time %.2e, ' %(tau), end='')
+            sys.stdout.flush()
+
+        ### Retardation term, only depends on the velocity at this depth step
+        # cosine squared
+        coss = 1.0 - vmig[itau]**2.*kxw2
+        # calculate phase for shift (evanescent waves get no shift)
+        phase = -wdt*np.sqrt(np.maximum(coss, 0.))
+        FK *= np.conj(np.cos(phase)+1j*np.sin(phase))
+
+        # zero if outside domain
+        FK[coss <= (tau/dat.travel_time[-1]/1e6)**2.] = 0.0 + 0j
+        # sum over all frequencies
+        TK[itau] += FK.sum(axis=0)
+
+
+def _phaseShiftLateral(dat, vmig, kx, ws, FK, TK):
+    """Accumulate the Fourier finite-difference phase shift for v(x,z) into TK (in place)."""
+    # Finite Difference Stencil
+    stencil = Sp_Matr(dat.tnum,-2,1,1)
+    FFX_last = 0.
+    # iterate through all output travel times
+    for itau in range(dat.snum):
+        tau = dat.travel_time[itau] / 1.0e6
+        if itau%100 == 0:
+            print('Time %.2e, ' %(tau), end='')
+            sys.stdout.flush()
+
+        # Get foreground and background velocities
+        vbg = np.min(vmig[itau])  # Stoffa et al. 1990's 1 / U_0 for the depth interval
+        vfg = vmig[itau]-vbg  # Stoffa et al. 1990's 1 / DeltaU
+        ufg  = 1. / vmig[itau] - 1. / vbg  # Stoffa's DeltaU
+
+        # iterate through all frequencies
+        for iw in range(len(ws)):
+            w = ws[iw]
+
+            ### Retardation term
+            # cosine squared
+            coss = 1.0+0j - (0.5*vbg*kx/w)**2.
+            # calculate phase for shift
+            phase = (-w*dat.dt*np.sqrt(coss)).real
+            cshift = np.conj(np.cos(phase)+1j*np.sin(phase))
+            FK[iw] *= cshift
+
+            # inverse fourier tranform to frequency-space domain
+            FFX = np.fft.ifft(FK[iw])
+
+            ### Thin-lens term (Stoffa et al. 1990)
+            phase2 = 2. * ufg * w * dat.dt + 1. * vbg * w * dat.dt
+            cshift2 = np.cos(phase2) + 1j*np.sin(phase2)
+            FFX *= cshift2
+
+            ### Diffraction term, Finite Difference operator
+            if itau > 0:
+                FFX = fourierFiniteDiff(dat,vfg,w,FFX,FFX_last,stencil)
+            FFX_last = FFX
+
+            # Fourier transform back to frequency-wavenumber domain
+            FK[iw] = np.fft.fft(FFX)
+
+            # zero if outside domain
+            idx = coss <= (tau/dat.travel_time[-1]/1e6)**2.
+            FK[iw,idx] = 0.0 + 0j
+            # sum over all frequencies
+            TK[itau] += FK[iw]
+
+
+def timeWavenumber(TK, kx, vmig, dt):
+    """
+
+    Migrate a block of wavenumbers in time-wavenumber space.
+
+    Each column (wavenumber) is transformed to frequency, then stepped down in migrated
+    time tau with the phase shift for the velocity at that step. The image at each tau
+    is the wavefield at t=0, i.e. the sum over frequencies. Evanescent energy is dropped.
+
+    Parameters
+    ---------
+    TK: 2-D array of the data in time-wavenumber space, shape (snum, len(kx))
+    kx: horizontal wavenumbers of the columns of TK
+    vmig: migration velocity (m/s), constant or 1-D array with one value per sample
+    dt: sample interval (s)
+
+    Output
+    ---------
+    MK: 2-D array of the migrated data image in time-wavenumber space, same shape as TK
+
+    """
+    snum = TK.shape[0]
+    vmig = np.broadcast_to(vmig, (snum,))
+    # pad the array with zeros up to the next power of 2 for discrete fft
+    nt = 2**(np.ceil(np.log(2 * snum)/np.log(2))).astype(int)
+    ws = 2.*np.pi*np.fft.fftfreq(nt, d=dt)
+    ws[0] = 1.0e-10 / dt
+    # wavenumber over frequency, the part of the operator that does not depend on velocity
+    kw2 = (0.5*np.asarray(kx)[None, :]/ws[:, None])**2.
+    wdt = ws[:, None]*dt
+
+    P = np.fft.fft(TK, n=nt, axis=0)
+    MK = np.zeros(TK.shape, dtype=P.dtype)
+    for itau in range(snum):
+        # image at t=0
+        MK[itau] = P.sum(axis=0) / nt
+        # downward continue one step, dropping evanescent waves
+        coss = 1.0 - vmig[itau]**2.*kw2
+        phase = wdt*np.sqrt(np.maximum(coss, 0.))
+        P *= np.cos(phase) + 1j*np.sin(phase)
+        P[coss <= 0.] = 0.
+    return MK
+
+
 def fourierFiniteDiff(dat, vs, w, FFX, FFX_last, stencil, alpha=0.5,beta=0.25):
     """
 
@@ -640,6 +917,13 @@ def getVelocityProfile(dat,vels_in):
     return vmig
 
 
+def _taper(n, ntaper):
+    """Linear taper from the ends over ntaper points; ntaper <= 0 gives no taper."""
+    if ntaper <= 0:
+        return np.ones((n,))
+    return np.minimum(np.arange(n), np.arange(n)[::-1]) / ntaper
+
+
 def _check_data_shape(dat):
     if np.size(dat.data, 1) != dat.tnum or np.size(dat.data, 0) != dat.snum:
         raise ValueError('The input array must be of size (tnum,snum)')
@@ -24,8 +24,9 @@ Mar 12 2019
 """
 
 from __future__ import print_function
-import os
+import shutil
 import subprocess as sp
+import threading
 import numpy as np
 
 
@@ -51,6 +52,8 @@ def migrationSeisUnix(dat,
                 migration which combines the advantages of phase shift and finite difference migrations.
     3) sustolt - Stolt migration for stacked data or common-offset gathers
 
+    The traces are streamed to the routine in SU format and read back from it in memory,
+    so no intermediate files are written.
 
     Parameters
     ---------
@@ -77,13 +80,9 @@ def migrationSeisUnix(dat,
 
     """
 
-    if sp.Popen(['which', mtype]).wait() != 0:
+    if shutil.which(mtype) is None:
         raise FileNotFoundError('Cannot find chosen SeisUnix migration routine,' + mtype + '. Either install or choose a different migration routine.')
 
-    # save to seisunix format for migration with SU routines
-    out_fn = os.path.splitext(dat.fn)[0] + '.sgy'
-    dat.save_as_segy(out_fn)
-
     # Get the trace spacing
     if np.mean(dat.trace_int) <= 0:
         Warning("The trace spacing, variable 'dat.trace_int', should be greater than 0. Using gradient(dat.dist) instead.")
@@ -96,89 +95,147 @@ def migrationSeisUnix(dat,
     if dz is None:
         dz = 169 * dat.travel_time[-1] / 2 / dat.snum
 
-    # Do the migration through the command line
-    segy_name = os.path.splitext(dat.fn)[0]
-    bin_fn = os.path.splitext(dat.fn)[0] + '_mig.bin'
-
-    if quiet:
-        stderr = sp.PIPE
-    else:
-        stderr = None
-
-    ps1 = sp.Popen(['segyread', 'tape=' + segy_name + '.sgy'], stdout=sp.PIPE, stderr=stderr)
-    ps2 = sp.Popen(['segyclean'], stdin=ps1.stdout, stdout=sp.PIPE, stderr=stderr)
     # Time Wavenumber
     if mtype == 'sumigtk':
-        ps3 = sp.Popen(['sumigtk',
-                        'tmig={:f}'.format(tmig),
-                        'vmig={:f}'.format(vel * 1.e-6),
-                        'verbose=' + str(verbose),
-                        'nxpad={:d}'.format(int(nxpad)),
-                        'ltaper={:d}'.format(htaper),
-                        'dxcdp={:f}'.format(dx)],
-                       stdout=sp.PIPE,
-                       stderr=stderr,
-                       stdin=ps2.stdout)
+        args = ['sumigtk',
+                'tmig={:f}'.format(tmig),
+                'vmig={:f}'.format(vel * 1.e-6),
+                'verbose=' + str(verbose),
+                'nxpad={:d}'.format(int(nxpad)),
+                'ltaper={:d}'.format(htaper),
+                'dxcdp={:f}'.format(dx)]
+        out_snum = dat.snum
 
     # Fourier Finite Difference
     elif mtype == 'sumigffd':
         if vel_fn is None:
             raise ValueError('vel_fn needed for gffd')
-        ps3 = sp.Popen(['sumigffd',
-                        'vfile=' + vel_fn,
-                        'nz={:d}'.format(nz),
-                        'dz={:f}'.format(dz),
-                        'dt={:f}'.format(dat.dt * 1.0e-6),
-                        'dx={:f}'.format(dx)],
-                       stdout=sp.PIPE,
-                       stderr=stderr,
-                       stdin=ps2.stdout)
+        args = ['sumigffd',
+                'vfile=' + vel_fn,
+                'nz={:d}'.format(nz),
+                'dz={:f}'.format(dz),
+                'dt={:f}'.format(dat.dt * 1.0e-6),
+                'dx={:f}'.format(dx)]
+        out_snum = nz
     # Stolt
     elif mtype == 'sustolt':
-        ps3 = sp.Popen(['sustolt',
-                        'tmig={:f}'.format(tmig),
-                        'vmig={:f}'.format(vel * 1.0e-6),
-                        'verbose=' + str(verbose),
-                        'lstaper={:d}'.format(htaper),
-                        'lbtaper={:d}'.format(vtaper),
-                        'dxcdp={:f}'.format(dx),
-                        'cdpmin=0',
-                        'cdpmax={:d}'.format(dat.tnum)],
-                       stdout=sp.PIPE,
-                       stderr=stderr,
-                       stdin=ps2.stdout)
-    # Stolt
+        args = ['sustolt',
+                'tmig={:f}'.format(tmig),
+                'vmig={:f}'.format(vel * 1.0e-6),
+                'verbose=' + str(verbose),
+                'lstaper={:d}'.format(htaper),
+                'lbtaper={:d}'.format(vtaper),
+                'dxcdp={:f}'.format(dx),
+                'cdpmin=0',
+                'cdpmax={:d}'.format(dat.tnum)]
+        out_snum = dat.snum
     else:
-        ps1.stdout.close()
-        ps2.communicate()
-
         raise ValueError('The SeisUnix migration routine', mtype, 'has not been implemented in ImpDAR. Optionally, use ImpDAR to convert to SegY and run the migration in the command line.')
 
+    if quiet:
+        stderr = sp.DEVNULL
+    else:
+        stderr = None
+
+    # Stream the traces through the migration routine, reading the output straight into an array
+    su_in = to_su(dat)
+    su_out = np.zeros((dat.tnum,), dtype=su_dtype(out_snum))
+    ps = sp.Popen(args, stdin=sp.PIPE, stdout=sp.PIPE, stderr=stderr)
+    # Write from a thread so that neither pipe can fill up and block the other
+    writer = threading.Thread(target=_write_and_close, args=(ps.stdin, su_in))
+    writer.start()
+    out_buffer = memoryview(su_out.view(np.uint8))
+    nread = 0
+    while nread < len(out_buffer):
+        nbytes = ps.stdout.readinto(out_buffer[nread:])
+        if not nbytes:
+            break
+        nread += nbytes
+    ps.stdout.close()
+    writer.join()
+    ps.wait()
+
+    if nread != len(out_buffer) or np.any(su_out['ns'] != out_snum):
+        raise ValueError('SeisUnix routine {:s} did not return {:d} traces of {:d} samples'.format(mtype, dat.tnum, out_snum))
+
+    dat.data = np.ascontiguousarray(su_out['data'].transpose())
+    return dat
 
-    ps4 = sp.Popen(['sustrip', segy_name + '_' + mtype + '.sgy'], stdin=ps3.stdout, stderr=stderr, stdout=sp.PIPE)
-    with open(bin_fn, 'wb') as fout:
-        fout.write(ps4.communicate()[0])
-    with open(bin_fn, 'rb') as fid:
-        data_flat = np.fromfile(fid, np.float32)
-    for ps in [ps1, ps2, ps3, ps4]:
-        ps.wait()
-        ps.stdout.close()
-        try:
-            ps.stderr.close()
-        except AttributeError:
-            pass
 
-    dat.data = np.transpose(np.reshape(data_flat, (dat.tnum, dat.snum)))
+def su_dtype(snum):
+    """Get a numpy dtype for SeisUnix traces.
 
-    # Cleanup but don't worry if we fail
+    SU traces are the 240-byte SEG-Y trace header followed by snum 32-bit floats,
+    all in native byte order. Only the header fields we use are named;
+    the rest are left as padding.
+
+    Parameters
+    ----------
+    snum: int
+        Number of samples per trace
+
+    Returns
+    -------
+    np.dtype
+        The structured dtype for one trace
+    """
+    return np.dtype({'names': ['tracl', 'tracr', 'cdp', 'trid', 'ns', 'dt', 'd2', 'data'],
+                     'formats': ['i4', 'i4', 'i4', 'i2', 'u2', 'u2', 'f4', ('f4', (snum,))],
+                     'offsets': [0, 4, 20, 28, 114, 116, 188, 240],
+                     'itemsize': 240 + 4 * snum})
+
+
+def to_su(dat):
+    """Convert radar data to an array of SeisUnix traces.
+
+    Time is scaled up by 1e6, as for the SEGY output, so nanoseconds become milliseconds.
+
+    Parameters
+    ----------
+    dat: data as a class in the ImpDAR format
+
+    Returns
+    -------
+    np.ndarray
+        tnum SU traces with dtype from su_dtype
+
+    Raises
+    ------
+    ValueError
+        If the sample interval or number of samples do not fit in the header.
+    """
+    _check_data_shape(dat)
+    # ns and dt are unsigned shorts in the header
+    dt = int(round(dat.dt * 1.0e12))
+    if dt > np.iinfo(np.uint16).max or dt <= 0:
+        raise ValueError('SeisUnix headers only hold sample intervals up to {:.3f} ns, not {:.3f} ns'.format(
+            np.iinfo(np.uint16).max * 1.0e-3, dat.dt * 1.0e9))
+    if dat.snum > np.iinfo(np.uint16).max:
+        raise ValueError('SeisUnix headers only hold up to {:d} samples per trace, not {:d}'.format(
+            np.iinfo(np.uint16).max, dat.snum))
+    traces = np.zeros((dat.tnum,), dtype=su_dtype(dat.snum))
+    traces['tracl'] = np.arange(1, dat.tnum + 1)
+    traces['tracr'] = traces['tracl']
+    traces['cdp'] = traces['tracl']
+    traces['trid'] = 1
+    traces['ns'] = dat.snum
+    traces['dt'] = dt
+    traces['d2'] = np.mean(dat.trace_int)
+    traces['data'] = dat.data.transpose()
+    return traces
+
+
+def _write_and_close(stream, traces):
     try:
-        os.remove(bin_fn)
-        os.remove('header')
-        os.remove('binary')
-        os.remove(segy_name + '.sgy')
-    except FileNotFoundError:
+        stream.write(memoryview(traces.view(np.uint8)))
+    except BrokenPipeError:
+        # The routine died; we catch that when reading
         pass
-    return dat
+    finally:
+        try:
+            stream.close()
+        except BrokenPipeError:
+            pass
 
 
 def _check_data_shape(dat):
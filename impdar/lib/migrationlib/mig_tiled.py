@@ -0,0 +1,200 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+
+"""
+Memory-bounded migration of long profiles.
+
+The profile is split into overlapping blocks of traces, each of which is migrated
+on its own with any of the migration routines. The blocks are then blended back
+together with linear ramps across the overlaps, so the memory needed by the
+migration itself scales with the block size rather than the profile length.
+Tiles are copied out as they are migrated and added into the output as they
+finish, so beyond the input and output only the tiles in progress are held.
+"""
+
+from __future__ import print_function
+import copy
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+import numpy as np
+
+from .mig_python import _taper
+
+
+def migrationTiled(dat, max_mem, overlap=None, n_procs=1, **migrate_kwargs):
+    """Migrate a profile in overlapping tiles of traces.
+
+    Parameters
+    ---------
+    dat: data as a class in the ImpDAR format
+    max_mem: approximate memory (MB) that the migration of one tile may use.
+        This sets the number of traces per tile.
+    overlap: number of traces shared by neighboring tiles. Default is the lateral
+        extent of a diffraction hyperbola at the bottom of the profile.
+    n_procs: number of processes to migrate tiles at once, default 1.
+        Note that each process uses up to max_mem.
+    migrate_kwargs: passed to :func:`RadarData.migrate <impdar.lib.RadarData.RadarData.migrate>`
+        for each tile (e.g. mtype, vel, htaper). The htaper is applied once at the ends
+        of the profile, not at the edges of each tile.
+
+    Output
+    ---------
+    dat: data as a class in the ImpDAR format (with dat.data now being migrated data)
+
+    """
+    start = time.time()
+    tile_traces = tileSize(dat, max_mem)
+    if overlap is None:
+        overlap = _default_overlap(dat, migrate_kwargs.get('vel', 1.68e8))
+    if overlap > tile_traces // 3:
+        print('Overlap of {:d} traces is too large for {:d}-trace tiles, reducing to {:d}'.format(
+            int(overlap), tile_traces, tile_traces // 3))
+        overlap = tile_traces // 3
+    overlap = int(overlap)
+
+    if tile_traces >= dat.tnum:
+        print('The whole profile fits in memory, migrating without tiles')
+        dat.migrate(**migrate_kwargs)
+        return dat
+
+    # Taper only the ends of the profile; a taper at every tile edge would dent the seams
+    if migrate_kwargs.get('mtype', 'stolt') not in ['kirch', 'kirch_table']:
+        h = _taper(dat.tnum, migrate_kwargs.get('htaper', 10))
+        edges = h < 1.
+        dat.data[:, edges] *= h[edges]
+        migrate_kwargs = dict(migrate_kwargs, htaper=0)
+
+    bounds = tileBounds(dat.tnum, tile_traces, overlap)
+    print('Migrating {:d} tiles of {:d} traces with at least {:d} traces of overlap'.format(
+        len(bounds), tile_traces, overlap))
+    # Tiles are copied out only when they are migrated, and added into the output as
+    # soon as they are done, so only the tiles in progress are held at once
+    blended = {'out': None, 'tile': None}
+
+    def blend(i, tile):
+        tstart, tend = bounds[i]
+        if blended['out'] is None:
+            blended['out'] = np.zeros((tile.data.shape[0], dat.tnum), dtype=tile.data.dtype)
+            blended['tile'] = tile
+        blended['out'][:, tstart:tend] += tile.data * _tile_weights(bounds, i)[None, :]
+
+    if n_procs is not None and n_procs > 1:
+        with ProcessPoolExecutor(max_workers=n_procs) as executor:
+            running = {}
+            for i, (tstart, tend) in enumerate(bounds):
+                running[executor.submit(_migrate_tile, _get_tile(dat, tstart, tend), migrate_kwargs)] = i
+                if len(running) >= n_procs:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        blend(running.pop(future), future.result())
+            for future in as_completed(running):
+                blend(running[future], future.result())
+    else:
+        for i, (tstart, tend) in enumerate(bounds):
+            blend(i, _migrate_tile(_get_tile(dat, tstart, tend), migrate_kwargs))
+
+    _set_vertical(dat, blended['tile'])
+    dat.data = blended['out']
+    print('Tiled migration of %.0fx%.0f matrix complete in %.2f seconds'
+          % (dat.tnum, dat.snum, time.time() - start))
+    return dat
+
+
+def tileSize(dat, max_mem):
+    """Get the number of traces per tile for a memory budget.
+
+    The frequency-domain routines hold a few complex128 copies of the data,
+    padded up to a power of two in time, so we budget 64 bytes per padded sample.
+
+    Parameters
+    ---------
+    dat: data as a class in the ImpDAR format
+    max_mem: memory budget (MB)
+
+    Output
+    ---------
+    int: number of traces per tile
+    """
+    nt = 2 ** int(np.ceil(np.log2(max(dat.snum, 2))))
+    bytes_per_trace = 64 * nt
+    return max(3, int(max_mem * 1.0e6 // bytes_per_trace))
+
+
+def tileBounds(tnum, tile_traces, overlap):
+    """Get the (start, end) traces of overlapping tiles covering the profile.
+
+    Tiles are all tile_traces long, and spread evenly so that neighbors share
+    at least overlap traces.
+
+    Parameters
+    ---------
+    tnum: number of traces in the profile
+    tile_traces: number of traces per tile
+    overlap: minimum number of traces shared by neighboring tiles
+
+    Output
+    ---------
+    list of (start, end) tuples, with the last tile ending at tnum
+    """
+    if tile_traces >= tnum:
+        return [(0, tnum)]
+    ntiles = int(np.ceil((tnum - overlap) / (tile_traces - overlap)))
+    starts = np.round(np.linspace(0, tnum - tile_traces, ntiles)).astype(int)
+    return [(int(tstart), int(tstart) + tile_traces) for tstart in starts]
+
+
+def _default_overlap(dat, vel):
+    """Traces spanned by a diffraction from the bottom of the profile."""
+    if hasattr(vel, '__len__'):
+        vel = np.max(np.asarray(vel)[:, 0])
+    if np.mean(dat.trace_int) > 0:
+        dx = np.mean(dat.trace_int)
+    else:
+        dx = np.mean(np.diff(dat.dist)) * 1.0e3
+    return int(np.ceil(vel * np.max(dat.travel_time) / 1.0e6 / 2. / dx))
+
+
+def _tile_weights(bounds, i):
+    """Linear ramps over the overlaps of tile i with its neighbors; the ramps of neighbors sum to one."""
+    tstart, tend = bounds[i]
+    weights = np.ones((tend - tstart,))
+    if i > 0:
+        n_over = bounds[i - 1][1] - tstart
+        weights[:n_over] = (np.arange(n_over) + 0.5) / n_over
+    if i < len(bounds) - 1:
+        n_over = tend - bounds[i + 1][0]
+        weights[tend - tstart - n_over:] = (np.arange(n_over)[::-1] + 0.5) / n_over
+    return weights
+
+
+def _get_tile(dat, tstart, tend):
+    """Copy out the part of the data needed to migrate a tile."""
+    tile = copy.copy(dat)
+    tile.data = dat.data[:, tstart:tend].copy()
+    tile.tnum = tend - tstart
+    tile.flags = copy.deepcopy(dat.flags)
+    tile.travel_time = dat.travel_time.copy()
+    for attr in ['dist', 'trace_int', 'trace_num', 'lat', 'long', 'elev', 'x_coord', 'y_coord', 'decday', 'trig',
+                 'pressure']:
+        val = getattr(dat, attr, None)
+        if val is not None and np.size(val) == dat.tnum and np.size(val) > 1:
+            setattr(tile, attr, np.asarray(val)[tstart:tend].copy())
+    # None of the per-trace extras are needed for migration
+    tile.picks = None
+    return tile
+
+
+def _migrate_tile(tile, migrate_kwargs):
+    tile.migrate(**migrate_kwargs)
+    return tile
+
+
+def _set_vertical(dat, tile):
+    """Some routines (Stolt) change the vertical sampling, so copy it over."""
+    dat.travel_time = tile.travel_time
+    dat.dt = tile.dt
+    dat.snum = tile.data.shape[0]
@@ -0,0 +1,616 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+"""Lazily chain processing steps, so that they can be fused into fewer passes over the data.
+
+Steps are recorded with the names used by `impproc` (e.g. vbp, rgain, crop),
+and nothing happens until :meth:`Pipeline.run`. Before running, the steps are
+planned:
+
+* Crops move ahead of the filters that they commute with, so less data are filtered.
+* Reversal is only a view of the data, so it moves out of the way of trace-local steps.
+* Consecutive trace-local steps (e.g. a bandpass then a range gain) are fused into one
+  pass over the data, a block of traces at a time, writing back into the data.
+  Restacking joins these passes too, carrying partial groups of traces from one block
+  to the next.
+
+The plan, and an estimate of the peak memory needed to run it, are printed before running.
+"""
+
+import contextlib
+import copy
+import inspect
+import io
+import tempfile
+
+import numpy as np
+
+from .gpslib import interp as interpdeep
+from .streaming import read_blocks, Restacker, RESTACK_VARS
+
+# Per-trace variables that need to be split into blocks of traces and put back together
+TRACE_VARS = ['dist', 'pressure', 'lat', 'long', 'x_coord', 'y_coord', 'elev', 'decday', 'trig',
+              'trace_int', 'trace_num']
+# Things that trace-local steps may change, which are the same for every block of traces
+VERTICAL_VARS = ['travel_time', 'snum', 'dt', 'nmo_depth', 'trig', 'flags']
+
+# Step names, from impproc, and the RadarData method that does each
+STEP_METHODS = {'restack': 'restack',
+                'rev': 'reverse',
+                'vbp': 'vertical_band_pass',
+                'hbp': 'horizontal_band_pass',
+                'lp': 'lowpass',
+                'hfilt': 'horizontalfilt',
+                'ahfilt': 'adaptivehfilt',
+                'nmo': 'nmo',
+                'denoise': 'denoise',
+                'interp': None,
+                'crop': 'crop',
+                'hcrop': 'hcrop',
+                'rgain': 'rangegain',
+                'agc': 'agc',
+                'migrate': 'migrate',
+                'elev': 'elev_correct'}
+
+# Steps that a vertical crop can move ahead of. Only the edge effects of the bandpass change.
+CROP_COMMUTES = ['vbp', 'hbp', 'lp', 'hfilt', 'rev', 'hcrop']
+
+
+class Step():
+    """One processing step, and its arguments.
+
+    Parameters
+    ----------
+    name: str
+        The name of the step, one of STEP_METHODS
+    args:
+        Arguments to the RadarData method
+    kwargs:
+        Keyword arguments to the RadarData method
+    """
+
+    def __init__(self, name, *args, **kwargs):
+        if name not in STEP_METHODS:
+            raise ValueError('Unknown processing step {:s}'.format(str(name)))
+        self.name = name
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        args = [repr(arg) for arg in self.args] + ['{:s}={:s}'.format(key, repr(val))
+                                                   for key, val in self.kwargs.items()]
+        return '{:s}({:s})'.format(self.name, ', '.join(args))
+
+    def arguments(self, dat):
+        """Get all the arguments, including defaults, by name."""
+        if STEP_METHODS[self.name] is None:
+            return {}
+        method = getattr(dat, STEP_METHODS[self.name])
+        bound = inspect.signature(method).bind(*self.args, **self.kwargs)
+        bound.apply_defaults()
+        return bound.arguments
+
+    def apply(self, dat):
+        """Run the step on a RadarData object."""
+        if self.name == 'interp':
+            interpdeep([dat], float(self.args[0]), self.args[1])
+        else:
+            getattr(dat, STEP_METHODS[self.name])(*self.args, **self.kwargs)
+
+    def is_view(self, dat):
+        """Whether the step only takes a view of the data."""
+        if self.name in ['rev', 'hcrop']:
+            return True
+        return self.name == 'crop' and self.arguments(dat)['dimension'] != 'pretrig'
+
+    def is_trace_local(self, dat):
+        """Whether the step does the same thing to each trace independently of the others."""
+        if self.name in ['vbp', 'nmo', 'rgain']:
+            return True
+        args = self.arguments(dat)
+        if self.name == 'agc':
+            return bool(args['per_trace'])
+        if self.name == 'crop':
+            # crop also moves picks, which we do not split up, and a ragged crop
+            # gives a number of samples that depends on the shallowest trigger
+            if args['dimension'] == 'pretrig' and np.ndim(dat.trig) > 0:
+                return False
+            return dat.picks is None or dat.picks.samp1 is None
+        if self.name == 'denoise':
+            # Without a noise level, it is estimated from the whole profile
+            return args['hor_win'] == 1 and args['noise'] is not None
+        return False
+
+    def is_streamable(self, dat):
+        """Whether the step can run on consecutive blocks of traces, in order (see :meth:`block_apply`)."""
+        return self.name == 'restack' or self.is_trace_local(dat)
+
+    def block_apply(self):
+        """Get a function that runs the step on consecutive blocks of traces.
+
+        This is just :meth:`apply`, except for restacking, which needs to remember the
+        traces at the end of one block that have not filled a group.
+        """
+        if self.name == 'restack':
+            return _BlockRestacker(*self.args, **self.kwargs).apply
+        return self.apply
+
+    def flips_with_reverse(self, dat):
+        """Whether reversing the profile before or after this step gives the same result."""
+        if self.name in ['vbp', 'nmo', 'denoise', 'agc']:
+            return self.is_trace_local(dat)
+        if self.name == 'rgain':
+            # reversal does not flip the trigger
+            return np.ndim(dat.trig) == 0
+        if self.name == 'crop':
+            return self.is_trace_local(dat) and self.arguments(dat)['dimension'] != 'pretrig'
+        return False
+
+    def new_shape(self, dat, shape):
+        """Estimate the shape of the data after this step."""
+        snum, tnum = shape
+        args = self.arguments(dat)
+        if self.name == 'crop' and args['dimension'] in ['snum', 'twtt']:
+            if args['dimension'] == 'snum':
+                lim = int(args['lim'])
+            else:
+                lim = int(np.sum(dat.travel_time < args['lim']))
+            lim = min(max(lim, 0), snum)
+            snum = snum - lim if args['top_or_bottom'] == 'top' else lim
+        elif self.name == 'hcrop' and args['dimension'] == 'tnum':
+            lim = min(max(int(args['lim']), 0), tnum)
+            tnum = tnum - lim if args['left_or_right'] == 'left' else lim
+        elif self.name == 'restack':
+            # restack rounds up to an odd number of traces
+            tnum = tnum // (int(args['traces']) // 2 * 2 + 1)
+        return (snum, tnum)
+
+
+class Pipeline():
+    """A lazily evaluated series of processing steps.
+
+    Steps are added with :meth:`add`, in the order they should be done, e.g.
+    ``Pipeline().add('vbp', 1., 10.).add('rgain', 0.01).add('crop', 100, 'bottom')``.
+    Nothing happens until :meth:`run`.
+
+    Parameters
+    ----------
+    chunksize: int, optional
+        Number of traces processed at once in fused passes. Default is about 4 million samples.
+    """
+
+    def __init__(self, chunksize=None):
+        self.steps = []
+        self.chunksize = chunksize
+
+    def add(self, name, *args, **kwargs):
+        """Add a processing step.
+
+        Parameters
+        ----------
+        name: str
+            Step name, as in `impproc` (restack, rev, vbp, hbp, lp, hfilt, ahfilt, nmo, denoise,
+            interp, crop, hcrop, rgain, agc, migrate, elev)
+        args, kwargs:
+            Passed to the matching RadarData method
+
+        Returns
+        -------
+        Pipeline
+            This pipeline, so calls can be chained
+        """
+        self.steps.append(Step(name, *args, **kwargs))
+        return self
+
+    @classmethod
+    def from_process_args(cls, interp=None, rev=False, vbp=None, hfilt=None, ahfilt=None, nmo=None,
+                          crop=None, hcrop=None, restack=None, denoise=None, migrate=None, **kwargs):
+        """Make a pipeline of the steps that :func:`impdar.lib.process.process` would do, in its order."""
+        pipeline = cls()
+        if hcrop is not None:
+            pipeline.add('hcrop', float(hcrop[0]), hcrop[1], hcrop[2])
+        if restack is not None:
+            if isinstance(restack, (list, tuple)):
+                restack = restack[0]
+            pipeline.add('restack', int(restack))
+        if rev:
+            pipeline.add('rev')
+        if vbp is not None:
+            pipeline.add('vbp', *vbp)
+        if hfilt is not None:
+            pipeline.add('hfilt', *hfilt)
+        if ahfilt:
+            if isinstance(ahfilt, (list, tuple)):
+                ahfilt = ahfilt[0]
+            pipeline.add('ahfilt', window_size=ahfilt)
+        if nmo is not None:
+            if isinstance(nmo, (float, int)):
+                nmo = (nmo, 1.6)
+            pipeline.add('nmo', *nmo)
+        if denoise is not None:
+            pipeline.add('denoise', *denoise)
+        if interp is not None:
+            pipeline.add('interp', float(interp[0]), interp[1])
+        if crop is not None:
+            pipeline.add('crop', float(crop[0]), crop[1], crop[2])
+        if migrate is not None:
+            pipeline.add('migrate', mtype='stolt')
+        return pipeline
+
+    @classmethod
+    def from_function(cls, func, *args, **kwargs):
+        """Make a pipeline of the RadarData methods that a function calls (e.g. an impproc step).
+
+        The function is called on a stand-in that records the calls, rather than on data.
+
+        Parameters
+        ----------
+        func: callable
+            Called as func(dat, *args, **kwargs)
+
+        Returns
+        -------
+        Pipeline or None
+            None if the function does anything other than call processing methods
+        """
+        methods = {method: name for name, method in STEP_METHODS.items() if method is not None}
+        recorder = _CallRecorder()
+        try:
+            func(recorder, *args, **kwargs)
+        except Exception:
+            # Anything that needs the data themselves, or is otherwise not a plain processing step
+            return None
+        if len(recorder.calls) == 0 or any(method not in methods for method, _, _ in recorder.calls):
+            return None
+        pipeline = cls()
+        for method, method_args, method_kwargs in recorder.calls:
+            pipeline.add(methods[method], *method_args, **method_kwargs)
+        return pipeline
+
+    def plan(self, dat):
+        """Reorder and group the steps for running on some data.
+
+        Parameters
+        ----------
+        dat: RadarData
+            The data that will be processed
+
+        Returns
+        -------
+        list of (str, list of Step)
+            The passes over the data, in order. The str is 'view', 'fused' (trace-local steps
+            run a block of traces at a time), or 'full' (a step that needs the whole profile).
+        """
+        steps = list(self.steps)
+
+        # Move crops as early as they can go
+        for i in range(len(steps)):
+            if steps[i].name != 'crop' or steps[i].arguments(dat)['dimension'] not in ['snum', 'twtt']:
+                continue
+            j = i
+            while j > 0 and steps[j - 1].name in CROP_COMMUTES:
+                steps[j - 1], steps[j] = steps[j], steps[j - 1]
+                j -= 1
+
+        # Move reversals after the trace-local steps that follow them, so those can be fused
+        for i in range(len(steps) - 1, -1, -1):
+            if steps[i].name != 'rev':
+                continue
+            j = i
+            while j < len(steps) - 1 and steps[j + 1].flips_with_reverse(dat):
+                steps[j + 1], steps[j] = steps[j], steps[j + 1]
+                j += 1
+
+        passes = []
+        for step in steps:
+            if step.is_streamable(dat):
+                if len(passes) > 0 and passes[-1][0] in ['fused', 'local view']:
+                    passes[-1][1].append(step)
+                else:
+                    passes.append(('local view', [step]))
+                if not step.is_view(dat):
+                    passes[-1] = ('fused', passes[-1][1])
+            elif step.is_view(dat):
+                passes.append(('view', [step]))
+            else:
+                passes.append(('full', [step]))
+        # A run of trace-local views (i.e. crops) needs no pass over the data
+        passes = [('view', steps) if kind == 'local view' else (kind, steps) for kind, steps in passes]
+        return passes
+
+    def memory_estimate(self, dat, passes=None):
+        """Estimate the peak memory, in bytes, needed to process the data.
+
+        The estimate counts the input and output matrices of each pass, plus the
+        working copy of a block of traces for fused passes.
+
+        Parameters
+        ----------
+        dat: RadarData
+            The data that will be processed
+        passes: list, optional
+            The planned passes. Default is the result of :meth:`plan`.
+
+        Returns
+        -------
+        fused: int
+            Peak bytes for the planned passes
+        unfused: int
+            Peak bytes for running each step on the whole matrix, in the order added
+        """
+        if passes is None:
+            passes = self.plan(dat)
+        itemsize = np.result_type(dat.data.dtype, np.float64).itemsize
+
+        def matrix(shape):
+            return shape[0] * shape[1] * itemsize
+
+        shape = dat.data.shape
+        unfused = matrix(shape)
+        for step in self.steps:
+            new_shape = step.new_shape(dat, shape)
+            if not step.is_view(dat):
+                unfused = max(unfused, matrix(shape) + matrix(new_shape))
+            shape = new_shape
+
+        shape = dat.data.shape
+        fused = matrix(shape)
+        for kind, steps in passes:
+            new_shape = shape
+            for step in steps:
+                new_shape = step.new_shape(dat, new_shape)
+            if kind == 'view':
+                pass
+            elif kind == 'fused':
+                chunksize = self._chunksize(shape)
+                # Working copies of a block, and a new output if the shape changes
+                peak = matrix(shape) + 2 * matrix((shape[0], min(chunksize, shape[1])))
+                if new_shape != shape:
+                    peak += matrix(new_shape)
+                fused = max(fused, peak)
+            else:
+                fused = max(fused, matrix(shape) + matrix(new_shape))
+            shape = new_shape
+        return fused, unfused
+
+    def report(self, dat, passes=None):
+        """Get a description of the planned passes and their memory use.
+
+        Parameters
+        ----------
+        dat: RadarData
+            The data that will be processed
+        passes: list, optional
+            The planned passes. Default is the result of :meth:`plan`.
+
+        Returns
+        -------
+        str
+        """
+        if passes is None:
+            passes = self.plan(dat)
+        fused, unfused = self.memory_estimate(dat, passes)
+        lines = ['Processing plan for {:d}x{:d} matrix:'.format(dat.data.shape[0], dat.data.shape[1])]
+        for i, (kind, steps) in enumerate(passes):
+            lines.append('  {:d}. {:s}: {:s}'.format(i + 1, kind, ', '.join([repr(step) for step in steps])))
+        lines.append('Estimated peak memory {:.1f} MB ({:.1f} MB one step at a time)'.format(
+            fused / 1.0e6, unfused / 1.0e6))
+        return '\n'.join(lines)
+
+    def run(self, dat, stream=False, tmpdir=None):
+        """Plan, report, and do the processing.
+
+        Parameters
+        ----------
+        dat: RadarData
+            The data to process. It is modified in place.
+        stream: bool, optional
+            Read the blocks of traces for fused passes in a background thread. Use this when the
+            data are memory-mapped from disk (or left in the file, e.g. lazily loaded BSI data), so
+            that only a few blocks are in memory at a time: outputs that cannot be written back
+            into the data go to a memory-mapped temporary file. Default False.
+        tmpdir: str, optional
+            Directory for the temporary files when streaming. Default is the system default.
+
+        Returns
+        -------
+        bool
+            Whether any steps were done
+        """
+        if len(self.steps) == 0:
+            return False
+        passes = self.plan(dat)
+        print(self.report(dat, passes))
+        for kind, steps in passes:
+            if kind == 'fused' and (stream or dat.tnum > self._chunksize(dat.data.shape)):
+                run_fused(dat, steps, self._chunksize(dat.data.shape), stream=stream, tmpdir=tmpdir)
+            else:
+                # Data left in the file need to be read to be processed in place
+                dat.load_data()
+                for step in steps:
+                    step.apply(dat)
+        return True
+
+    def _chunksize(self, shape):
+        if self.chunksize is not None:
+            return int(self.chunksize)
+        return max(1, 2 ** 22 // max(shape[0], 1))
+
+
+def get_block(dat, tstart, tend, data=None):
+    """Get a shallow copy of some data with only a block of the traces.
+
+    The data of the block are a view into the data, unless they have already been read.
+
+    Parameters
+    ----------
+    dat: RadarData
+        The full profile
+    tstart: int
+        First trace of the block
+    tend: int
+        End (exclusive) of the block
+    data: np.ndarray, optional
+        The data of the block, if already read (e.g. by read_blocks). Default is to slice dat.data.
+
+    Returns
+    -------
+    RadarData
+        The block
+    """
+    block = copy.copy(dat)
+    if data is None:
+        data = dat.data[:, tstart:tend]
+    block.data = data
+    block.tnum = block.data.shape[1]
+    block.flags = copy.deepcopy(dat.flags)
+    for attr in TRACE_VARS:
+        val = getattr(dat, attr, None)
+        if _is_per_trace(val, dat.tnum):
+            setattr(block, attr, np.asarray(val)[tstart:tend].copy())
+    block.picks = None
+    return block
+
+
+def run_fused(dat, steps, chunksize, stream=False, out=None, tmpdir=None):
+    """Run streamable steps on a block of traces at a time, putting the results back in dat.
+
+    Parameters
+    ----------
+    dat: RadarData
+        The data to process, in place
+    steps: list of Step
+        Trace-local steps, or restacking
+    chunksize: int
+        Number of traces per block
+    stream: bool, optional
+        Read blocks with :func:`read_blocks <impdar.lib.streaming.read_blocks>`, so that reading
+        the next block overlaps with processing this one. Default False (work on views of the data).
+    out: np.ndarray, optional
+        Array to write the output to (e.g. a np.memmap), if the shape of the output is known.
+        Default is the data themselves if they are in memory and the steps do not change their
+        shape or type. Otherwise, a new array, which is a memory-mapped temporary file when streaming.
+    tmpdir: str, optional
+        Directory for the temporary file when streaming. Default is the system default.
+    """
+    per_trace = [attr for attr in TRACE_VARS if _is_per_trace(getattr(dat, attr, None), dat.tnum)]
+    out_trace = {attr: [] for attr in per_trace}
+    tnum_out = dat.tnum
+    for step in steps:
+        tnum_out = step.new_shape(dat, (dat.snum, tnum_out))[1]
+    appliers = [step.block_apply() for step in steps]
+    block = None
+    nblocks = 0
+    ostart = 0
+    if stream:
+        blocks = read_blocks(dat.data, chunksize)
+    else:
+        blocks = ((tstart, dat.data[:, tstart:tstart + chunksize]) for tstart in range(0, dat.tnum, chunksize))
+    for tstart, data_block in blocks:
+        tend = tstart + data_block.shape[1]
+        this_block = get_block(dat, tstart, tend, data=data_block)
+        if tstart == 0:
+            _apply_all(appliers, this_block)
+        else:
+            # The steps already said what they are doing
+            with contextlib.redirect_stdout(io.StringIO()):
+                _apply_all(appliers, this_block)
+        if this_block.data.shape[1] == 0:
+            # Restacking is waiting for the traces of the next block
+            continue
+        block = this_block
+        nblocks += 1
+        oend = ostart + block.data.shape[1]
+        if out is None:
+            in_memory = isinstance(dat.data, np.ndarray) and not isinstance(dat.data, np.memmap)
+            if in_memory and block.data.shape[0] == dat.data.shape[0] and block.data.dtype == dat.data.dtype \
+                    and tnum_out == dat.tnum:
+                # Blocks are read before they are written, so this is safe even when streaming
+                out = dat.data
+            elif stream:
+                out = _disk_array((block.data.shape[0], tnum_out), block.data.dtype, tmpdir)
+            else:
+                out = np.empty((block.data.shape[0], tnum_out), dtype=block.data.dtype)
+        # Steps that work in place have already written into out
+        if not np.shares_memory(block.data, out):
+            out[:, ostart:oend] = block.data
+        for attr in per_trace:
+            val = getattr(block, attr)
+            if val is not None and np.size(val) == oend - ostart:
+                out_trace[attr].append(np.asarray(val))
+        ostart = oend
+
+    if block is None:
+        raise ValueError('No traces are left after processing')
+    dat.data = out
+    dat.tnum = out.shape[1]
+    for attr in VERTICAL_VARS:
+        if attr not in per_trace:
+            setattr(dat, attr, getattr(block, attr))
+    for attr in per_trace:
+        if len(out_trace[attr]) == nblocks:
+            setattr(dat, attr, np.hstack(out_trace[attr]))
+        else:
+            setattr(dat, attr, getattr(block, attr))
+
+
+def _apply_all(appliers, block):
+    for apply in appliers:
+        apply(block)
+        if block.data.shape[1] == 0:
+            return
+
+
+class _BlockRestacker():
+    """Restack consecutive blocks of traces, matching RadarData.restack on the whole profile."""
+
+    def __init__(self, traces, preserve_dtype=False):
+        traces = int(traces)
+        if traces % 2 == 0:
+            print('Only will stack odd numbers of traces. Using {:d}'.format(int(traces + 1)))
+            traces = traces + 1
+        self.restacker = Restacker(traces, preserve_dtype=preserve_dtype)
+        self.ntraces = 0
+
+    def apply(self, block):
+        """Restack a block in place, keeping any traces that do not fill a group for the next block."""
+        stack, oned_newdata = self.restacker.add(block.data, **{key: getattr(block, key) for key in RESTACK_VARS
+                                                                if np.size(getattr(block, key)) == block.tnum})
+        block.tnum = stack.shape[1]
+        block.data = stack
+        block.trace_num = np.arange(self.ntraces, self.ntraces + block.tnum).astype(int) + 1
+        block.trace_int = np.zeros((block.tnum, ))
+        for var, val in oned_newdata.items():
+            setattr(block, var, val)
+        block.flags.restack = True
+        self.ntraces += block.tnum
+
+
+def _disk_array(shape, dtype, tmpdir=None):
+    """Get an uninitialized array backed by a temporary file, which is removed when closed."""
+    return np.memmap(tempfile.TemporaryFile(dir=tmpdir), dtype=dtype, mode='w+', shape=shape)
+
+
+class _NotAStep(Exception):
+    pass
+
+
+class _CallRecorder():
+    """Stand-in for RadarData that records the methods called on it."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in [method for method in STEP_METHODS.values()]:
+            raise _NotAStep(name)
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
+
+
+def _is_per_trace(val, tnum):
+    return val is not None and np.ndim(val) > 0 and np.size(val) == tnum and tnum > 1
@@ -12,6 +12,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import scipy.signal as signal
 from .load import load
+from .shifts import ragged_shift
 from matplotlib.colors import is_color_like
 
 # define a set of non-gray colors (from Paul Tol)
@@ -240,17 +241,7 @@ def plot_radargram(dat, xdat='tnum', ydat='twtt', x_range=(0, -1),
         offset, _ = get_offset(dat, flatten_layer)
 
         # Now construct the data matrix
-        tmp_data = np.zeros_like(dat.data)
-        tmp_data[:, :] = np.nan
-        for j in range(tmp_data.shape[1]):
-            if np.isnan(offset[j]):
-                continue
-            if int(offset[j]) == 0:
-                tmp_data[:, j] = dat.data[:, j]
-            elif offset[j] < 0 and (abs(offset[j]) < dat.snum):
-                tmp_data[:int(offset[j]), j] = dat.data[-int(offset[j]):, j]
-            elif (abs(offset[j]) < dat.snum) and offset[j]:
-                tmp_data[int(offset[j]):, j] = dat.data[:-int(offset[j]), j]
+        tmp_data = ragged_shift(dat.data, offset)
         im = ax.imshow(norm(tmp_data[:, x_range[0]:x_range[-1]]),
                        cmap=cmap,
                        vmin=clims[0],
@@ -23,11 +23,15 @@ import numpy as np
 from .load import load
 from .gpslib import interp as interpdeep
 from .Picks import Picks
+from .pipeline import Pipeline
 
 from copy import deepcopy
 
+# Loader options that leave the data on disk until they are streamed
+STREAM_LOAD_KWARGS = {'gssi': {'memmap': True}, 'bsi': {'lazy': True}}
 
-def process_and_exit(fn, cat=False, filetype='mat', o=None, **kwargs):
+
+def process_and_exit(fn, cat=False, filetype='mat', o=None, stream=False, chunksize=None, **kwargs):
     """Perform one or more processing steps, save, and exit.
 
     Parameters
@@ -41,12 +45,28 @@ def process_and_exit(fn, cat=False, filetype='mat', o=None, **kwargs):
         The type of input file. Default is .mat.
     o: str, optional
         An output path
+    stream: bool, optional
+        Run the steps with a :class:`Pipeline <impdar.lib.pipeline.Pipeline>`, which fuses
+        trace-local steps and streams blocks of traces through them while the next block is read.
+        GSSI input is memory-mapped and BSI input is read lazily, and new outputs are written to
+        memory-mapped temporary files next to the input, so processing needs little memory.
+        Note that writing the .mat output still needs the processed data in memory once.
+        Ignored when concatenating, since that needs everything loaded. Default False.
+    chunksize: int, optional
+        Number of traces per block when streaming.
     kwargs:
         These are the processing arguments for `process`
     """
 
-    def _p_and_e(radar_data):
-        processed = process(radar_data, **kwargs)
+    def _p_and_e(radar_data, tmpdir=None):
+        if stream and not cat:
+            pipeline = Pipeline.from_process_args(**kwargs)
+            pipeline.chunksize = chunksize
+            processed = False
+            for dat in radar_data:
+                processed = pipeline.run(dat, stream=True, tmpdir=tmpdir) or processed
+        else:
+            processed = process(radar_data, **kwargs)
         if not processed and not cat:
             print('No processing steps performed. Not saving!')
         else:
@@ -65,6 +85,9 @@ def process_and_exit(fn, cat=False, filetype='mat', o=None, **kwargs):
     else:
         # Otherwise, we can do things sequentially
         for fn_i in fn:
+            if stream:
+                radar_data = load(filetype, fn, **STREAM_LOAD_KWARGS.get(filetype, {}))
+                return _p_and_e(radar_data, tmpdir=os.path.dirname(os.path.abspath(fn_i)))
             radar_data = load(filetype, fn)
             return _p_and_e(radar_data)
 
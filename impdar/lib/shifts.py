@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+"""Shift every trace vertically by its own number of samples."""
+
+import numpy as np
+
+
+def ragged_shift(data, shifts, out_rows=None, fill=np.nan, dtype=None):
+    """Shift each trace (column) of data down by its own integer number of samples.
+
+    The output is out[i, j] = data[i - shifts[j], j], with fill wherever that
+    falls outside of the data. Runs of neighboring traces with the same shift
+    are copied as one block, so smoothly varying shifts (e.g. from elevation or
+    a trigger) need far fewer copies than there are traces.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        snum x tnum array
+    shifts: np.ndarray
+        tnum array of shifts, in samples. Positive moves the trace down (to later samples).
+        Non-integer shifts are truncated towards zero. Traces with a NaN shift are all fill.
+    out_rows: int, optional
+        Number of samples in the output. Default is the same as the input.
+    fill: float, optional
+        Value for samples with no data shifted into them. Default NaN.
+    dtype: np.dtype, optional
+        dtype of the output (e.g. np.float32 to save memory). Default is that of the data,
+        promoted to float if needed to hold fill.
+
+    Returns
+    -------
+    out: np.ndarray
+        out_rows x tnum array
+    """
+    data = np.asarray(data)
+    shifts = np.asarray(shifts, dtype=float).flatten()
+    snum, tnum = data.shape
+    if len(shifts) != tnum:
+        raise ValueError('Need one shift per trace')
+    if out_rows is None:
+        out_rows = snum
+    if dtype is None:
+        if np.issubdtype(data.dtype, np.inexact) or (np.isfinite(fill) and float(fill).is_integer()):
+            dtype = data.dtype
+        else:
+            dtype = np.float64
+
+    nan_shift = np.isnan(shifts)
+    int_shifts = np.zeros((tnum, ), dtype=np.int64)
+    int_shifts[~nan_shift] = np.trunc(shifts[~nan_shift]).astype(np.int64)
+
+    out = np.full((out_rows, tnum), fill, dtype=dtype)
+    if tnum == 0:
+        return out
+    # Neighboring traces usually have the same shift, so copy runs of them at once
+    changes = np.flatnonzero((np.diff(int_shifts) != 0) | (np.diff(nan_shift) != 0)) + 1
+    run_starts = np.hstack(([0], changes))
+    run_ends = np.hstack((changes, [tnum]))
+    for start, end in zip(run_starts, run_ends):
+        if nan_shift[start]:
+            continue
+        shift = int_shifts[start]
+        top = max(shift, 0)
+        bottom = min(snum + shift, out_rows)
+        if bottom > top:
+            out[top:bottom, start:end] = data[top - shift:bottom - shift, start:end]
+    return out
@@ -0,0 +1,193 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+"""Process radar data a block of traces at a time, as it is being loaded."""
+
+import threading
+import queue
+
+import numpy as np
+
+# These are the 1D, per-trace variables that are averaged when restacking
+RESTACK_VARS = ['dist', 'pressure', 'lat', 'long', 'x_coord', 'y_coord', 'elev', 'decday', 'trig']
+
+
+class Restacker():
+    """Restack traces as they arrive.
+
+    Blocks of traces (and their per-trace variables) are added in order, and
+    every complete group of `traces` traces is averaged into one. Traces left
+    over at the end of one block are stacked with the start of the next, so the
+    result is the same as restacking the whole profile at once. Traces that do
+    not fill a final group are dropped, as in
+    :func:`RadarData.restack <impdar.lib.RadarData._RadarDataProcessing.restack>`.
+
+    Parameters
+    ----------
+    traces: int
+        The number of traces to stack
+    preserve_dtype: bool, optional
+        Return the stacked data with the dtype of the input. Default is False, which gives float64
+        (complex128 for complex input).
+    """
+
+    def __init__(self, traces, preserve_dtype=False):
+        self.traces = int(traces)
+        if self.traces < 1:
+            raise ValueError('Must stack at least one trace')
+        self.preserve_dtype = preserve_dtype
+        self._left_data = None
+        self._left_oned = {}
+
+    @property
+    def n_left(self):
+        """The number of traces waiting for the rest of their group."""
+        if self._left_data is None:
+            return 0
+        return self._left_data.shape[1]
+
+    def add(self, data, **oned):
+        """Add a block of traces.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            snum x n block of traces
+        oned: np.ndarray or None
+            Per-trace variables of length n, by name (e.g. dist=..., lat=...).
+            Variables that are None stay None.
+
+        Returns
+        -------
+        stack: np.ndarray
+            snum x m array of the groups completed by this block (m may be 0)
+        oned_stack: dict
+            The restacked per-trace variables, with the same keys as oned
+        """
+        acc_dtype = np.result_type(data.dtype, np.float64)
+        dtype = data.dtype if self.preserve_dtype else acc_dtype
+        oned = {key: (np.asarray(val) if val is not None else None) for key, val in oned.items()}
+
+        stacks = []
+        oned_stacks = {key: [] for key in oned}
+        start = 0
+
+        # Finish the group started by the last block
+        if self.n_left > 0:
+            start = min(self.traces - self.n_left, data.shape[1])
+            self._left_data = np.hstack((self._left_data, data[:, :start]))
+            for key, val in oned.items():
+                if val is not None:
+                    self._left_oned[key] = np.hstack((self._left_oned[key], val[:start]))
+            if self.n_left == self.traces:
+                stacks.append(np.mean(self._left_data, axis=1, keepdims=True, dtype=acc_dtype).astype(dtype))
+                for key, val in oned.items():
+                    if val is not None:
+                        oned_stacks[key].append(np.mean(self._left_oned[key], keepdims=True))
+                self._left_data = None
+                self._left_oned = {}
+
+        # All the complete groups at once
+        ngroups = (data.shape[1] - start) // self.traces
+        end = start + ngroups * self.traces
+        if ngroups > 0:
+            block = data[:, start:end].reshape((data.shape[0], ngroups, self.traces))
+            stacks.append(np.mean(block, axis=2, dtype=acc_dtype).astype(dtype, copy=False))
+            for key, val in oned.items():
+                if val is not None:
+                    oned_stacks[key].append(np.mean(val[start:end].reshape((ngroups, self.traces)), axis=1))
+
+        # And save the start of the next group
+        if end < data.shape[1]:
+            self._left_data = data[:, end:].copy()
+            self._left_oned = {key: val[end:].copy() for key, val in oned.items() if val is not None}
+
+        if len(stacks) > 0:
+            stack = np.hstack(stacks)
+        else:
+            stack = np.zeros((data.shape[0], 0), dtype=dtype)
+        oned_stack = {key: (np.hstack(oned_stacks[key]) if len(oned_stacks[key]) > 0 else np.zeros((0, )))
+                      if oned[key] is not None else None for key in oned}
+        return stack, oned_stack
+
+    def finish(self):
+        """Drop any traces that did not fill a group.
+
+        Returns
+        -------
+        int
+            The number of traces dropped
+        """
+        n_left = self.n_left
+        self._left_data = None
+        self._left_oned = {}
+        return n_left
+
+
+def read_blocks(data, chunksize, queue_size=2, dtype=None):
+    """Read blocks of traces in a background thread, so reading overlaps with processing.
+
+    This is most useful when data are memory-mapped from disk (or otherwise slow
+    to access), since each block is read in full while the previous one is
+    being processed, and only queue_size blocks are held at once.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        snum x tnum array (e.g. a np.memmap)
+    chunksize: int
+        Number of traces per block
+    queue_size: int, optional
+        Number of blocks to read ahead. Default 2.
+    dtype: np.dtype, optional
+        Convert blocks to this dtype. Default is the dtype of data, promoted to float if needed.
+
+    Yields
+    ------
+    tstart: int
+        The index of the first trace of the block
+    block: np.ndarray
+        A copy of the block of traces
+    """
+    if dtype is None:
+        dtype = data.dtype if np.issubdtype(data.dtype, np.inexact) else np.float64
+    chunksize = max(1, int(chunksize))
+    blocks = queue.Queue(maxsize=max(1, queue_size))
+    stop = threading.Event()
+
+    def put(item):
+        """Put on the queue unless the consumer has stopped. Returns False if it has."""
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for tstart in range(0, data.shape[1], chunksize):
+                block = np.array(data[:, tstart:tstart + chunksize], dtype=dtype)
+                if not put((tstart, block)):
+                    return
+            put(None)
+        except Exception as exc:  # pragma: no cover - passed to the consumer
+            put(exc)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = blocks.get()
+            if item is None:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # If the consumer quits early, let the producer finish
+        stop.set()
+        producer.join()
@@ -11,9 +11,15 @@ Make sure that we can successfully read BSI input files
 """
 
 import os
+import shutil
+import tempfile
 import unittest
+import numpy as np
 from impdar.lib.load import load_bsi
 
+if load_bsi.H5:
+    import h5py
+
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
@@ -23,6 +29,72 @@ class TestBSI(unittest.TestCase):
     def test_load_bsi(self):
         load_bsi.load_bsi(os.path.join(THIS_DIR, 'input_data', 'test_bsi.h5'))
 
+    @unittest.skipIf(not load_bsi.H5, 'h5py is not available')
+    def test_load_bsi_options(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'test_bsi.h5')
+        dats = load_bsi.load_bsi(fn)
+        for kwargs in [{'batchsize': 3, 'n_threads': 2}, {'lazy': True}]:
+            for dat, other in zip(dats, load_bsi.load_bsi(fn, **kwargs)):
+                self.assertEqual(other.data.shape, dat.data.shape)
+                self.assertTrue(np.all(np.asarray(other.data) == dat.data))
+                self.assertTrue(np.all(other.lat == dat.lat))
+                self.assertTrue(np.all(other.decday == dat.decday))
+
+    @unittest.skipIf(not load_bsi.H5, 'h5py is not available')
+    def test_lazy(self):
+        dat = load_bsi.load_bsi(os.path.join(THIS_DIR, 'input_data', 'test_bsi.h5'), lazy=True)[0]
+        self.assertTrue(isinstance(dat.data, load_bsi.LazyEchograms))
+        full = np.asarray(dat.data)
+        self.assertEqual(full.shape, (dat.snum, dat.tnum))
+        self.assertTrue(np.all(dat.data[:, 2:5] == full[:, 2:5]))
+        self.assertTrue(np.all(dat.data[10:20, 3] == full[10:20, 3]))
+        self.assertTrue(np.all(dat.data.subset([1, 7])[:, :] == full[:, [1, 7]]))
+
+    @unittest.skipIf(not load_bsi.H5, 'h5py is not available')
+    def test_lazy_process(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'test_bsi.h5')
+        dat = load_bsi.load_bsi(fn)[0]
+        lazy = load_bsi.load_bsi(fn, lazy=True)[0]
+        dat.vertical_band_pass(1, 10)
+        lazy.vertical_band_pass(1, 10)
+        self.assertTrue(isinstance(lazy.data, np.ndarray))
+        self.assertTrue(np.allclose(lazy.data, dat.data))
+
+        lazy = load_bsi.load_bsi(fn, lazy=True)[0]
+        lazy.load_data()
+        self.assertTrue(np.all(lazy.data == load_bsi.load_bsi(fn)[0].data))
+
+    @unittest.skipIf(not load_bsi.H5, 'h5py is not available')
+    def test_variable_snum_badgps(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(tmpdir, 'test_bsi.h5')
+            shutil.copy(os.path.join(THIS_DIR, 'input_data', 'test_bsi.h5'), fn)
+            with h5py.File(fn, 'r+') as f_in:
+                group = f_in['line_0/location_3/datacapture_0']
+                attrs = dict(group['echogram_0'].attrs)
+                del group['echogram_0']
+                group['echogram_0'] = np.ones((3000, ))
+                for key, val in attrs.items():
+                    group['echogram_0'].attrs[key] = val
+                echogram = f_in['line_0/location_5/datacapture_0/echogram_0']
+                echogram.attrs['GPS Cluster- MetaData_xml'] = attrs['GPS Cluster- MetaData_xml'].replace(
+                    '<Name>GPS Fix valid</Name>\r\n<Val>1', '<Name>GPS Fix valid</Name>\r\n<Val>0')
+
+            dat = load_bsi.load_bsi(fn)[0]
+            self.assertEqual(dat.data.shape, (3000, 10))
+            self.assertTrue(np.all(dat.data[:, 3] == 1.))
+            self.assertTrue(np.all(dat.data[2976:, 2] == 0.))
+            self.assertTrue(np.isnan(dat.lat[5]))
+            self.assertEqual(np.sum(np.isnan(dat.lat)), 1)
+
+            dat = load_bsi.load_bsi(fn, nans='delete', lazy=True)[0]
+            self.assertEqual(dat.data.shape, (3000, 9))
+            self.assertTrue(np.all(dat.data[:, 3] == 1.))
+            self.assertFalse(np.any(np.isnan(dat.lat)))
+        finally:
+            shutil.rmtree(tmpdir)
+
     @unittest.skipIf(load_bsi.H5, 'h5py is available')
     def test_load_bsi_noh5py(self):
         with self.assertRaises(ImportError):
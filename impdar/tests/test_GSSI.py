@@ -12,6 +12,7 @@ Make sure that we can successfully read gssi input files
 
 import os
 import unittest
+import numpy as np
 from impdar.lib.load import load_gssi
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -39,6 +40,25 @@ class TestGSSI(unittest.TestCase):
         load_gssi.load_gssi(os.path.join(THIS_DIR, 'input_data', 'test_gssi_justdzt.DZT')).save(os.path.join(THIS_DIR, 'input_data', 'test_gssi_justdzt_raw.mat'))
         os.remove(os.path.join(THIS_DIR, 'input_data', 'test_gssi_justdzt_raw.mat'))
 
+    def test_header(self):
+        header = load_gssi.read_dzt_header(os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT'))
+        self.assertEqual(header['snum'], 2048)
+        self.assertEqual(header['bits'], 32)
+        self.assertEqual(header['data_offset'], 131072)
+        self.assertEqual(header['tnum'], (os.path.getsize(os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT')) - 131072) // (2048 * 4))
+
+    def test_memmap(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'test_gssi_justdzt.DZT')
+        dat = load_gssi.load_gssi(fn)
+        dat_mm = load_gssi.load_gssi(fn, memmap=True)
+        self.assertTrue(isinstance(dat_mm.data, np.memmap))
+        self.assertEqual(dat_mm.data.dtype, dat.data.dtype)
+        self.assertTrue(np.all(dat_mm.data[2:, :] == dat.data[2:, :]))
+
+        traces = load_gssi.read_traces(fn, 10, 20)
+        self.assertEqual(traces.dtype, np.float64)
+        self.assertTrue(np.all(traces == dat.data[:, 10:20]))
+
 
 if __name__ == '__main__':
     unittest.main()
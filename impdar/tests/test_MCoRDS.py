@@ -11,13 +11,32 @@ Make sure that we can successfully read gssi input files
 """
 
 import os
+import shutil
+import tempfile
 import unittest
 import numpy as np
 from impdar.lib.load import load_mcords
 
+if load_mcords.NC:
+    from netCDF4 import Dataset
+if load_mcords.H5:
+    import h5py
+
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def write_mat73(fn, data, lat, lon):
+    """Write a minimal MCoRDS file as matlab v7.3 (hdf5, transposed from what matlab sees)."""
+    with h5py.File(fn, 'w', userblock_size=512) as fout:
+        fout['Data'] = data.T
+        fout['Latitude'] = lat[:, None]
+        fout['Longitude'] = lon[:, None]
+        fout['GPS_time'] = np.arange(len(lat))[:, None] * 1.0
+        fout['Time'] = np.arange(data.shape[0])[None, :] * 1.0e-8
+    with open(fn, 'r+b') as fout:
+        fout.write(b'MATLAB 7.3 MAT-file'.ljust(116, b' ') + b'\x00' * 8 + b'\x00\x02IM')
+
+
 class TestMCoRDS_NC(unittest.TestCase):
 
     @unittest.skipIf(not load_mcords.NC, 'No netcdf on this version')
@@ -30,6 +49,37 @@ class TestMCoRDS_NC(unittest.TestCase):
         with self.assertRaises(ImportError):
             load_mcords.load_mcords_nc(os.path.join(THIS_DIR, 'input_data', 'zeros_mcords.nc'))
 
+    @unittest.skipIf(not load_mcords.NC, 'No netcdf on this version')
+    def test_loadnc_select(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(tmpdir, 'test.nc')
+            with Dataset(fn, 'w') as dst:
+                dst.createDimension('time', 20)
+                dst.createDimension('fasttime', 10)
+                amp = dst.createVariable('amplitude', 'f4', ('time', 'fasttime'), fill_value=-999.)
+                amp[:] = np.arange(200).reshape((20, 10))
+                amp[3, 4] = np.ma.masked
+                for name, vals in [('lat', np.linspace(-80., -79., 20)),
+                                   ('lon', np.linspace(100., 101., 20)),
+                                   ('time', np.arange(20.))]:
+                    dst.createVariable(name, 'f8', ('time', ))[:] = vals
+                dst.variables['time'].units = 'seconds since 2014-04-24 00:00:00'
+                dst.createVariable('fasttime', 'f8', ('fasttime', ))[:] = np.arange(10.) * 0.01
+
+            dat = load_mcords.load_mcords_nc(fn, traces=(2, 6))
+            self.assertEqual(dat.data.shape, (10, 4))
+            self.assertEqual(dat.data.dtype, np.float32)
+            self.assertTrue(np.isnan(dat.data[4, 1]))
+            self.assertEqual(dat.data[0, 0], 20.)
+            self.assertTrue(np.allclose(dat.db[:, 2:], 10. * np.log10(dat.data[:, 2:])))
+
+            dat = load_mcords.load_mcords_nc(fn, bbox=(100.2, -80., 100.5, -79.))
+            self.assertTrue(np.all((dat.long >= 100.2) & (dat.long <= 100.5)))
+            self.assertEqual(dat.tnum, len(dat.lat))
+        finally:
+            shutil.rmtree(tmpdir)
+
 
 class TestMCoRDS_MAT(unittest.TestCase):
 
@@ -39,6 +89,55 @@ class TestMCoRDS_MAT(unittest.TestCase):
                                                        'zeros_mcords_mat.mat'))
         self.assertTrue(np.allclose(dat.data, 0.))
 
+    def test_loadmat_select(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'zeros_mcords_mat.mat')
+        dat = load_mcords.load_mcords_mat(fn, traces=(10, 20))
+        self.assertEqual(dat.data.shape, (951, 10))
+        self.assertEqual(dat.tnum, 10)
+        self.assertEqual(len(dat.decday), 10)
+        self.assertTrue(np.allclose(dat.data, 0.))
+
+        dat = load_mcords.load_mcords_mat(fn, traces=slice(30, None), db=False)
+        self.assertEqual(dat.data.shape, (951, 11))
+        self.assertEqual(dat.data.dtype, np.uint8)
+        self.assertEqual(dat.db.shape, dat.data.shape)
+        self.assertTrue(np.allclose(dat.db[:, :3], 0.))
+        self.assertTrue(np.allclose(np.asarray(dat.db), 0.))
+
+        with self.assertRaises(ValueError):
+            load_mcords.load_mcords_mat(fn, traces=(20, 10))
+        with self.assertRaises(ValueError):
+            load_mcords.load_mcords_mat(fn, bbox=(-1., -1., -0.5, -0.5))
+
+    def test_select_traces(self):
+        lat = np.linspace(-80., -79., 100)
+        lon = np.hstack((np.linspace(100., 101., 50), np.linspace(101., 100., 50)))
+        self.assertEqual(load_mcords.select_traces(lat, lon), slice(0, 100))
+        self.assertEqual(load_mcords.select_traces(lat, lon, traces=(10, -10)), slice(10, 90))
+        # A box the line passes through twice keeps everything in between
+        sel = load_mcords.select_traces(lat, lon, bbox=(100.9, -81., 102., -78.))
+        self.assertEqual(sel, slice(45, 55))
+        sel = load_mcords.select_traces(lat, lon, bbox=(100., -80., 102., -79.5))
+        self.assertEqual(sel, slice(0, 50))
+
+    @unittest.skipIf(not load_mcords.H5, 'No h5py on this version')
+    def test_loadmat73(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            fn = os.path.join(tmpdir, 'test.mat')
+            data = np.arange(1., 201., dtype=np.float32).reshape((10, 20))
+            write_mat73(fn, data, np.linspace(-80., -79., 20), np.linspace(100., 101., 20))
+            dat = load_mcords.load_mcords_mat(fn, traces=(5, 8), db=False)
+            self.assertEqual(dat.data.shape, (10, 3))
+            self.assertEqual(dat.data.dtype, np.float32)
+            self.assertTrue(np.all(dat.data == data[:, 5:8]))
+
+            dat = load_mcords.load_mcords_mat(fn)
+            self.assertEqual(dat.data.dtype, np.float32)
+            self.assertTrue(np.allclose(dat.data, 10. * np.log10(data)))
+        finally:
+            shutil.rmtree(tmpdir)
+
     def test_loadbadmat(self):
         with self.assertRaises(KeyError):
             load_mcords.load_mcords_mat(os.path.join(THIS_DIR, 'input_data', 'small_data.mat'))
@@ -11,17 +11,98 @@ Make sure that we can successfully read gssi input files
 """
 
 import os
+import shutil
+import tempfile
 import unittest
-from impdar.lib.load import load_pulse_ekko
+import numpy as np
+from impdar.lib.load import load_pulse_ekko, load
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+def write_pe(fn_dt1, version, snum, tnum):
+    """Write a small pulse ekko file, with the header from test_pe.HD."""
+    with open(os.path.join(THIS_DIR, 'input_data', 'test_pe.HD')) as fin:
+        lines = fin.read().replace('2771', str(tnum)).replace('3000', str(snum)).split('\n')
+    if version == '1.5.340':
+        lines[1] = 'pE PRO 1.5.340'
+        lines[2] = '04/20/2018'
+    with open(os.path.splitext(fn_dt1)[0] + '.HD', 'w') as fout:
+        fout.write('\n'.join(lines))
+    records = np.zeros((tnum, ), dtype=load_pulse_ekko.trace_dtype(version, snum))
+    records['header'][:, 0] = np.arange(tnum) + 1
+    records['data'] = np.arange(snum)[None, :] + 10 * np.arange(tnum)[:, None]
+    records.tofile(fn_dt1)
+    return records
+
+
 class TestPE(unittest.TestCase):
 
     def test_load_pe(self):
         load_pulse_ekko.load_pe(os.path.join(THIS_DIR, 'input_data', 'test_pe.DT1'))
 
+    def test_load_pe_versions(self):
+        for version, dtype in [('1.0', np.int16), ('1.5.340', np.float32)]:
+            fn = os.path.join(self.tmpdir, 'test_{:s}.DT1'.format(version))
+            records = write_pe(fn, version, 200, 11)
+            pe_data = load_pulse_ekko.load_pe(fn)
+            self.assertEqual(pe_data.data.dtype, dtype)
+            self.assertEqual(pe_data.data.shape, (200, 11))
+            self.assertTrue(np.all(pe_data.traceheaders.trace_numbers == np.arange(11) + 1))
+            # DC from the first 100 samples is removed
+            expected = records['data'].transpose() - (49.5 + 10 * np.arange(11))[None, :]
+            self.assertTrue(np.allclose(pe_data.data, expected.astype(dtype)))
+
+    def test_load_pe_short(self):
+        fn = os.path.join(self.tmpdir, 'test.DT1')
+        write_pe(fn, '1.0', 200, 11)
+        with open(os.path.join(self.tmpdir, 'test.HD')) as fin:
+            header = fin.read()
+        with open(os.path.join(self.tmpdir, 'test.HD'), 'w') as fout:
+            fout.write(header.replace('= 11', '= 13'))
+        pe_data = load_pulse_ekko.load_pe(fn)
+        self.assertEqual(pe_data.data.shape, (200, 13))
+        self.assertTrue(np.all(pe_data.data[:, -2:] == 0))
+
+    def test_partition_project(self):
+        project = b''
+        for i in range(1, 4):
+            project += b'PK\x03line%d.hdHEADER\r\nPK\x01line%d.iniKEY=VALUE\r\nPK\x01line%d.dt1' % (i, i, i)
+            project += b'\x00' * i + b'Lineset '
+        fn = os.path.join(self.tmpdir, 'test.GPZ')
+        with open(fn, 'wb') as fout:
+            fout.write(project)
+        fns = load_pulse_ekko.partition_project_file(fn, out_dir=self.tmpdir)
+        self.assertEqual([os.path.basename(fn_i) for fn_i in fns], ['LINE1.DT1', 'LINE2.DT1', 'LINE3.DT1'])
+        for i, fn_i in enumerate(fns):
+            self.assertEqual(os.path.getsize(fn_i), i + 1)
+            self.assertTrue(os.path.exists(os.path.splitext(fn_i)[0] + '.HD'))
+
+    def test_load_project(self):
+        # Build a project out of two small profiles
+        project = b''
+        for i in range(1, 3):
+            fn_i = os.path.join(self.tmpdir, 'line{:d}.DT1'.format(i))
+            write_pe(fn_i, '1.0', 200, 5 + i)
+            with open(fn_i, 'rb') as fin:
+                dt1 = fin.read()
+            with open(os.path.splitext(fn_i)[0] + '.HD', 'rb') as fin:
+                hd = fin.read().replace(b'\n', b'\r\n')
+            project += b'PK\x03line%d.hd' % i + hd + b'PK\x01line%d.ini' % i + b'PK\x01line%d.dt1' % i
+            project += dt1 + b'Lineset '
+        fn = os.path.join(self.tmpdir, 'proj.GPZ')
+        with open(fn, 'wb') as fout:
+            fout.write(project)
+        dats = load('pe', [fn])
+        self.assertEqual([dat.tnum for dat in dats], [6, 7])
+        self.assertTrue(os.path.exists(fn))
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
 
 if __name__ == '__main__':
     unittest.main()
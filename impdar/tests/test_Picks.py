@@ -67,6 +67,21 @@ class TestPickMods(unittest.TestCase):
         with self.assertRaises(ValueError):
             data.picks.update_pick(0, np.zeros((5, data.tnum)))
 
+    def test_shift(self):
+        data = RadarData(os.path.join(THIS_DIR, 'input_data', 'small_data_picks.mat'))
+        samp2 = data.picks.samp2.copy()
+        shifts = np.arange(data.tnum) % 3
+        data.picks.shift(shifts, data.snum)
+        in_data = ~np.isnan(samp2) & (samp2 + shifts[None, :] < data.snum)
+        self.assertTrue(np.all(data.picks.samp2[in_data] == (samp2 + shifts[None, :])[in_data]))
+        self.assertTrue(np.all(np.isnan(data.picks.samp2[~in_data])))
+        self.assertTrue(np.all(np.isnan(data.picks.power[~in_data])))
+
+        # Scalar shifts too, and nothing to do without picks
+        data.picks.shift(-1, data.snum)
+        data.picks.samp1 = None
+        data.picks.shift(1, data.snum)
+
     def test_smooth(self):
         # first, no NaNs
         data = RadarData(os.path.join(THIS_DIR, 'input_data', 'small_data_picks.mat'))
@@ -107,8 +107,20 @@ class TestRadarDataMethods(unittest.TestCase):
     def test_CropTrigMat(self):
         self.data.trig = np.ones((40,), dtype=int)
         self.data.trig[20:] = 2
+        data = self.data.data.copy()
         self.data.crop(6, 'top', dimension='pretrig')
         self.assertTrue(self.data.data.shape == (19, 40))
+        self.assertTrue(np.all(self.data.data[:, :20] == data[1:, :20]))
+        self.assertTrue(np.all(self.data.data[:18, 20:] == data[2:, 20:]))
+        self.assertTrue(np.all(np.isnan(self.data.data[18, 20:])))
+
+    def test_CropPicks(self):
+        self.data = RadarData(os.path.join(THIS_DIR, 'input_data', 'small_data_picks.mat'))
+        samp2 = self.data.picks.samp2.copy()
+        self.data.crop(2, 'top', dimension='snum')
+        kept = ~np.isnan(self.data.picks.samp2)
+        self.assertTrue(np.any(kept))
+        self.assertTrue(np.all(self.data.picks.samp2[kept] + 2 == samp2[kept]))
 
     def test_CropDepthOnTheFly(self):
         self.data.crop(0.165, 'bottom', dimension='depth', uice=2.0e6)
@@ -171,6 +183,44 @@ class TestRadarDataMethods(unittest.TestCase):
         self.data.agc()
         self.assertTrue(self.data.flags.agc)
 
+    def test_agc_values(self):
+        data = self.data.data.copy()
+        self.data.agc(window=10)
+        maxamp = np.max(np.abs(data[5:15, :]))
+        self.assertTrue(np.allclose(self.data.data[10, :], data[10, :] * 50. / maxamp))
+
+    def test_agc_per_trace(self):
+        data = self.data.data.copy()
+        self.data.agc(window=10, per_trace=True)
+        maxamp = np.max(np.abs(data[5:15, :]), axis=0)
+        self.assertTrue(np.allclose(self.data.data[10, :], data[10, :] * 50. / maxamp))
+
+        self.setUp()
+        self.data.agc(window=10, per_trace=True, envelope='rms')
+        rms = np.sqrt(np.mean(data[5:15, :] ** 2., axis=0))
+        self.assertTrue(np.allclose(self.data.data[10, :], data[10, :] * 50. / rms))
+
+        with self.assertRaises(ValueError):
+            self.data.agc(envelope='bad')
+
+    def test_agc_int(self):
+        for dtype in [np.int16, np.int64]:
+            self.setUp()
+            self.data.data = (self.data.data / np.max(np.abs(self.data.data)) * 10000).astype(dtype)
+            self.data.data[0, 0] = np.iinfo(np.int16).min
+            data = self.data.data.copy()
+            self.data.agc(window=10, scaling_factor=10 ** 6)
+            self.assertEqual(self.data.data.dtype, dtype)
+            maxamp = np.max(np.abs(data[5:15, :].astype(float)))
+            # The gain is truncated to an int, which can be off by one for the float32 gain of int16s
+            self.assertTrue(np.allclose(self.data.data[10, :], data[10, :] * int(10 ** 6 / maxamp),
+                                        atol=0, rtol=1. / int(10 ** 6 / maxamp)))
+
+            self.setUp()
+            self.data.data = data.copy()
+            self.data.agc(window=10, scaling_factor=10 ** 6, per_trace=True)
+            self.assertEqual(self.data.data.dtype, dtype)
+
     def test_rangegain(self):
         self.data.rangegain(1.0)
         self.assertTrue(self.data.flags.rgain)
@@ -185,6 +235,28 @@ class TestRadarDataMethods(unittest.TestCase):
         self.data.rangegain(1.0)
         self.assertTrue(self.data.flags.rgain)
 
+    def test_rangegain_values(self):
+        self.data.trig = np.zeros((self.data.tnum, ))
+        self.data.trig[10:] = 3
+        data = self.data.data.copy()
+        self.data.rangegain(2.0)
+        self.assertTrue(np.allclose(self.data.data[1:, :10], data[1:, :10] * self.data.travel_time[1:, None] * 2.0))
+        self.assertTrue(np.all(self.data.data[:4, 10:] == data[:4, 10:]))
+        self.assertTrue(np.allclose(self.data.data[4:, 10:], data[4:, 10:] * self.data.travel_time[4:, None] * 2.0))
+
+    def test_rangegain_types(self):
+        self.data.trig = np.zeros((self.data.tnum, ))
+        data = self.data.data.copy()
+        self.data.rangegain(0.5, gain_type='exp')
+        self.assertTrue(np.allclose(self.data.data[1:], data[1:] * np.exp(0.5 * self.data.travel_time[1:, None])))
+
+        self.data.data = data.copy()
+        self.data.rangegain(2., gain_type='power')
+        self.assertTrue(np.allclose(self.data.data[1:], data[1:] * self.data.travel_time[1:, None] ** 2.))
+
+        with self.assertRaises(ValueError):
+            self.data.rangegain(1.0, gain_type='bad')
+
     def test_NMO(self):
         # If velocity is 2
         self.data.nmo(0., uice=2.0, uair=2.0)
@@ -218,6 +290,24 @@ class TestRadarDataMethods(unittest.TestCase):
         with self.assertRaises(Exception):
             self.data.nmo(0., rho_profile=os.path.join(THIS_DIR, 'input_data', 'velocity_layers.txt'))
 
+    def test_moveout_rms_velocity(self):
+        # Constant velocity gives back that velocity
+        u_rms = _RadarDataProcessing.moveout_rms_velocity(np.linspace(0., 10., 100), 10.0, np.array([0., 10., 50., 1000.]), np.ones((4, )) * 1.68e8)
+        self.assertTrue(np.allclose(u_rms, 1.68e8))
+
+        # Velocity-depth profile: the depth from the rms velocity satisfies the moveout equation
+        profile_depth = np.linspace(0., 1000., 1001)
+        profile_u = 1.68e8 + 0.8e8 * np.exp(-profile_depth / 20.)
+        t = np.linspace(0.5, 10., 20)
+        u_rms = _RadarDataProcessing.moveout_rms_velocity(t, 10.0, profile_depth, profile_u)
+        d = np.sqrt((t * 1.0e-6 / 2. * u_rms) ** 2. - 10.0 ** 2.)
+        u_rms_d = np.array([np.sqrt(np.mean(profile_u[profile_depth <= dd] ** 2.)) for dd in d])
+        self.assertTrue(np.allclose(u_rms, u_rms_d, rtol=5.0e-3))
+        self.assertTrue(np.all(np.diff(u_rms) < 0.))
+
+        # and from the cache
+        self.assertTrue(np.all(u_rms == _RadarDataProcessing.moveout_rms_velocity(t, 10.0, profile_depth, profile_u)))
+
     def test_optimize_moveout_depth(self):
         d = _RadarDataProcessing.optimize_moveout_depth(100.0, 100.0 / 1.68e8 * 2., 10.0, np.array([0., 10., 50., 1000.]), np.array([2.5e8, 2.0e8, 1.8e8, 1.68e8]))
         self.assertFalse(np.isnan(d))
@@ -236,6 +326,20 @@ class TestRadarDataMethods(unittest.TestCase):
         self.data.restack(4)
         self.assertTrue(self.data.data.shape == (20, 8))
 
+    def test_restack_values(self):
+        target = np.mean(self.data.data[:, :5], axis=1)
+        target_dist = np.mean(self.data.dist[:5])
+        self.data.restack(5)
+        self.assertTrue(np.allclose(self.data.data[:, 0], target))
+        self.assertTrue(np.allclose(self.data.dist[0], target_dist))
+        self.assertTrue(self.data.dist.shape == (8, ))
+        self.assertTrue(self.data.data.dtype == np.float64)
+
+    def test_restack_dtype(self):
+        self.data.data = self.data.data.astype(np.float32)
+        self.data.restack(5, preserve_dtype=True)
+        self.assertTrue(self.data.data.dtype == np.float32)
+
     def test_elev_correct(self):
         self.data.elev = np.arange(self.data.data.shape[1]) * 0.002
         with self.assertRaises(ValueError):
@@ -316,6 +420,29 @@ class TestRadarDataMethods(unittest.TestCase):
         self.assertTrue(self.data.elev.shape == (targ_size, ))
         self.assertTrue(self.data.decday.shape == (targ_size, ))
 
+    def test_constant_space_stops(self):
+        # Stationary traces are removed, and the distance shrinks to match
+        dist = np.arange(self.data.tnum) * 0.01
+        self.data.dist = dist.copy()
+        self.data.dist[10:20] = self.data.dist[10]
+        self.data.dist[20:] = self.data.dist[20:] - (self.data.dist[20] - self.data.dist[10]) + 0.01
+        data = self.data.data.copy()
+        self.data.constant_space(10.)
+        # 31 good traces, and we may or may not get the last one
+        tnum = self.data.data.shape[1]
+        self.assertTrue(tnum in [30, 31])
+        self.assertTrue(np.allclose(self.data.dist, dist[:tnum]))
+        self.assertTrue(np.allclose(self.data.data[:, :11], data[:, :11]))
+        self.assertTrue(np.allclose(self.data.data[:, 11:], data[:, 20:tnum + 9]))
+
+    def test_constant_space_complex_values(self):
+        self.data.data = self.data.data + 2.0j * self.data.data[::-1, :]
+        self.data.dist = np.arange(self.data.tnum) * 0.01
+        data = self.data.data.copy()
+        self.data.constant_space(5.)
+        self.assertTrue(np.allclose(self.data.data[:, ::2], data[:, :-1]))
+        self.assertTrue(np.allclose(self.data.data[:, 1::2], (data[:, :-1] + data[:, 1:]) / 2.))
+
     def test_constant_sample_depth_spacing(self):
         # first check that it fails if we are not set up
         self.data.nmo_depth = None
@@ -346,6 +473,28 @@ class TestRadarDataMethods(unittest.TestCase):
         depths = self.data.traveltime_to_depth(np.arange(10) - 1., (np.arange(10) + 1) * 91.7)
         self.assertFalse(np.allclose(np.diff(depths), np.ones((len(depths) - 1,)) * (depths[1] - depths[0])))
 
+    def test_traveltime_to_depth_steps(self):
+        # Compare to stepping down one sample at a time
+        from impdar.lib.permittivity_models import firn_permittivity
+        self.data.travel_time = (np.arange(self.data.snum) - 2.) * self.data.dt * 1.0e6
+        profile_depth = np.arange(0., 10., 0.01)
+        profile_rho = 917. - 500. * np.exp(-profile_depth / 2.)
+        profile_u = 3.0e8 / np.sqrt(np.real(firn_permittivity(profile_rho)))
+        depths = self.data.traveltime_to_depth(profile_depth, profile_rho)
+
+        z = 0.
+        for i, t in enumerate(self.data.travel_time):
+            if t < 0.:
+                continue
+            elif t < self.data.dt * 1.0e6:
+                z += t / 2. * profile_u[0] * 1.0e-6
+            else:
+                z += self.data.dt / 2. * profile_u[np.nanargmin(abs(profile_depth - z))]
+            self.assertEqual(depths[i], z)
+
+        # Cached the second time
+        self.assertTrue(np.all(self.data.traveltime_to_depth(profile_depth, profile_rho) == depths))
+
     def tearDown(self):
         if os.path.exists(os.path.join(THIS_DIR, 'input_data', 'test_out.mat')):
             os.remove(os.path.join(THIS_DIR, 'input_data', 'test_out.mat'))
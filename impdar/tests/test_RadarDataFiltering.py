@@ -12,6 +12,7 @@
 import sys
 import unittest
 import numpy as np
+from scipy.signal import butter, filtfilt
 from impdar.lib.NoInitRadarData import NoInitRadarDataFiltering as NoInitRadarData
 from impdar.lib.RadarData import RadarData
 from impdar.lib import process
@@ -47,6 +48,24 @@ class TestAdaptive(unittest.TestCase):
         radardata.adaptivehfilt(window_size=radardata.tnum * 2)
         self.assertTrue(np.all(radardata.data <= 1.))
 
+    def test_AdaptiveMatchesLoop(self):
+        from scipy.signal import filtfilt
+        for window_size in [3, 4, 51]:
+            radardata = NoInitRadarData()
+            radardata.data = np.random.random((radardata.snum, radardata.tnum))
+            scale = np.exp(-radardata.travel_time.flatten() * 0.05) / np.exp(-radardata.travel_time[0] * 0.05)
+            target = np.zeros_like(radardata.data)
+            for i in range(radardata.tnum):
+                if i <= window_size // 2:
+                    scpacket = radardata.data[:, 0:window_size // 2 + i]
+                elif i >= radardata.tnum - window_size // 2:
+                    scpacket = radardata.data[:, radardata.tnum - window_size:radardata.tnum]
+                else:
+                    scpacket = radardata.data[:, i - window_size // 2 + 1:i + window_size // 2]
+                target[:, i] = radardata.data[:, i] - filtfilt([.25, .25, .25, .25], 1, np.mean(scpacket, axis=-1)) * scale
+            radardata.adaptivehfilt(window_size=window_size)
+            self.assertTrue(np.allclose(radardata.data, target))
+
 
 class TestHfilt(unittest.TestCase):
 
@@ -133,6 +152,34 @@ class TestHorizontalBandPass(unittest.TestCase):
             radardata.horizontal_band_pass(radardata.tnum / 10., radardata.tnum / 2.)
 
 
+class TestWavenumberFilter(unittest.TestCase):
+
+    def test_wavenumber_filter(self):
+        radardata = NoInitRadarData()
+        radardata.data = np.random.random(radardata.data.shape)
+        radardata.flags.interp = np.ones((2,))
+        data = radardata.data.copy()
+        radardata.wavenumber_filter([('highpass', 20., 5), ('notch', (5., 8.), 3)])
+        self.assertEqual(radardata.flags.hfilt[1], 3)
+
+        radardata2 = NoInitRadarData()
+        radardata2.data = data
+        radardata2.flags.interp = np.ones((2,))
+        radardata2.highpass(20., method='sos')
+        radardata2.wavenumber_filter([('notch', (8., 5.), 3)], method='sos')
+        self.assertTrue(np.allclose(radardata.data[:, 150:-150], radardata2.data[:, 150:-150], atol=1.0e-4))
+
+    def test_wavenumber_filter_errors(self):
+        radardata = NoInitRadarData()
+        with self.assertRaises(ImpdarError):
+            radardata.wavenumber_filter([('highpass', 100., 5)])
+        radardata.flags.interp = np.ones((2,))
+        with self.assertRaises(ValueError):
+            radardata.wavenumber_filter([('highpass', 1., 5)])
+        with self.assertRaises(ValueError):
+            radardata.wavenumber_filter([('dummy', 100., 5)])
+
+
 class TestLowPass(unittest.TestCase):
 
     def test_lowpass_simple(self):
@@ -189,6 +236,22 @@ class TestWinAvgHfilt(unittest.TestCase):
         radardata.winavg_hfilt(11, taper='pexp', filtdepth=-1)
         self.assertTrue(np.all(radardata.data == radardata.pexp_target_output))
 
+    def test_WinAvgMatchesLoop(self):
+        for taper in ['full', 'pexp']:
+            radardata = NoInitRadarData()
+            radardata.data = np.random.random((radardata.snum, radardata.tnum))
+            exptaper = np.exp(-radardata.travel_time.flatten() * 0.05) / np.exp(-radardata.travel_time[0] * 0.05)
+            if taper == 'pexp':
+                exptaper[:50] = exptaper[:50] - exptaper[50]
+                exptaper[50:] = 0
+                exptaper = exptaper / np.max(exptaper)
+            target = np.zeros_like(radardata.data)
+            for i in range(radardata.tnum):
+                avg_trace = np.mean(radardata.data[:, max(0, i - 5):min(radardata.tnum, i + 5)], axis=-1)
+                target[:, i] = radardata.data[:, i] - avg_trace * exptaper
+            radardata.winavg_hfilt(11, taper=taper, filtdepth=50)
+            self.assertTrue(np.allclose(radardata.data, target))
+
     def test_WinAvgbadtaper(self):
         radardata = NoInitRadarData()
         with self.assertRaises(ValueError):
@@ -226,6 +289,58 @@ class TestVBP(unittest.TestCase):
         with self.assertRaises(ValueError):
             radardata.vertical_band_pass(0.1, 100., filttype='dummy')
 
+    def test_vbp_matches_ba(self):
+        radardata = NoInitRadarData()
+        radardata.data = np.random.random(radardata.data.shape)
+        b, a = butter(5, [10.e6 * radardata.dt * 2., 200.e6 * radardata.dt * 2.], 'bandpass')
+        expected = filtfilt(b, a, radardata.data, axis=0)
+        radardata.vertical_band_pass(10., 200., filttype='butter')
+        # Padding differs at the ends
+        np.testing.assert_allclose(radardata.data[100:-100], expected[100:-100], atol=1.0e-6)
+
+    def test_vbp_sos_flags(self):
+        radardata = NoInitRadarData()
+        radardata.data = np.random.random(radardata.data.shape)
+        radardata.vertical_band_pass(0.1, 100., filttype='cheb')
+        self.assertEqual(radardata.flags.bpass[0], 1)
+        self.assertEqual(radardata.flags.bpass[1], 0.1)
+        self.assertEqual(radardata.flags.bpass[2], 100.)
+        self.assertEqual((len(radardata.flags.bpass) - 3) % 6, 0)
+
+        # Reusing the design gives the same answer
+        data = np.random.random(radardata.data.shape)
+        radardata.data = data.copy()
+        radardata.vertical_band_pass(0.1, 100., filttype='cheb')
+        radardata2 = NoInitRadarData()
+        radardata2.data = data.copy()
+        radardata2.vertical_band_pass(0.1, 100., sos=radardata.flags.bpass[3:])
+        np.testing.assert_allclose(radardata2.data, radardata.data)
+        np.testing.assert_allclose(radardata2.flags.bpass, radardata.flags.bpass)
+
+    def test_vbp_chunks_threads(self):
+        radardata = NoInitRadarData()
+        radardata.data = np.random.random(radardata.data.shape)
+        data = radardata.data.copy()
+        radardata.vertical_band_pass(0.1, 100.)
+        for chunksize, n_threads in [(1, 1), (3, 1), (2, 4)]:
+            radardata2 = NoInitRadarData()
+            radardata2.data = data.copy()
+            radardata2.vertical_band_pass(0.1, 100., chunksize=chunksize, n_threads=n_threads)
+            np.testing.assert_allclose(radardata2.data, radardata.data)
+
+    def test_vbp_float32(self):
+        radardata = NoInitRadarData()
+        radardata.data = np.random.random(radardata.data.shape)
+        expected = radardata.data.copy()
+        radardata.data = radardata.data.astype(np.float32)
+        radardata.vertical_band_pass(10., 200.)
+        self.assertEqual(radardata.data.dtype, np.float32)
+
+        radardata2 = NoInitRadarData()
+        radardata2.data = expected
+        radardata2.vertical_band_pass(10., 200.)
+        np.testing.assert_allclose(radardata.data, radardata2.data, atol=1.0e-4)
+
 
 class TestDenoise(unittest.TestCase):
 
@@ -295,7 +410,16 @@ class TestMigrationWrapper(unittest.TestCase):
     def test_wrap_kirchhoff(self, patch_ob):
         radardata = NoInitRadarData()
         radardata.migrate(mtype='kirch', vel=10., nearfield=False)
-        patch_ob.assert_called_with(Any(RadarData), vel=10., nearfield=False)
+        patch_ob.assert_called_with(Any(RadarData), vel=10., nearfield=False, n_threads=1, quiet=False)
+
+        radardata.migrate(mtype='kirch', vel=10., nearfield=False, n_threads=4, quiet=True)
+        patch_ob.assert_called_with(Any(RadarData), vel=10., nearfield=False, n_threads=4, quiet=True)
+
+    @patch('impdar.lib.migrationlib.migrationKirchhoffTable')
+    def test_wrap_kirchhoff_table(self, patch_ob):
+        radardata = NoInitRadarData()
+        radardata.migrate(mtype='kirch_table', vel=10., nearfield=True, aperture=5)
+        patch_ob.assert_called_with(Any(RadarData), vel=10., nearfield=True, aperture=5)
 
     @patch('impdar.lib.migrationlib.migrationStolt')
     def test_wrap_stolt(self, patch_ob):
@@ -313,7 +437,7 @@ class TestMigrationWrapper(unittest.TestCase):
     def test_wrap_tk(self, patch_ob):
         radardata = NoInitRadarData()
         radardata.migrate(mtype='tk', vel=1., vel_fn='dummy', htaper=1, vtaper=2)
-        patch_ob.assert_called_with(Any(RadarData), vel=1., vel_fn='dummy', htaper=1, vtaper=2)
+        patch_ob.assert_called_with(Any(RadarData), vel=1., vel_fn='dummy', htaper=1, vtaper=2, n_threads=1)
 
     @patch('impdar.lib.migrationlib.migrationSeisUnix')
     def test_wrap_seisunix(self, patch_ob):
@@ -321,6 +445,16 @@ class TestMigrationWrapper(unittest.TestCase):
         radardata.migrate(mtype='su_stolt', vtaper=1, htaper=2, tmig=3, vel_fn=None, vel=1.68e7, nxpad=15, verbose=1)
         patch_ob.assert_called_with(Any(RadarData), vtaper=1, htaper=2, tmig=3, vel_fn=None, vel=1.68e7, nxpad=15, verbose=1, mtype='su_stolt')
 
+    @patch('impdar.lib.migrationlib.migrationTiled')
+    def test_wrap_tiled(self, patch_ob):
+        radardata = NoInitRadarData()
+        radardata.migrate(mtype='phsh', vel=1., max_mem=100., overlap=10, n_procs=2)
+        self.assertEqual(patch_ob.call_args[0][1], 100.)
+        self.assertEqual(patch_ob.call_args[1]['overlap'], 10)
+        self.assertEqual(patch_ob.call_args[1]['n_procs'], 2)
+        self.assertEqual(patch_ob.call_args[1]['mtype'], 'phsh')
+        self.assertEqual(radardata.flags.mig, 'phsh')
+
     def test_bad_mtype(self):
         radardata = NoInitRadarData()
         with self.assertRaises(ValueError):
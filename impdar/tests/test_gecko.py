@@ -16,6 +16,7 @@ Mar 28 2019
 import sys
 import os
 import unittest
+import numpy as np
 from impdar.lib.load import load_olaf
 
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -28,5 +29,42 @@ class TestLoadGecko(unittest.TestCase):
         load_olaf.load_olaf(os.path.join(THIS_DIR, 'input_data', 'test_gecko.gtd'), channel=1)
         load_olaf.load_olaf(os.path.join(THIS_DIR, 'input_data', 'test_gecko.gtd'), channel=2)
 
+    @unittest.skipIf(sys.version_info[0] < 3, 'Bytes are weird in 2')
+    def test_load_gecko_channels(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'test_gecko.gtd')
+        dats = load_olaf.load_olaf(fn, channel=[1, 2])
+        self.assertEqual(len(dats), 2)
+        for chan, dat in zip([1, 2], dats):
+            single = load_olaf.load_olaf(fn, channel=chan)
+            self.assertEqual(dat.chan, chan)
+            self.assertTrue(np.all(dat.data == single.data))
+            self.assertTrue(np.all(dat.decday == single.decday))
+            self.assertEqual(dat.data.shape, (8320, 21))
+        self.assertFalse(np.all(dats[0].data == dats[1].data))
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'Bytes are weird in 2')
+    def test_markers(self):
+        fn = os.path.join(THIS_DIR, 'input_data', 'test_gecko.gtd')
+        with open(fn, 'rb') as fid:
+            lines = fid.read()
+        sinfo = load_olaf.SInfo(lines)
+        offsets, types = load_olaf.scan_records(lines, sinfo)
+        self.assertEqual(len(offsets), 42)
+        self.assertTrue(np.all(types == 0))
+
+        # Put a marker in each channel after the fourth trace, and cut off the last record
+        header_len = load_olaf.trace_header_dtype(sinfo.version).itemsize
+        marker = b'\x01' + b'\x00' * (header_len + load_olaf.MARKER_LEN - 1)
+        split = offsets[8]
+        marked = lines[:split] + marker * 2 + lines[split:-100]
+        offsets, types = load_olaf.scan_records(marked, sinfo)
+        self.assertEqual(len(offsets), 43)
+        self.assertTrue(np.all(types[[8, 9]] == 1))
+        self.assertEqual(np.sum(types), 2)
+
+        recs = load_olaf.read_records(marked, sinfo, offsets[types == 0])
+        good = load_olaf.read_records(lines, sinfo, load_olaf.scan_records(lines, sinfo)[0])
+        self.assertTrue(np.all(recs['data'] == good['data'][:-1]))
+
 if __name__ == '__main__':
     unittest.main()
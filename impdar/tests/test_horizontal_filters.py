@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+
+"""
+Test filtering in horizontal wavenumber
+"""
+import unittest
+import numpy as np
+from scipy.signal import butter, filtfilt
+from impdar.lib.horizontal_filters import kx_filter, kx_plan, kx_mask, horizontal_sos
+
+
+class TestKxFilter(unittest.TestCase):
+
+    def test_matches_filtfilt(self):
+        data = np.random.random((20, 2000))
+        for filt, btype in [(('lowpass', 0.1, 3), 'low'),
+                            (('highpass', 0.05, 5), 'high'),
+                            (('bandpass', (0.05, 0.3), 5), 'bandpass'),
+                            (('notch', (0.1, 0.2), 4), 'bandstop')]:
+            b, a = butter(filt[2], filt[1], btype)
+            expected = filtfilt(b, a, data, axis=1)
+            # The ends are treated a little differently
+            out = kx_filter(data.copy(), [filt])
+            self.assertTrue(np.allclose(out[:, 600:-600], expected[:, 600:-600], atol=1.0e-6))
+            out = kx_filter(data.copy(), [filt], method='sos', chunksize=3)
+            self.assertTrue(np.allclose(out[:, 600:-600], expected[:, 600:-600], atol=1.0e-6))
+
+    def test_stack(self):
+        data = np.random.random((20, 2000))
+        filters = [('highpass', 0.05, 5), ('lowpass', 0.3, 3)]
+        fft_out = kx_filter(data.copy(), filters, chunksize=7)
+        sos_out = kx_filter(data.copy(), filters, method='sos')
+        self.assertTrue(np.allclose(fft_out[:, 600:-600], sos_out[:, 600:-600], atol=1.0e-6))
+
+    def test_constant(self):
+        data = np.ones((10, 400))
+        self.assertTrue(np.allclose(kx_filter(data.copy(), [('lowpass', 0.01, 3)]), 1.))
+        self.assertTrue(np.allclose(kx_filter(data.copy(), [('highpass', 0.01, 5)]), 0., atol=1.0e-6))
+
+    def test_complex_inplace(self):
+        data = np.random.random((10, 400))
+        out = kx_filter(data + 1.0j * data, [('lowpass', 0.1, 3)])
+        self.assertTrue(np.allclose(out.real, kx_filter(data.copy(), [('lowpass', 0.1, 3)])))
+
+        data32 = data.astype(np.float32)
+        out = kx_filter(data32, [('lowpass', 0.1, 3)])
+        self.assertTrue(out is data32)
+
+    def test_caches(self):
+        padlen, nfft = kx_plan([('lowpass', 0.1, 3)], 400)
+        self.assertTrue(nfft >= 400 + 2 * padlen)
+        self.assertTrue(padlen < 400)
+        self.assertTrue(kx_mask([('lowpass', 0.1, 3)], nfft) is kx_mask([('low', 0.1, 3)], nfft))
+        self.assertEqual(horizontal_sos('highpass', 0.1, 5).shape, (3, 6))
+
+    def test_errors(self):
+        data = np.random.random((10, 400))
+        with self.assertRaises(ValueError):
+            kx_filter(data, [('dummy', 0.1, 3)])
+        with self.assertRaises(ValueError):
+            kx_filter(data, [('lowpass', 0.1, 3)], method='dummy')
+        with self.assertRaises(TypeError):
+            kx_filter(np.ones((10, 400), dtype=int), [('lowpass', 0.1, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
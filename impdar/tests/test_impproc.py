@@ -12,8 +12,10 @@ Test the machinery of process. This is broken up to match where it would likely
 import sys
 import os
 import unittest
+import numpy as np
 from impdar.bin import impproc
 from impdar.lib import NoInitRadarData
+from impdar.lib.RadarData import RadarData
 
 if sys.version_info[0] >= 3:
     from unittest.mock import patch, MagicMock
@@ -25,6 +27,21 @@ THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class TestMain(unittest.TestCase):
 
+    def test_stream(self):
+        fn_in = os.path.join(THIS_DIR, 'input_data', 'small_data.mat')
+        fn_out = os.path.join(THIS_DIR, 'small_data_streamed.mat')
+        try:
+            impproc.sys.argv = ['dummy', 'crop', 'bottom', 'snum', '15', '--stream',
+                                '--chunksize', '3', '-o', fn_out, fn_in]
+            impproc.main()
+            streamed = RadarData(fn_out)
+            dat = RadarData(fn_in)
+            dat.crop(15., 'bottom', 'snum')
+            self.assertTrue(np.allclose(streamed.data, dat.data))
+        finally:
+            if os.path.exists(fn_out):
+                os.remove(fn_out)
+
     # mock so that we have no real processing
     @patch('impdar.bin.impproc.agc')
     @patch('impdar.bin.impproc.load')
@@ -136,6 +153,14 @@ class TestInputs(unittest.TestCase):
 
         aca, kwca = agc_patch.call_args
         self.assertEqual(kwca['window'], window)
+        self.assertFalse(kwca['per_trace'])
+        self.assertEqual(kwca['envelope'], 'max')
+
+        impproc.sys.argv = ['dummy', 'agc', 'dummy.mat', '--per_trace', '--envelope', 'rms']
+        impproc.main()
+        aca, kwca = agc_patch.call_args
+        self.assertTrue(kwca['per_trace'])
+        self.assertEqual(kwca['envelope'], 'rms')
 
         argparse_mock = MagicMock()
         with patch('argparse.ArgumentParser._print_message', argparse_mock):
@@ -422,6 +447,12 @@ class TestInputs(unittest.TestCase):
         impproc.main()
         aca, kwca = rgain_patch.call_args
         self.assertEqual(kwca['slope'], slope)
+        self.assertEqual(kwca['gain_type'], 'linear')
+
+        impproc.sys.argv = ['dummy', 'rgain', '-gain_type', 'exp', 'dummy.mat']
+        impproc.main()
+        aca, kwca = rgain_patch.call_args
+        self.assertEqual(kwca['gain_type'], 'exp')
 
         argparse_mock = MagicMock()
         with patch('argparse.ArgumentParser._print_message', argparse_mock):
@@ -438,7 +469,7 @@ class TestInputs(unittest.TestCase):
         self.assertTrue(migrate_patch.called)
 
         # mtype tests
-        for mtype in ['stolt', 'kirch', 'phsh', 'tk', 'sustolt', 'sumigtk', 'sumigffd']:
+        for mtype in ['stolt', 'kirch', 'kirch_table', 'phsh', 'tk', 'sustolt', 'sumigtk', 'sumigffd']:
             impproc.sys.argv = ['dummy', 'migrate', '--mtype', mtype, 'dummy.mat']
             impproc.main()
             aca, kwca = migrate_patch.call_args
@@ -455,6 +486,23 @@ class TestInputs(unittest.TestCase):
         aca, kwca = migrate_patch.call_args
         self.assertEqual(kwca['nearfield'], True)
 
+        impproc.sys.argv = ['dummy', 'migrate', '--mtype', 'kirch', '--n_threads', '4', 'dummy.mat']
+        impproc.main()
+        aca, kwca = migrate_patch.call_args
+        self.assertEqual(kwca['n_threads'], 4)
+
+        impproc.sys.argv = ['dummy', 'migrate', '--mtype', 'kirch_table', '--aperture', '10', 'dummy.mat']
+        impproc.main()
+        aca, kwca = migrate_patch.call_args
+        self.assertEqual(kwca['aperture'], 10)
+
+        impproc.sys.argv = ['dummy', 'migrate', '--max_mem', '500', '--overlap', '20', '--n_procs', '2', 'dummy.mat']
+        impproc.main()
+        aca, kwca = migrate_patch.call_args
+        self.assertEqual(kwca['max_mem'], 500.)
+        self.assertEqual(kwca['overlap'], 20)
+        self.assertEqual(kwca['n_procs'], 2)
+
         badint = 0.1
         goodint = 10
         worseint = 'hello'
@@ -0,0 +1,192 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+
+"""
+Test lazy processing pipelines
+"""
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from impdar.bin import impproc
+from impdar.lib.load import load_bsi
+from impdar.lib.NoInitRadarData import NoInitRadarDataFiltering as NoInitRadarData
+from impdar.lib.pipeline import Pipeline, Step
+
+
+def _dummy():
+    dat = NoInitRadarData()
+    dat.data = np.random.random(dat.data.shape)
+    dat.trig = np.random.randint(0, 20, dat.tnum).astype(float)
+    return dat
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_plan(self):
+        dat = _dummy()
+        pipeline = Pipeline().add('vbp', 10., 200.).add('rgain', 0.1).add('hfilt', 0, 100).add(
+            'crop', 300, 'bottom', 'snum')
+        passes = pipeline.plan(dat)
+        self.assertEqual([kind for kind, steps in passes], ['fused', 'full'])
+        self.assertEqual([step.name for step in passes[0][1]], ['vbp', 'rgain', 'crop'])
+
+        # crop can go before the bandpass, but not the gain
+        pipeline = Pipeline().add('vbp', 10., 200.).add('crop', 300, 'bottom', 'snum')
+        self.assertEqual([step.name for step in pipeline.plan(dat)[0][1]], ['crop', 'vbp'])
+        pipeline = Pipeline().add('rgain', 0.1).add('crop', 300, 'bottom', 'snum')
+        self.assertEqual([step.name for step in pipeline.plan(dat)[0][1]], ['rgain', 'crop'])
+
+        # reversal moves out of the way with a scalar trigger
+        pipeline = Pipeline().add('vbp', 10., 200.).add('rev').add('rgain', 0.1)
+        self.assertEqual([kind for kind, steps in pipeline.plan(dat)], ['fused', 'view', 'fused'])
+        dat.trig = 0
+        self.assertEqual([kind for kind, steps in pipeline.plan(dat)], ['fused', 'view'])
+
+        report = pipeline.report(dat)
+        self.assertTrue('fused: vbp(10.0, 200.0), rgain(0.1)' in report)
+        self.assertTrue('MB' in report)
+
+    def test_matches_steps(self):
+        for chunksize in [None, 37]:
+            dat = _dummy()
+            dat2 = copy.deepcopy(dat)
+            pipeline = Pipeline(chunksize=chunksize).add('vbp', 10., 200.).add('rev').add('rgain', 0.1).add(
+                'hfilt', 0, 100).add('crop', 300, 'bottom', 'snum').add('agc', per_trace=True)
+            self.assertTrue(pipeline.run(dat))
+
+            dat2.vertical_band_pass(10., 200.)
+            dat2.reverse()
+            dat2.rangegain(0.1)
+            dat2.horizontalfilt(0, 100)
+            dat2.crop(300, 'bottom', 'snum')
+            dat2.agc(per_trace=True)
+            self.assertEqual(dat.data.shape, dat2.data.shape)
+            self.assertTrue(np.allclose(dat.data, dat2.data))
+            self.assertEqual(dat.snum, 300)
+            self.assertEqual(dat.travel_time.shape, (300, ))
+            self.assertTrue(dat.flags.rgain)
+
+    def test_stream(self):
+        dat = _dummy()
+        dat.data = (dat.data * 1000).astype(np.int16)
+        dat2 = copy.deepcopy(dat)
+        pipeline = Pipeline(chunksize=37).add('vbp', 10., 200.).add('rgain', 0.1).add('crop', 300, 'bottom', 'snum')
+        pipeline.run(dat, stream=True)
+        dat2.vertical_band_pass(10., 200.)
+        dat2.rangegain(0.1)
+        dat2.crop(300, 'bottom', 'snum')
+        self.assertTrue(np.allclose(dat.data, dat2.data))
+
+    def test_stream_memory(self):
+        dat = _dummy()
+        dat2 = copy.deepcopy(dat)
+        data = dat.data
+        # Same shape and type, so the output goes back into the data
+        Pipeline(chunksize=7).add('rgain', 0.1).run(dat, stream=True)
+        self.assertTrue(dat.data is data)
+        dat2.rangegain(0.1)
+        self.assertTrue(np.allclose(dat.data, dat2.data))
+
+        # Memory-mapped input goes to a memory-mapped output
+        tmpdir = tempfile.mkdtemp()
+        try:
+            dat = _dummy()
+            dat2 = copy.deepcopy(dat)
+            fn = os.path.join(tmpdir, 'data.npy')
+            np.save(fn, dat.data)
+            dat.data = np.load(fn, mmap_mode='r')
+            Pipeline(chunksize=7).add('vbp', 10., 200.).add('crop', 300, 'bottom', 'snum').run(
+                dat, stream=True, tmpdir=tmpdir)
+            self.assertTrue(isinstance(dat.data, np.memmap))
+            # The crop is planned first
+            dat2.crop(300, 'bottom', 'snum')
+            dat2.vertical_band_pass(10., 200.)
+            self.assertTrue(np.allclose(dat.data, dat2.data))
+            del dat
+        finally:
+            shutil.rmtree(tmpdir)
+
+    @unittest.skipIf(not load_bsi.H5, 'h5py is not available')
+    def test_stream_lazy_reads(self):
+        fn = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input_data', 'test_bsi.h5')
+        dat = load_bsi.load_bsi(fn, lazy=True)[0]
+        dat2 = load_bsi.load_bsi(fn)[0]
+        # Each block should come from the file once, on the reader thread
+        read = load_bsi.LazyEchograms.read
+        with patch.object(load_bsi.LazyEchograms, 'read', autospec=True, side_effect=read) as mock_read:
+            Pipeline(chunksize=4).add('rgain', 0.1).run(dat, stream=True)
+        self.assertEqual(mock_read.call_count, 3)
+        dat2.rangegain(0.1)
+        self.assertTrue(np.allclose(dat.data, dat2.data))
+
+    def test_from_function(self):
+        pipeline = Pipeline.from_function(impproc.vbp, low_MHz=10., high_MHz=200., n_threads=1, fns=['dummy'])
+        self.assertEqual([step.name for step in pipeline.steps], ['vbp'])
+        self.assertEqual(pipeline.steps[0].args, (10., 200.))
+        pipeline = Pipeline.from_function(impproc.crop, lim=10, top_or_bottom='bottom')
+        self.assertEqual([step.name for step in pipeline.steps], ['crop'])
+        # These do not map to steps
+        self.assertTrue(Pipeline.from_function(impproc.hfilt) is None)
+        self.assertTrue(Pipeline.from_function(impproc.geolocate, 'dummy') is None)
+
+    def test_stream_restack(self):
+        dat = _dummy()
+        pipeline = Pipeline().add('restack', 3).add('vbp', 10., 200.)
+        self.assertEqual([kind for kind, steps in pipeline.plan(dat)], ['fused'])
+
+        # Blocks that do not line up with the groups, and blocks smaller than a group
+        for chunksize, traces in [(7, 3), (2, 4)]:
+            dat = _dummy()
+            dat2 = copy.deepcopy(dat)
+            Pipeline(chunksize=chunksize).add('restack', traces).add('vbp', 10., 200.).run(dat, stream=True)
+            dat2.restack(traces)
+            dat2.vertical_band_pass(10., 200.)
+            self.assertEqual(dat.tnum, dat2.tnum)
+            self.assertTrue(np.allclose(dat.data, dat2.data))
+            for attr in ['trig', 'lat', 'long', 'trace_num', 'trace_int']:
+                self.assertTrue(np.allclose(getattr(dat, attr), getattr(dat2, attr)))
+            self.assertTrue(dat.flags.restack)
+
+    def test_stream_step_raises(self):
+        dat = _dummy()
+        # Many blocks, so the reader is waiting on a full queue when the step fails
+        pipeline = Pipeline(chunksize=2).add('vbp', 200., 10.)
+        with self.assertRaises(ValueError):
+            pipeline.run(dat, stream=True)
+
+    def test_pretrig_blocks(self):
+        dat = _dummy()
+        dat2 = copy.deepcopy(dat)
+        pipeline = Pipeline(chunksize=23).add('crop', 0, 'top', 'pretrig').add('rgain', 0.1)
+        self.assertEqual([kind for kind, steps in pipeline.plan(dat)], ['full', 'fused'])
+        pipeline.run(dat)
+        dat2.crop(0, 'top', 'pretrig')
+        dat2.rangegain(0.1)
+        self.assertTrue(np.allclose(dat.data, dat2.data, equal_nan=True))
+        self.assertTrue(np.all(dat.trig == dat2.trig))
+
+    def test_memory(self):
+        dat = _dummy()
+        pipeline = Pipeline(chunksize=10).add('vbp', 10., 200.).add('rgain', 0.1).add('agc', per_trace=True)
+        fused, unfused = pipeline.memory_estimate(dat)
+        self.assertTrue(fused < unfused)
+
+    def test_from_process_args(self):
+        pipeline = Pipeline.from_process_args(vbp=(1., 10.), rev=True, crop=('100', 'bottom', 'snum'), restack=[3])
+        self.assertEqual([step.name for step in pipeline.steps], ['restack', 'rev', 'vbp', 'crop'])
+        self.assertFalse(Pipeline().run(_dummy()))
+
+    def test_bad_step(self):
+        with self.assertRaises(ValueError):
+            Step('dummy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ import numpy as np
 from impdar.lib.NoInitRadarData import NoInitRadarData
 from impdar.lib.RadarData import RadarData
 from impdar.lib import process
+from impdar.lib.load import load_gssi
 if sys.version_info[0] >= 3:
     from unittest.mock import MagicMock, patch
 else:
@@ -114,6 +115,46 @@ class TestProcess_and_exit(unittest.TestCase):
     def test_process_and_exitPROCESS(self):
         process.process_and_exit([os.path.join(THIS_DIR, 'input_data', 'small_data.mat')], rev=True)
 
+    def test_process_and_exitSTREAM(self):
+        process.process_and_exit([os.path.join(THIS_DIR, 'input_data', 'small_data.mat')], rev=True, crop=('15', 'bottom', 'snum'), stream=True, chunksize=3, o=os.path.join(THIS_DIR, 'small_data_proc.mat'))
+        streamed = RadarData(os.path.join(THIS_DIR, 'small_data_proc.mat'))
+        dat = RadarData(os.path.join(THIS_DIR, 'input_data', 'small_data.mat'))
+        dat.reverse()
+        dat.crop(15., 'bottom', 'snum')
+        self.assertTrue(np.allclose(streamed.data, dat.data))
+        self.assertTrue(np.allclose(streamed.travel_time, dat.travel_time))
+
+    def test_process_and_exitSTREAMGSSI(self):
+        fn_out = os.path.join(THIS_DIR, 'test_gssi_proc.mat')
+        try:
+            process.process_and_exit([os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT')], filetype='gssi',
+                                     vbp=(100., 400.), stream=True, chunksize=5, o=fn_out)
+            streamed = RadarData(fn_out)
+            dat = load_gssi.load_gssi(os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT'), memmap=True)
+            dat.data = np.asarray(dat.data, dtype=float)
+            dat.vertical_band_pass(100., 400.)
+            # Saved as the type of the input
+            self.assertTrue(np.allclose(streamed.data, dat.data, atol=1.))
+        finally:
+            if os.path.exists(fn_out):
+                os.remove(fn_out)
+
+    def test_process_and_exitSTREAMRESTACK(self):
+        fn_out = os.path.join(THIS_DIR, 'test_gssi_proc.mat')
+        try:
+            process.process_and_exit([os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT')], filetype='gssi',
+                                     restack=3, vbp=(100., 400.), stream=True, chunksize=5, o=fn_out)
+            streamed = RadarData(fn_out)
+            dat = load_gssi.load_gssi(os.path.join(THIS_DIR, 'input_data', 'test_gssi.DZT'), memmap=True)
+            dat.data = np.asarray(dat.data, dtype=float)
+            dat.restack(3)
+            dat.vertical_band_pass(100., 400.)
+            self.assertEqual(streamed.tnum, dat.tnum)
+            self.assertTrue(np.allclose(streamed.data, dat.data, atol=1.))
+        finally:
+            if os.path.exists(fn_out):
+                os.remove(fn_out)
+
     def test_process_and_exitOUTNAMING(self):
         process.process_and_exit([os.path.join(THIS_DIR, 'input_data', 'data_raw.mat'), os.path.join(THIS_DIR, 'input_data', 'small_data.mat')], cat=True)
         self.assertTrue(os.path.exists(os.path.join(THIS_DIR, 'input_data', 'data_cat.mat')))
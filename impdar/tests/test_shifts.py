@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+
+"""
+Test shifting traces vertically
+"""
+import unittest
+import numpy as np
+from impdar.lib.shifts import ragged_shift
+
+
+class TestRaggedShift(unittest.TestCase):
+
+    def test_shift(self):
+        data = np.random.random((20, 30))
+        shifts = np.arange(30) % 7 - 3
+        shifts[10:20] = 2
+        out = ragged_shift(data, shifts)
+        self.assertEqual(out.shape, data.shape)
+        for j in range(30):
+            if shifts[j] >= 0:
+                self.assertTrue(np.all(out[shifts[j]:, j] == data[:20 - shifts[j], j]))
+                self.assertTrue(np.all(np.isnan(out[:shifts[j], j])))
+            else:
+                self.assertTrue(np.all(out[:shifts[j], j] == data[-shifts[j]:, j]))
+                self.assertTrue(np.all(np.isnan(out[shifts[j]:, j])))
+
+    def test_shift_rows(self):
+        data = np.random.random((20, 3))
+        out = ragged_shift(data, [0, 5, 10], out_rows=30)
+        self.assertEqual(out.shape, (30, 3))
+        self.assertTrue(np.all(out[10:30, 2] == data[:, 2]))
+        self.assertTrue(np.all(np.isnan(out[:5, 1])))
+        self.assertTrue(np.all(np.isnan(out[25:, 1])))
+
+        out = ragged_shift(data, [0, -5, -10], out_rows=10)
+        self.assertTrue(np.all(out[:, 2] == data[10:, 2]))
+
+    def test_shift_nan_big(self):
+        data = np.random.random((20, 4))
+        out = ragged_shift(data, [np.nan, 20, -25, 0.5])
+        self.assertTrue(np.all(np.isnan(out[:, :3])))
+        self.assertTrue(np.all(out[:, 3] == data[:, 3]))
+
+    def test_shift_dtype(self):
+        data = np.random.random((20, 4))
+        self.assertEqual(ragged_shift(data, np.ones((4, )), dtype=np.float32).dtype, np.float32)
+        self.assertEqual(ragged_shift(data.astype(np.float32), np.ones((4, ))).dtype, np.float32)
+        self.assertEqual(ragged_shift(np.ones((20, 4), dtype=int), np.ones((4, ))).dtype, np.float64)
+        out = ragged_shift(np.ones((20, 4), dtype=int), np.ones((4, )), fill=0)
+        self.assertEqual(out.dtype, int)
+        self.assertTrue(np.all(out[0, :] == 0))
+
+        with self.assertRaises(ValueError):
+            ragged_shift(data, np.ones((3, )))
+
+
+if __name__ == '__main__':
+    unittest.main()
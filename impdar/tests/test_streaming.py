@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Distributed under terms of the GNU GPL3.0 license.
+
+"""
+Test processing data block by block
+"""
+import time
+import unittest
+import numpy as np
+from impdar.lib.streaming import Restacker, read_blocks
+
+
+class TestRestacker(unittest.TestCase):
+
+    def test_restack_blocks(self):
+        data = np.random.random((10, 103))
+        dist = np.arange(103.)
+        target = np.mean(data[:, :98].reshape((10, 14, 7)), axis=2)
+        target_dist = np.mean(dist[:98].reshape((14, 7)), axis=1)
+
+        # Blocks that are smaller and larger than the stack
+        for blocksize in [3, 7, 10, 103]:
+            restacker = Restacker(7)
+            stacks = []
+            dists = []
+            for start in range(0, 103, blocksize):
+                stack, oned = restacker.add(data[:, start:start + blocksize],
+                                            dist=dist[start:start + blocksize], lat=None)
+                self.assertTrue(oned['lat'] is None)
+                stacks.append(stack)
+                dists.append(oned['dist'])
+            self.assertEqual(restacker.finish(), 5)
+            self.assertTrue(np.allclose(np.hstack(stacks), target))
+            self.assertTrue(np.allclose(np.hstack(dists), target_dist))
+
+    def test_restack_dtype(self):
+        data = np.random.random((10, 20)).astype(np.float32)
+        stack, _ = Restacker(5).add(data)
+        self.assertEqual(stack.dtype, np.float64)
+        stack, _ = Restacker(5, preserve_dtype=True).add(data)
+        self.assertEqual(stack.dtype, np.float32)
+        stack, _ = Restacker(5, preserve_dtype=True).add(data.astype(np.complex64))
+        self.assertEqual(stack.dtype, np.complex64)
+
+    def test_bad_traces(self):
+        with self.assertRaises(ValueError):
+            Restacker(0)
+
+
+class TestReadBlocks(unittest.TestCase):
+
+    def test_read_blocks(self):
+        data = np.random.randint(0, 100, (10, 53)).astype(np.int16)
+        blocks = list(read_blocks(data, 7, queue_size=1))
+        self.assertEqual([tstart for tstart, block in blocks], list(range(0, 53, 7)))
+        self.assertEqual(blocks[0][1].dtype, np.float64)
+        self.assertTrue(np.all(np.hstack([block for tstart, block in blocks]) == data))
+
+        data = data.astype(np.float32)
+        self.assertEqual(next(read_blocks(data, 7))[1].dtype, np.float32)
+
+    def test_read_blocks_early_stop(self):
+        data = np.random.random((10, 100))
+        for tstart, block in read_blocks(data, 3, queue_size=1):
+            if tstart > 10:
+                break
+        self.assertTrue(np.all(block == data[:, tstart:tstart + 3]))
+
+    def test_read_blocks_consumer_raises(self):
+        # The queue is full when the consumer fails, so the producer must not wait forever
+        data = np.zeros((10, 30))
+        with self.assertRaises(RuntimeError):
+            for tstart, block in read_blocks(data, 10, queue_size=2):
+                time.sleep(0.2)
+                raise RuntimeError('Failed step')
+
+    def test_read_blocks_producer_raises(self):
+        class BadData:
+            shape = (10, 30)
+            dtype = np.dtype(np.float64)
+
+            def __getitem__(self, key):
+                raise IOError('Bad read')
+        with self.assertRaises(IOError):
+            list(read_blocks(BadData(), 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@
 """Install ImpDAR, possibly with C sources."""
 import setuptools
 import socket
+import sys
 
 try:
     import numpy as np
@@ -29,12 +30,21 @@ if __name__ == '__main__':
                        'imppick=impdar.bin.imppick:main',
                        'impplot=impdar.bin.impplot:main']
 
+    # OpenMP lets the Kirchhoff loop run on multiple threads. Apple's clang does not ship it,
+    # and the c code falls back to a serial loop without it
+    if sys.platform.startswith('linux'):
+        omp_args = ['-fopenmp']
+    else:
+        omp_args = []
+
     ext = '.pyx' if CYTHON else '.c'
     ext_modules = [Extension("impdar.lib.migrationlib.mig_cython",
                              sources=["impdar/lib/migrationlib/_mig_cython"
                                       + ext,
                                       "impdar/lib/migrationlib/mig_cython.c"],
-                             include_dirs=[np.get_include()])]
+                             include_dirs=[np.get_include()],
+                             extra_compile_args=omp_args,
+                             extra_link_args=omp_args)]
     if CYTHON:
         from Cython.Build import cythonize
         ext_modules = cythonize(ext_modules)